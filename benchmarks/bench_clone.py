@@ -0,0 +1,68 @@
+"""Compare ``GameState.clone()`` against ``copy.deepcopy`` on mid-game states.
+
+Run from the repository root::
+
+    python benchmarks/bench_clone.py --min-speedup 10
+
+Exits non-zero when the clone is not at least ``--min-speedup`` times faster.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from riftbound.core.loop import GameLoop  # noqa: E402
+from riftbound.core.state import GameState  # noqa: E402
+from riftbound.simulate import MatchSettings, build_game  # noqa: E402
+
+
+def midgame_state(seed: int, turns: int = 10) -> GameState:
+    """Play ``turns`` turns of a control-vs-aggro game and return the live state."""
+
+    gs = build_game(seed, MatchSettings(ai_a="control", ai_b="aggro"))
+    max_turns = gs.max_turns
+    gs.max_turns = turns
+    GameLoop(gs).start()
+    gs.max_turns = max_turns
+    return gs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="Copies timed per method")
+    parser.add_argument("--min-speedup", type=float, default=0.0, help="Fail below this ratio")
+    args = parser.parse_args()
+
+    states = [midgame_state(seed) for seed in range(8)]
+
+    def run_deepcopy() -> None:
+        for gs in states:
+            copy.deepcopy(gs)
+
+    def run_clone() -> None:
+        for gs in states:
+            gs.clone()
+
+    rounds = max(1, args.number // len(states))
+    deep = min(timeit.repeat(run_deepcopy, number=rounds, repeat=3))
+    fast = min(timeit.repeat(run_clone, number=rounds, repeat=3))
+    copies = rounds * len(states)
+    speedup = deep / fast
+
+    print(f"deepcopy: {deep / copies * 1e6:8.1f} us/state")
+    print(f"clone:    {fast / copies * 1e6:8.1f} us/state")
+    print(f"speedup:  {speedup:8.1f}x")
+    if speedup < args.min_speedup:
+        print(f"FAIL: expected at least {args.min_speedup:g}x", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
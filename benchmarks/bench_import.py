@@ -0,0 +1,96 @@
+"""Measure ``rbsim`` startup: CLI import time (``-X importtime``) and ``--help`` wall time.
+
+Run from the repository root::
+
+    python benchmarks/bench_import.py
+
+Each measurement runs in a fresh interpreter and the best of ``--runs`` is
+kept, since startup noise only ever adds time. The import figure is the
+cumulative time ``-X importtime`` reports for ``riftbound.cli.main``. Exits
+non-zero when it exceeds ``--max-ms`` or when any ``--forbid`` module is
+imported on the way; ``--max-ms 0`` turns the time budget off.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+TARGET = "riftbound.cli.main"
+HEAVY = "sqlalchemy,pydantic,rich,numpy"
+# Generous against noisy CI machines; the import measures ~50 ms on a laptop.
+MAX_IMPORT_MS = 150.0
+
+
+def import_profile() -> Tuple[float, Dict[str, float]]:
+    """Cumulative import ms of the CLI and of every top-level package it pulled in."""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages: Dict[str, float] = {}
+    total = 0.0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            ms = int(cumulative) / 1000.0
+        except ValueError:  # the header line
+            continue
+        name = name.strip()
+        if name == TARGET:
+            total = ms
+        if TARGET == name or TARGET.startswith(name + "."):
+            continue  # the CLI itself and its parent packages
+        top = name.split(".")[0]
+        packages[top] = max(packages.get(top, 0.0), ms)
+    return total, packages
+
+
+def wall_ms(command: List[str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, capture_output=True, check=True)
+    return (time.perf_counter() - started) * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters per measurement")
+    parser.add_argument("--top", type=int, default=8, help="Slowest packages to list")
+    parser.add_argument("--max-ms", type=float, default=MAX_IMPORT_MS, help="Fail above this import time (0: no limit)")
+    parser.add_argument("--forbid", default=HEAVY, help="Comma-separated packages the CLI must not import")
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    total, packages = min(profiles, key=lambda profile: profile[0])
+    wall = min(wall_ms([sys.executable, "-m", TARGET, "--help"]) for _ in range(args.runs))
+    baseline = min(wall_ms([sys.executable, "-c", "pass"]) for _ in range(args.runs))
+
+    print(f"import {TARGET}: {total:8.1f} ms")
+    print(f"rbsim --help:     {wall:8.1f} ms wall ({baseline:.1f} ms bare interpreter)")
+    for name, ms in sorted(packages.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {name:<24}{ms:8.1f} ms")
+
+    failures: List[str] = []
+    forbidden = sorted({name.strip() for name in args.forbid.split(",") if name.strip()} & set(packages))
+    if forbidden:
+        failures.append(f"CLI import pulled in {', '.join(forbidden)}")
+    if args.max_ms and total > args.max_ms:
+        failures.append(f"expected the CLI to import in at most {args.max_ms:g} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
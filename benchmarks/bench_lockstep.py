@@ -0,0 +1,70 @@
+"""Compare games/sec of the lockstep NumPy engine against the reference GameLoop.
+
+Run from the repository root::
+
+    python benchmarks/bench_lockstep.py --min-speedup 10
+
+Both engines play the starter deck with the same agents; the reference engine
+plays fewer games because it is far slower. A's score and the average game
+length are printed for both so a speedup that came from a rules drift shows
+up. Exits non-zero when the lockstep engine is not at least ``--min-speedup``
+times faster.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from riftbound.core.lockstep import iter_lockstep  # noqa: E402
+from riftbound.simulate import MatchSettings, iter_games  # noqa: E402
+from riftbound.stats import MatchTally  # noqa: E402
+
+
+def loop_rate(games: int, ai_a: str, ai_b: str) -> tuple[float, MatchTally]:
+    tally = MatchTally()
+    started = time.perf_counter()
+    for outcome in iter_games(games, seed=1, settings=MatchSettings(ai_a=ai_a, ai_b=ai_b)):
+        tally.add(outcome.result)
+    return games / (time.perf_counter() - started), tally
+
+
+def lockstep_rate(games: int, ai_a: str, ai_b: str, batch_size: int) -> tuple[float, MatchTally]:
+    tally = MatchTally()
+    started = time.perf_counter()
+    for batch in iter_lockstep(games, seed=1, ai_a=ai_a, ai_b=ai_b, batch_size=batch_size):
+        batch.add_to(tally)
+    return games / (time.perf_counter() - started), tally
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loop-games", type=int, default=400, help="Games timed on the reference engine")
+    parser.add_argument("--lockstep-games", type=int, default=20000, help="Games timed on the lockstep engine")
+    parser.add_argument("--batch-size", type=int, default=4096, help="Games advanced together by lockstep")
+    parser.add_argument("--aiA", default="aggro", help="Agent seated as A")
+    parser.add_argument("--aiB", default="aggro", help="Agent seated as B")
+    parser.add_argument("--min-speedup", type=float, default=0.0, help="Fail below this ratio")
+    args = parser.parse_args()
+
+    # One untimed batch so NumPy's first-call costs are not charged to the run.
+    lockstep_rate(min(args.batch_size, args.lockstep_games), args.aiA, args.aiB, args.batch_size)
+    slow, slow_tally = loop_rate(args.loop_games, args.aiA, args.aiB)
+    fast, fast_tally = lockstep_rate(args.lockstep_games, args.aiA, args.aiB, args.batch_size)
+    speedup = fast / slow
+
+    for label, rate, tally in (("loop:    ", slow, slow_tally), ("lockstep:", fast, fast_tally)):
+        print(f"{label} {rate:10.1f} games/s  (A score {tally.score_A:6.1%}, {tally.avg_turns:5.2f} turns)")
+    print(f"speedup:  {speedup:10.1f}x")
+    if speedup < args.min_speedup:
+        print(f"FAIL: expected at least {args.min_speedup:g}x", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+"""Measure the memory held by one mid-game ``GameState`` and plain game throughput.
+
+Run from the repository root::
+
+    python benchmarks/bench_memory.py --max-bytes 12000
+
+Bytes per state are traced allocations for ``GameState.clone()`` copies of
+mid-game states, so they cover the runtime objects (players, zones, runes,
+units, battlefields) and not the card objects clones share. Exits non-zero
+when a state takes more than ``--max-bytes``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_clone import midgame_state  # noqa: E402
+
+from riftbound.simulate import MatchSettings, run_game  # noqa: E402
+
+
+def bytes_per_state(copies: int) -> float:
+    states = [midgame_state(seed) for seed in range(8)]
+    rounds = max(1, copies // len(states))
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [gs.clone() for _ in range(rounds) for gs in states]
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / len(kept)
+
+
+def games_per_second(games: int) -> float:
+    settings = MatchSettings(ai_a="control", ai_b="aggro")
+    started = time.perf_counter()
+    for index in range(games):
+        run_game(index, index, settings)
+    return games / (time.perf_counter() - started)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=2000, help="States kept alive at once")
+    parser.add_argument("--games", type=int, default=200, help="Games timed for throughput")
+    parser.add_argument("--max-bytes", type=float, default=0.0, help="Fail above this size")
+    args = parser.parse_args()
+
+    size = bytes_per_state(args.copies)
+    rate = games_per_second(args.games)
+
+    print(f"state:      {size:8.0f} bytes")
+    print(f"throughput: {rate:8.1f} games/s")
+    if args.max_bytes and size > args.max_bytes:
+        print(f"FAIL: expected at most {args.max_bytes:g} bytes per state", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
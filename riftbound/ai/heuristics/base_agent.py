@@ -1,22 +1,56 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from riftbound.core.cards import Card, GearCard, SpellCard, UnitCard
 from riftbound.core.player import Player
 
+if TYPE_CHECKING:
+    from riftbound.core.loop import GameLoop
+
 # Legacy action signature kept for backward-compat:
 # ("SPELL"|"UNIT"|"MOVE"|"PASS", hand_index_or_None, lane_or_src, [lane_or_dst for MOVE])
 # For UNIT/SPELL: (TYPE, hand_idx, target_lane)
 # For MOVE: ("MOVE", None, src_lane, dst_lane)
 Action = Tuple[str, Optional[int], Optional[int], Optional[int]]
 
+_CARD_KINDS = {"UNIT": UnitCard, "SPELL": SpellCard, "GEAR": GearCard}
+
 class Agent(ABC):
     name: str = "Agent"
+    # Search agents play out whole games per decision; tournaments skip them by default.
+    search: bool = False
 
     def __init__(self, player: Player):
         self.player = player
         # GameLoop will inject: self.player.battlefields = list[Battlefield]
+        # and self.loop, for agents that need the full game state.
+        self.loop: Optional["GameLoop"] = None
 
     @abstractmethod
     def decide_action(self, opponent: Player) -> Action:
         """Return a chosen action."""
         ...
+
+    def playable(self, kind: str) -> List[Tuple[int, Card]]:
+        """Affordable ``kind`` ("UNIT"/"SPELL"/"GEAR") cards as ``(hand index, card)``.
+
+        Read from the loop's cached legal actions when this agent is attached to
+        a loop, otherwise by scanning the hand.
+        """
+
+        hand = self.player.hand
+        loop = self.loop
+        if loop is not None and loop.gs.players[self.player.side] is self.player:
+            seen = set()
+            cards = []
+            for action in loop.legal_actions(self.player):
+                if action[0] == kind and action[1] not in seen:
+                    seen.add(action[1])
+                    cards.append((action[1], hand[action[1]]))
+            return cards
+        cls = _CARD_KINDS[kind]
+        return [
+            (i, c)
+            for i, c in enumerate(hand)
+            if isinstance(c, cls) and self.player.can_pay_cost(c.cost_energy, c.cost_power)
+        ]
@@ -0,0 +1,306 @@
+"""Monte Carlo Tree Search agent over determinized game states.
+
+Each simulation clones the live :class:`GameState`, re-deals what the agent
+cannot see (the opponent's hand and deck order, its own deck order, both rune
+decks), then walks a UCT tree of both players' decisions and finishes the game
+with the heuristic agents as the default policy. Tree edges are keyed by
+``(kind, card name, lane, destination)`` rather than hand indices, so the same
+edge means the same play in every determinization.
+
+With ``workers > 1`` independent trees are grown in a shared process pool
+(root parallelisation) and their root visit counts are summed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import math
+import multiprocessing
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from riftbound.ai.heuristics.base_agent import Action, Agent
+from riftbound.core.loop import GameLoop
+from riftbound.core.player import Player
+from riftbound.core.state import GameState
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from multiprocessing.pool import Pool
+
+# (kind, card name, lane or move source, move destination)
+ActionKey = Tuple[str, Optional[str], Optional[int], Optional[int]]
+
+PASS: ActionKey = ("PASS", None, None, None)
+
+
+def candidate_actions(loop: GameLoop) -> List[Tuple[ActionKey, Action]]:
+    """Distinct plays for the active player as ``(key, engine action)`` pairs.
+
+    Built from :meth:`GameLoop.legal_actions`; copies of the same card in hand
+    collapse into one key.
+    """
+
+    gs = loop.gs
+    player = gs.get_player(gs.active)
+    found: Dict[ActionKey, Action] = {}
+    for action in loop.legal_actions(player):
+        kind = action[0]
+        if kind == "PASS":
+            key = PASS
+        elif kind == "MOVE":
+            key = (kind, None, action[2], action[3])
+        else:
+            key = (kind, player.hand[action[1]].name, action[2], None)
+        found.setdefault(key, action)
+    return list(found.items())
+
+
+def determinize(gs: GameState, side: str, rng: random.Random) -> None:
+    """Re-deal the information ``side`` cannot see, in place."""
+
+    me = gs.get_player(side)
+    opponent = gs.get_player(gs.other(side))
+    rng.shuffle(me.deck.cards)
+    hidden = opponent.hand + opponent.deck.cards
+    rng.shuffle(hidden)
+    size = len(opponent.hand)
+    opponent.hand[:] = hidden[:size]
+    opponent.deck.cards[:] = hidden[size:]
+    for player in (me, opponent):
+        rng.shuffle(player.rune_deck.runes)
+
+
+@dataclass(slots=True)
+class _Node:
+    visits: int = 0
+    # Reward summed from the point of view of the player who chose this edge.
+    value: float = 0.0
+    children: Dict[ActionKey, "_Node"] = field(default_factory=dict)
+
+    def select(self, keys: Sequence[ActionKey], exploration: float) -> ActionKey:
+        log_n = math.log(max(1, self.visits))
+        best_key = keys[0]
+        best = -1.0
+        for key in keys:
+            child = self.children[key]
+            score = child.value / child.visits + exploration * math.sqrt(log_n / child.visits)
+            if score > best:
+                best, best_key = score, key
+        return best_key
+
+
+def _reward(winner: str, side: str) -> float:
+    if winner == side:
+        return 1.0
+    if winner == "DRAW":
+        return 0.5
+    return 0.0
+
+
+def _playout(gs: GameState, root: _Node, rng: random.Random, exploration: float) -> None:
+    loop = GameLoop(gs)
+    node: Optional[_Node] = root
+    path: List[Tuple[_Node, str]] = []
+
+    while True:
+        mover = gs.active
+        player = gs.get_player(mover)
+        if node is not None:
+            options = dict(candidate_actions(loop))
+            untried = [key for key in options if key not in node.children]
+            if untried:
+                key = rng.choice(untried)
+                child = node.children[key] = _Node()
+                next_node = None  # leave the tree after one expansion
+            else:
+                key = node.select(list(options), exploration)
+                child = node.children[key]
+                next_node = child
+            path.append((child, mover))
+            action = options[key]
+            node = next_node
+        else:
+            action = player.agent.decide_action(gs.get_player(gs.other(mover)))
+
+        loop._apply_action(player, action)
+        result = loop.end_turn()
+        if result is None:
+            if gs.turn > gs.max_turns:
+                result = loop.result_at_turn_limit()
+            else:
+                result = loop.begin_turn()
+        if result is not None:
+            break
+
+    root.visits += 1
+    for child, mover in path:
+        child.visits += 1
+        child.value += _reward(result.winner, mover)
+
+
+def run_search(
+    state: GameState,
+    side: str,
+    *,
+    simulations: Optional[int],
+    time_ms: Optional[float],
+    exploration: float = 1.4,
+    seed: int = 0,
+) -> Tuple[Dict[ActionKey, Tuple[int, float]], int]:
+    """Grow one tree from ``state``; return root ``{key: (visits, value)}`` and playouts."""
+
+    rng = random.Random(seed)
+    root = _Node()
+    deadline = None if time_ms is None else time.perf_counter() + time_ms / 1000.0
+    playouts = 0
+    while simulations is None or playouts < simulations:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        gs = state.clone()
+        determinize(gs, side, rng)
+        _playout(gs, root, rng, exploration)
+        playouts += 1
+    return {key: (c.visits, c.value) for key, c in root.children.items()}, playouts
+
+
+def _run_search_task(task) -> Tuple[Dict[ActionKey, Tuple[int, float]], int]:
+    state, side, simulations, time_ms, exploration, seed = task
+    return run_search(
+        state, side, simulations=simulations, time_ms=time_ms, exploration=exploration, seed=seed
+    )
+
+
+_POOLS: Dict[int, "Pool"] = {}
+
+
+def _shared_pool(workers: int) -> "Pool":
+    pool = _POOLS.get(workers)
+    if pool is None:
+        pool = _POOLS[workers] = multiprocessing.Pool(processes=workers)
+    return pool
+
+
+@atexit.register
+def _close_pools() -> None:
+    for pool in _POOLS.values():
+        pool.terminate()
+    _POOLS.clear()
+
+
+@dataclass
+class DecisionStats:
+    """What one call to :meth:`MCTSAgent.decide_action` cost and chose."""
+
+    turn: int
+    playouts: int
+    elapsed_ms: float
+    action: ActionKey
+    visits: int
+
+    @property
+    def playouts_per_sec(self) -> float:
+        return self.playouts / (self.elapsed_ms / 1000.0) if self.elapsed_ms > 0 else 0.0
+
+
+class MCTSAgent(Agent):
+    """Determinized UCT search with heuristic rollouts.
+
+    The budget is ``simulations`` playouts and/or ``time_ms`` milliseconds per
+    decision, whichever runs out first. ``rollout`` names the heuristic from
+    ``AI_REGISTRY`` that plays this agent's side during playouts; the
+    opponent keeps its own agent unless that is a search agent too.
+    """
+
+    name = "MCTS"
+    search = True
+
+    def __init__(
+        self,
+        player: Player,
+        *,
+        simulations: Optional[int] = 200,
+        time_ms: Optional[float] = None,
+        workers: int = 1,
+        exploration: float = 1.4,
+        rollout: str = "aggro",
+        seed: Optional[int] = None,
+    ):
+        super().__init__(player)
+        if simulations is None and time_ms is None:
+            raise ValueError("MCTSAgent needs a simulation or time budget")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.simulations = simulations
+        self.time_ms = time_ms
+        self.workers = workers
+        self.exploration = exploration
+        self.rollout = rollout
+        self.rng = random.Random(seed)
+        self.stats: List[DecisionStats] = []
+
+    def _rollout_agent(self, player: Player) -> Agent:
+        from riftbound.simulate import resolve_agent
+
+        return resolve_agent(self.rollout)(player)
+
+    def _search_state(self, gs: GameState) -> GameState:
+        """A clone of ``gs`` whose agents are plain, picklable rollout policies."""
+
+        state = gs.clone()
+        for player in (state.A, state.B):
+            agent = player.agent
+            if player.side == self.player.side or agent is None or getattr(agent, "search", False):
+                player.agent = self._rollout_agent(player)
+        return state
+
+    def decide_action(self, opponent: Player) -> Action:
+        if self.loop is None:
+            # Not driven by a GameLoop (e.g. called directly): act like the rollout policy.
+            return self._rollout_agent(self.player).decide_action(opponent)
+
+        gs = self.loop.gs
+        side = gs.active
+        options = dict(candidate_actions(self.loop))
+        started = time.perf_counter()
+        if len(options) == 1:
+            (key,) = options
+            self.stats.append(DecisionStats(gs.turn, 0, 0.0, key, 0))
+            return options[key]
+
+        state = self._search_state(gs)
+        seeds = [self.rng.randrange(1 << 30) for _ in range(self.workers)]
+        if self.workers == 1:
+            results = [
+                run_search(
+                    state,
+                    side,
+                    simulations=self.simulations,
+                    time_ms=self.time_ms,
+                    exploration=self.exploration,
+                    seed=seeds[0],
+                )
+            ]
+        else:
+            share = None
+            if self.simulations is not None:
+                share = max(1, math.ceil(self.simulations / self.workers))
+            tasks = [(state, side, share, self.time_ms, self.exploration, s) for s in seeds]
+            results = _shared_pool(self.workers).map(_run_search_task, tasks)
+
+        visits: Dict[ActionKey, int] = {}
+        playouts = 0
+        for root, count in results:
+            playouts += count
+            for key, (n, _) in root.items():
+                visits[key] = visits.get(key, 0) + n
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        legal = [key for key in visits if key in options]
+        best = max(legal, key=lambda k: visits[k]) if legal else PASS
+        self.stats.append(DecisionStats(gs.turn, playouts, elapsed_ms, best, visits.get(best, 0)))
+        return options[best]
+
+
+__all__ = ["DecisionStats", "MCTSAgent", "candidate_actions", "determinize", "run_search"]
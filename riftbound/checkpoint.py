@@ -0,0 +1,82 @@
+"""Checkpoint files that let long ``simulate`` runs resume after a crash."""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from riftbound.stats import MatchTally
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class Checkpoint:
+    """Progress of a run: everything needed to continue it with identical seeds.
+
+    ``run`` holds the parameters that define the run (seed, agents, index range
+    ...) and is compared on resume. ``last_game_id`` is the highest ``games.id``
+    committed to the database alongside this checkpoint, if any.
+    """
+
+    run: Dict[str, Any]
+    next_index: int
+    tally: MatchTally = field(default_factory=MatchTally)
+    last_game_id: Optional[int] = None
+    stop_reason: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "run": dict(self.run),
+            "next_index": self.next_index,
+            "tally": asdict(self.tally),
+            "last_game_id": self.last_game_id,
+            "stop_reason": self.stop_reason,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Checkpoint":
+        version = data.get("version")
+        if version != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version!r}")
+        return cls(
+            run=dict(data["run"]),
+            next_index=int(data["next_index"]),
+            tally=MatchTally(**data["tally"]),
+            last_game_id=data.get("last_game_id"),
+            stop_reason=data.get("stop_reason"),
+        )
+
+    def mismatches(self, run: Dict[str, Any]) -> Dict[str, tuple]:
+        """Run parameters that differ from ``run`` as ``{key: (saved, requested)}``."""
+
+        keys = set(self.run) | set(run)
+        return {
+            key: (self.run.get(key), run.get(key))
+            for key in sorted(keys)
+            if self.run.get(key) != run.get(key)
+        }
+
+
+def save_checkpoint(path: str, checkpoint: Checkpoint) -> None:
+    """Atomically replace ``path`` with ``checkpoint``."""
+
+    target = Path(path)
+    tmp = target.with_name(target.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as handle:
+        json.dump(checkpoint.to_dict(), handle)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, target)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    with open(path, "r", encoding="utf-8") as handle:
+        return Checkpoint.from_dict(json.load(handle))
+
+
+__all__ = ["CHECKPOINT_VERSION", "Checkpoint", "load_checkpoint", "save_checkpoint"]
@@ -1,27 +1,29 @@
+"""``rbsim`` command line.
+
+Startup is kept cheap: only :mod:`typer` is imported here, and each command
+imports the engine, database (SQLAlchemy) and search modules it actually
+uses, so ``rbsim --help`` or a plain ``simulate`` never loads SQLAlchemy.
+``benchmarks/bench_import.py`` enforces the budget.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
 import typer
-from rich import print
-import random
-from typing import List, Optional
 
-from riftbound.core.models import GameConfig
-from riftbound.core.cards import Card
-from riftbound.core.enums import Domain
-from riftbound.core.player import Player, Deck, RuneDeck, Rune
-from riftbound.core.state import GameState
-from riftbound.core.loop import GameLoop
-from riftbound.core.cards_registry import CARD_REGISTRY
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from riftbound.core.player import Player
+    from riftbound.simulate import GameOutcome, MatchSettings
+    from riftbound.stats import MatchTally, StoppingRule
 
-# DB logging
-from riftbound.data.analytics import summarize_session
-from riftbound.data.session import make_session
-from riftbound.data.writer import GameRecorder, record_game
 
-# Agents
-from riftbound.ai.heuristics.simple_aggro import SimpleAggro
-from riftbound.ai.heuristics.simple_control import SimpleControl
+def _heading(text: str, color: str = typer.colors.MAGENTA) -> str:
+    return typer.style(text, fg=color, bold=True)
 
 
-app = typer.Typer(help="Riftbound Simulator CLI")
+app = typer.Typer(help="Riftbound Simulator CLI", rich_markup_mode=None)
 
 @app.command()
 def analyze(
@@ -30,6 +32,9 @@ def analyze(
 ) -> None:
     """Print aggregated statistics from a simulation database."""
 
+    from riftbound.data.analytics import summarize_session
+    from riftbound.data.session import make_session
+
     session = make_session(db)
     try:
         report = summarize_session(session, top_cards=top)
@@ -39,8 +44,8 @@ def analyze(
     finally:
         session.close()
 
-    print("[bold magenta]Game Summary[/]")
-    print(
+    typer.echo(_heading("Game Summary"))
+    typer.echo(
         f"  Total Games: {report.games.total_games}\n"
         f"  Wins A/B: {report.games.wins_A}/{report.games.wins_B}\n"
         f"  Draws: {report.games.draws}\n"
@@ -49,58 +54,90 @@ def analyze(
         f"  Avg Spells Cast: {report.games.avg_spells_cast:.2f}"
     )
 
-    print("\n[bold magenta]AI Performance[/]")
+    typer.echo("\n" + _heading("AI Performance"))
     if not report.ai_stats:
-        print("  (no AI records found)")
+        typer.echo("  (no AI records found)")
     else:
         for stat in report.ai_stats:
-            print(
+            typer.echo(
                 f"  {stat.ai_name}: games={stat.games} wins={stat.wins} "
                 f"losses={stat.losses} draws={stat.draws} "
                 f"win_rate={stat.win_rate:.2%} avg_turns={stat.avg_turns:.2f}"
             )
 
-    print("\n[bold magenta]Top Cards[/]")
+    typer.echo("\n" + _heading("Top Cards"))
     if not report.top_cards:
-        print("  (no card plays recorded)")
+        typer.echo("  (no card plays recorded)")
     else:
         for usage in report.top_cards:
-            print(
+            typer.echo(
                 f"  {usage.card_name} ({usage.action}): {usage.plays} plays"
             )
 
-def make_simple_deck() -> Deck:
-    """Create a 20-card toy deck: 10 Units, 10 Spells."""
-    recruit = CARD_REGISTRY.get("Stalwart Recruit")
-    bolt = CARD_REGISTRY.get("Bolt")
-    if recruit is None or bolt is None:
-        raise RuntimeError("Core cards not found in registry")
-    cards: List[Card] = []
-    cards += [recruit.instantiate() for _ in range(10)]
-    cards += [bolt.instantiate() for _ in range(10)]
-    return Deck(cards=cards)
-
-def make_basic_rune_deck(rng: Optional[random.Random] = None) -> RuneDeck:
-    """Create a basic rune deck with Calm and Fury runes."""
-
-    runes = [Rune(domain=Domain.CALM) for _ in range(6)]
-    runes += [Rune(domain=Domain.FURY) for _ in range(6)]
-    if rng is not None:
-        rng.shuffle(runes)
-    return RuneDeck(runes=runes)
-
-AI_REGISTRY = {
-    "aggro": SimpleAggro,
-    "control": SimpleControl,
-    "ahri": SimpleControl,
-    "jynx": SimpleAggro,
-}
-
 def make_agent(name: str, player: Player):
-    key = name.strip().lower()
-    if key not in AI_REGISTRY:
-        raise typer.BadParameter(f"Unknown AI '{name}'. Available: {', '.join(AI_REGISTRY.keys())}")
-    return AI_REGISTRY[key](player)
+    from riftbound import simulate as simulate_api
+
+    try:
+        return simulate_api.make_agent(name, player)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse ``k/n`` (1-based shard ``k`` of ``n``)."""
+
+    try:
+        k_text, n_text = value.split("/", 1)
+        k, n = int(k_text), int(n_text)
+    except ValueError:
+        raise typer.BadParameter(f"Invalid shard '{value}', expected k/n (e.g. 2/8)")
+    if n < 1 or not 1 <= k <= n:
+        raise typer.BadParameter(f"Invalid shard '{value}', need 1 <= k <= n")
+    return k, n
+
+def load_deck_option(option: str, path: Optional[str]):
+    """Compile the decklist passed to ``option`` (``None`` means the starter deck)."""
+
+    if path is None:
+        return None
+    from riftbound.core.decklist import load_decklist
+
+    try:
+        return load_decklist(path)
+    except FileNotFoundError:
+        raise typer.BadParameter(f"{option}: no decklist at {path}")
+    except OSError as exc:
+        raise typer.BadParameter(f"{option}: cannot read {path!r}: {exc.strerror or exc}")
+    except ValueError as exc:
+        raise typer.BadParameter(f"{option}: {exc}")
+
+def parse_stopping_rule(
+    ci_width: Optional[float],
+    confidence: float,
+    sprt: Optional[str],
+    sprt_alpha: float,
+    sprt_beta: float,
+    check_every: int,
+) -> Optional[StoppingRule]:
+    if ci_width is None and sprt is None:
+        return None
+    from riftbound.stats import SPRT, StoppingRule, z_score
+
+    if ci_width is not None and not 0.0 < ci_width < 1.0:
+        raise typer.BadParameter("--ci-width must be between 0 and 1")
+    sprt_test = None
+    try:
+        z_score(confidence)
+        if sprt is not None:
+            p0_text, p1_text = sprt.split(",", 1)
+            sprt_test = SPRT(float(p0_text), float(p1_text), alpha=sprt_alpha, beta=sprt_beta)
+    except ValueError as exc:
+        raise typer.BadParameter(f"Invalid early-stopping options: {exc}")
+    return StoppingRule(
+        ci_width=ci_width,
+        confidence=confidence,
+        sprt=sprt_test,
+        min_games=check_every,
+    )
 
 @app.command()
 def simulate(
@@ -114,134 +151,506 @@ def simulate(
     channel_rate: int = typer.Option(1, help="Energy gained each CHANNEL phase"),
     max_energy: int = typer.Option(10, help="Energy cap per player"),
     starting_energy: int = typer.Option(0, help="Energy at the beginning of the match for each player"),
+    workers: int = typer.Option(1, help="Worker processes to spread games across (1 = run in-process)"),
+    chunk_size: Optional[int] = typer.Option(None, help="Games handed to a worker per batch (default: automatic)"),
+    shard: Optional[str] = typer.Option(None, help="Only run shard k/n of the game indices (e.g. 2/8); merge DBs with `rbsim merge`"),
+    ci_width: Optional[float] = typer.Option(None, help="Stop early once the interval on A's score is at most this wide (e.g. 0.02)"),
+    confidence: float = typer.Option(0.95, help="Confidence level used by --ci-width"),
+    sprt: Optional[str] = typer.Option(None, help="Stop early once an SPRT on A's win rate decides between p0,p1 (e.g. 0.5,0.55)"),
+    sprt_alpha: float = typer.Option(0.05, help="SPRT false-positive rate"),
+    sprt_beta: float = typer.Option(0.05, help="SPRT false-negative rate"),
+    check_every: int = typer.Option(500, help="Games between early-stopping checks"),
+    checkpoint: Optional[str] = typer.Option(None, help="Write periodic progress checkpoints to this JSON file"),
+    checkpoint_every: int = typer.Option(10000, help="Games between checkpoints (the DB is committed at each one)"),
+    resume: bool = typer.Option(False, help="Continue the run recorded in --checkpoint"),
+    engine: str = typer.Option("loop", help="Game engine: loop (reference GameLoop) or lockstep (batched NumPy, vanilla decks only)"),
+    batch_size: int = typer.Option(4096, help="Games advanced together by --engine lockstep"),
+    deck_a: Optional[str] = typer.Option(None, "--deckA", help="Decklist file for Player A (default: starter deck)"),
+    deck_b: Optional[str] = typer.Option(None, "--deckB", help="Decklist file for Player B (default: starter deck)"),
 ):
     """
     Two-battlefield Hold/Conquer scoring with simple combat and pluggable agents.
     Adds Rune Channeling/Energy & costs; COMBAT resolves after ACTION.
     """
-    config = GameConfig(games=games, seed=seed, record_draws=False)
+    if games < 1:
+        raise typer.BadParameter("--games must be at least 1")
+    if workers < 1:
+        raise typer.BadParameter("--workers must be at least 1")
+    if workers > 1 and db:
+        raise typer.BadParameter("--workers cannot be combined with --db; run shards with one worker each instead")
+    if chunk_size is not None and chunk_size < 1:
+        raise typer.BadParameter("--chunk-size must be at least 1")
+    if check_every < 1:
+        raise typer.BadParameter("--check-every must be at least 1")
+    if checkpoint_every < 1:
+        raise typer.BadParameter("--checkpoint-every must be at least 1")
+    if resume and not checkpoint:
+        raise typer.BadParameter("--resume needs --checkpoint")
+    engine = engine.strip().lower()
+    if engine not in {"loop", "lockstep"}:
+        raise typer.BadParameter(f"Unknown engine '{engine}', expected loop or lockstep")
+    if engine == "lockstep":
+        if db or checkpoint or shard or workers > 1:
+            raise typer.BadParameter("--engine lockstep cannot be combined with --db, --checkpoint, --shard or --workers")
+        if deck_a or deck_b:
+            raise typer.BadParameter("--engine lockstep only plays the starter deck; drop --deckA/--deckB")
+        if batch_size < 1:
+            raise typer.BadParameter("--batch-size must be at least 1")
+    from riftbound import simulate as simulate_api
+    from riftbound.checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+    from riftbound.simulate import MatchSettings, iter_games, shard_range
+
+    start, stop = 0, games
+    if shard:
+        start, stop = shard_range(games, *parse_shard(shard))
+    stopping = parse_stopping_rule(ci_width, confidence, sprt, sprt_alpha, sprt_beta, check_every)
+
+    settings = MatchSettings(
+        ai_a=ai_a,
+        ai_b=ai_b,
+        victory_score=victory_score,
+        starting_energy=starting_energy,
+        deck_a=load_deck_option("--deckA", deck_a),
+        deck_b=load_deck_option("--deckB", deck_b),
+    )
+    for name in (ai_a, ai_b):
+        try:
+            simulate_api.resolve_agent(name)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc))
+
+    run_params = {
+        "games": games,
+        "seed": seed,
+        "ai_a": ai_a,
+        "ai_b": ai_b,
+        "victory_score": victory_score,
+        "starting_energy": starting_energy,
+        "start": start,
+        "stop": stop,
+        "db": db,
+        # Contents, not paths: editing a decklist makes it a different run.
+        "deck_a": settings.deck_a.digest if settings.deck_a else None,
+        "deck_b": settings.deck_b.digest if settings.deck_b else None,
+        "ci_width": ci_width,
+        "confidence": confidence if ci_width is not None else None,
+        "sprt_p0": stopping.sprt.p0 if stopping and stopping.sprt else None,
+        "sprt_p1": stopping.sprt.p1 if stopping and stopping.sprt else None,
+        "sprt_alpha": stopping.sprt.alpha if stopping and stopping.sprt else None,
+        "sprt_beta": stopping.sprt.beta if stopping and stopping.sprt else None,
+        "check_every": check_every if stopping else None,
+    }
+    state = Checkpoint(run=run_params, next_index=start)
+    if resume:
+        try:
+            state = load_checkpoint(checkpoint)
+        except FileNotFoundError:
+            raise typer.BadParameter(f"No checkpoint found at {checkpoint}")
+        except (ValueError, KeyError, TypeError) as exc:
+            raise typer.BadParameter(f"Unreadable checkpoint {checkpoint}: {exc}")
+        mismatches = state.mismatches(run_params)
+        if mismatches:
+            details = ", ".join(f"{k}: {old!r} != {new!r}" for k, (old, new) in mismatches.items())
+            raise typer.BadParameter(f"Checkpoint belongs to a different run ({details})")
+
     typer.echo("=== Riftbound Simulator (Two-Battlefield + Energy + Combat Phase) ===")
     typer.echo(
-        f"Games: {config.games} | Seed: {config.seed} | AIs: A={ai_a} B={ai_b} | "
+        f"Games: {games} | Seed: {seed} | AIs: A={ai_a} B={ai_b} | "
         f"Victory Score: {victory_score} | Energy: +{channel_rate}/turn cap {max_energy}, start {starting_energy} | Per-game output: {verbose}"
     )
+    if shard:
+        typer.echo(f"Shard {shard}: games {start + 1}..{stop} of {games}")
+    if workers > 1:
+        typer.echo(f"Workers: {workers}")
+    for seat, template in (("A", settings.deck_a), ("B", settings.deck_b)):
+        if template is not None:
+            typer.echo(f"Deck {seat}: {template.name} ({len(template.cards)} cards)")
+    if engine == "lockstep":
+        typer.echo(f"Engine: lockstep, {batch_size} games per batch")
+    if stopping:
+        typer.echo(f"Early stopping: checking every {check_every} games")
     if db:
         typer.echo(f"Database logging enabled -> {db}")
+    if resume:
+        typer.echo(f"Resuming at game {state.next_index + 1} from {checkpoint}")
+        if db and os.path.exists(db):
+            from riftbound.data.merge import discard_games_after
+
+            dropped = discard_games_after(db, state.last_game_id)
+            if dropped:
+                typer.echo(f"Discarded {dropped} game(s) committed after the checkpoint")
+
+    if engine == "lockstep":
+        tally, stop_reason = _simulate_lockstep(games, seed, settings, batch_size, stopping)
+        _print_summary(tally, stopping, stop_reason, confidence, games)
+        return
+
+    session = None
+    if db:
+        from riftbound.data.merge import last_game_id
+        from riftbound.data.session import make_session
+
+        session = make_session(db)
+
+    tally = state.tally
+    stop_reason = state.stop_reason
+    resume_at = stop if stop_reason else state.next_index
+
+    outcomes = iter_games(
+        games,
+        seed=seed,
+        settings=settings,
+        start=resume_at,
+        stop=stop,
+        workers=workers,
+        chunk_size=chunk_size,
+        session=session,
+    )
+
+    def save_progress(next_index: int) -> None:
+        if session:
+            session.commit()
+        if checkpoint:
+            state.next_index = next_index
+            state.tally = tally
+            state.stop_reason = stop_reason
+            state.last_game_id = last_game_id(db) if db else None
+            save_checkpoint(checkpoint, state)
+
+    next_index = resume_at
+    for outcome in outcomes:
+        tally.add(outcome.result)
+        next_index = outcome.index + 1
 
-    session = make_session(db) if db else None
+        if verbose:
+            _print_outcome(outcome)
 
-    wins_A = 0
-    wins_B = 0
-    draws = 0
-    turns_total = 0
+        if stopping and tally.games % check_every == 0:
+            stop_reason = stopping.check(tally)
+            if stop_reason:
+                break
+        if checkpoint and (next_index - start) % checkpoint_every == 0:
+            save_progress(next_index)
+    outcomes.close()
 
-    base_rng = random.Random(config.seed)
+    save_progress(next_index)
+    if session:
+        session.close()
 
-    for i in range(config.games):
-        # independent RNG per game
-        game_seed = base_rng.randrange(1 << 30)
-        rng = random.Random(game_seed)
+    _print_summary(tally, stopping, stop_reason, confidence, stop - start)
 
-        # Decks & shuffle
-        deckA = make_simple_deck()
-        deckB = make_simple_deck()
-        deckA.shuffle(rng)
-        deckB.shuffle(rng)
 
-        # Players
-        rune_rng_a = random.Random(rng.randrange(1 << 30))
-        rune_rng_b = random.Random(rng.randrange(1 << 30))
+def _simulate_lockstep(
+    games: int,
+    seed: int,
+    settings: MatchSettings,
+    batch_size: int,
+    stopping: Optional[StoppingRule],
+) -> Tuple[MatchTally, Optional[str]]:
+    from riftbound.core.lockstep import LockstepUnsupported, iter_lockstep
+    from riftbound.stats import MatchTally
 
-        A = Player(
-            name="A",
-            hp=10,
-            deck=deckA,
-            energy=starting_energy,
-            rune_deck=make_basic_rune_deck(rune_rng_a),
-        )
-        B = Player(
-            name="B",
-            hp=10,
-            deck=deckB,
-            energy=starting_energy,
-            rune_deck=make_basic_rune_deck(rune_rng_b),
+    tally = MatchTally()
+    try:
+        batches = iter_lockstep(
+            games,
+            seed=seed,
+            ai_a=settings.ai_a,
+            ai_b=settings.ai_b,
+            victory_score=settings.victory_score,
+            starting_energy=settings.starting_energy,
+            batch_size=batch_size,
         )
+    except LockstepUnsupported as exc:
+        raise typer.BadParameter(f"--engine lockstep: {exc}")
+    except RuntimeError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1)
 
-        # Agents
-        A.agent = make_agent(ai_a, A)
-        B.agent = make_agent(ai_b, B)
+    # Stopping rules are checked once per batch rather than every N games.
+    for batch in batches:
+        batch.add_to(tally)
+        if stopping:
+            reason = stopping.check(tally)
+            if reason:
+                return tally, reason
+    return tally, None
+
+
+def _print_summary(
+    tally: MatchTally,
+    stopping: Optional[StoppingRule],
+    stop_reason: Optional[str],
+    confidence: float,
+    budget: int,
+) -> None:
+    from riftbound.stats import wilson_interval, z_score
 
-        # Game
-        gs = GameState(
-            rng=rng, A=A, B=B,
-            turn=1, max_turns=40, active="A",
-            victory_score=victory_score
+    typer.echo("")
+    typer.echo(
+        f"{_heading('Summary')}: A {tally.wins_A} | B {tally.wins_B} | "
+        f"DRAW {tally.draws} | Avg Turns {tally.avg_turns:.2f}"
+    )
+    if stopping:
+        low, high = wilson_interval(
+            tally.wins_A + 0.5 * tally.draws, tally.games, z_score(confidence)
         )
-        recorder = None
-        game_id = None
-        if session:
-            game_id = record_game(
-                session=session,
-                seed=game_seed,
-                winner="?",
-                turns=0,
-                total_units=0,
-                total_spells=0,
+        typer.echo(
+            f"A score {tally.score_A:.4f} ({confidence:.0%} CI {low:.4f}-{high:.4f}) "
+            f"over {tally.games} games"
+        )
+        if stop_reason:
+            saved = budget - tally.games
+            typer.echo(f"Stopped early: {stop_reason}; saved {saved} of {budget} games")
+        else:
+            typer.echo("No stopping criterion reached; ran the full game budget")
+
+
+def _print_outcome(outcome: GameOutcome) -> None:
+    result = outcome.result
+    typer.echo("\n" + "=" * 90)
+    typer.echo(
+        f"{_heading('Game', typer.colors.CYAN)} {outcome.index+1}: "
+        f"Winner {result.winner} in {result.turns} turns "
+        f"(seed={outcome.seed}) "
+        f"[units={result.units_played}, spells={result.spells_cast}, "
+        f"VP_A={outcome.points_A}, VP_B={outcome.points_B}]"
+    )
+
+
+    if outcome.index < 5:  # mostra solo le prime 5 partite per non spammare
+        for idx, (units_a, units_b, ctl) in enumerate(outcome.lanes):
+            typer.echo(
+                f"  Battlefield {idx}: "
+                f"A={units_a} B={units_b} ctl={ctl}"
             )
-            recorder = GameRecorder(session, game_id)
-            recorder.record_deck("A", deckA.cards, ai_name=ai_a)
-            recorder.record_deck("B", deckB.cards, ai_name=ai_b)
+    typer.echo(f"  Energy A={outcome.energy_A}, Energy B={outcome.energy_B}")
+    typer.echo(f"  Points: A={outcome.points_A} | B={outcome.points_B}")
+    typer.echo("=" * 90)
 
-        result = GameLoop(gs, recorder=recorder).start()
+@app.command()
+def tournament(
+    games: int = typer.Option(100, help="Games per ordered pairing (each pair plays both seat orders)"),
+    seed: int = typer.Option(42, help="Random seed for reproducibility"),
+    agents: Optional[str] = typer.Option(None, help="Comma-separated agents (default: one per distinct agent class)"),
+    victory_score: int = typer.Option(8, help="Victory points needed to win via Hold/Conquer"),
+    starting_energy: int = typer.Option(0, help="Energy at the beginning of the match for each player"),
+    workers: int = typer.Option(1, help="Worker processes shared by all pairings"),
+    chunk_size: Optional[int] = typer.Option(None, help="Games handed to a worker per batch (default: automatic)"),
+    confidence: float = typer.Option(0.95, help="Confidence level for the win-rate intervals"),
+) -> None:
+    """Round-robin every agent against every other in both seat orders."""
 
-        turns_total += result.turns
-        if result.winner == "A":
-            wins_A += 1
-        elif result.winner == "B":
-            wins_B += 1
-        else:
-            draws += 1
+    from riftbound.stats import z_score
+    from riftbound.tournament import run_tournament
 
-        if session and game_id is not None:
-            record_game(
-                session=session,
+    names = [name.strip() for name in agents.split(",") if name.strip()] if agents else None
+    try:
+        z_score(confidence)
+        report = run_tournament(
+            names,
+            games=games,
+            seed=seed,
+            victory_score=victory_score,
+            starting_energy=starting_energy,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+
+    width = max(len(name) for name in report.agents) + 2
+    cell = 24
+    typer.echo(f"{_heading('Win-rate matrix')} (row vs column, {confidence:.0%} CI, {2 * games} games per cell)")
+    typer.echo(" " * width + "".join(name.ljust(cell) for name in report.agents))
+    for agent in report.agents:
+        row = agent.ljust(width)
+        for opponent in report.agents:
+            if agent == opponent:
+                row += "-".ljust(cell)
+                continue
+            score, low, high = report.score(agent, opponent, confidence=confidence)
+            row += f"{score:.3f} [{low:.3f}-{high:.3f}]".ljust(cell)
+        typer.echo(row)
+
+    typer.echo("\n" + _heading("Ratings") + " (Elo scale)")
+    for name, rating in sorted(report.ratings().items(), key=lambda item: -item[1]):
+        typer.echo(f"  {name.ljust(width)}{rating:8.1f}")
+
+@app.command("optimize-deck")
+def optimize_deck(
+    deck: Optional[str] = typer.Option(None, help="Decklist to start from (default: the starter deck)"),
+    gauntlet: Optional[str] = typer.Option(
+        None,
+        help="Comma-separated opponents, each AGENT or AGENT@DECKLIST (default: every distinct heuristic agent with the starter deck)",
+    ),
+    agent: str = typer.Option("aggro", help="Agent piloting the candidate decks"),
+    generations: int = typer.Option(10, help="Generations to breed"),
+    population: int = typer.Option(12, help="Decks per generation"),
+    elite: int = typer.Option(2, help="Best decks carried over unchanged each generation"),
+    games: int = typer.Option(40, help="Games per opponent in a full evaluation (seats alternate)"),
+    screen_games: Optional[int] = typer.Option(None, help="Games per opponent before weak decks are cut (default: games/4)"),
+    swaps: int = typer.Option(2, help="Most card or rune swaps per mutation"),
+    domains: Optional[str] = typer.Option(None, help="Comma-separated domains cards and runes may use (default: those of the starting deck)"),
+    max_copies: Optional[int] = typer.Option(None, help="Most copies of one card (default: no limit)"),
+    confidence: float = typer.Option(0.95, help="Confidence a deck must be worse than the best before it is cut"),
+    victory_score: int = typer.Option(8, help="Victory points needed to win via Hold/Conquer"),
+    seed: int = typer.Option(42, help="Random seed for reproducibility"),
+    workers: int = typer.Option(1, help="Worker processes shared by every evaluation"),
+    chunk_size: Optional[int] = typer.Option(None, help="Games handed to a worker per batch (default: automatic)"),
+    output: Optional[str] = typer.Option(None, help="Write the best decklist to this file"),
+) -> None:
+    """Search deck space with a genetic algorithm, scoring decks against a gauntlet."""
+
+    from riftbound import optimize as optimize_api
+    from riftbound.simulate import starter_deck
+
+    start = load_deck_option("--deck", deck) or starter_deck()
+    try:
+        opponents = optimize_api.parse_gauntlet(gauntlet) if gauntlet else None
+        allowed = optimize_api.parse_domains(domains) if domains else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+
+    def show(summary) -> None:
+        typer.echo(
+            f"Gen {summary.generation}: best {summary.best_score:.3f} | mean {summary.mean_score:.3f} | "
+            f"new {summary.evaluated} ({summary.cut} cut) | cache hits {summary.cache_hits}"
+        )
+
+    try:
+        report = optimize_api.optimize_deck(
+            start,
+            gauntlet=opponents,
+            agent=agent,
+            generations=generations,
+            population=population,
+            elite=elite,
+            games=games,
+            screen_games=screen_games,
+            swaps=swaps,
+            domains=allowed,
+            max_copies=max_copies,
+            confidence=confidence,
+            victory_score=victory_score,
+            seed=seed,
+            workers=workers,
+            chunk_size=chunk_size,
+            progress=show,
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+
+    labels = ", ".join(o.label for o in (opponents or optimize_api.default_gauntlet()))
+    typer.echo(
+        f"\n{_heading('Best deck')} score {report.best_score:.3f} vs {labels} "
+        f"(start {report.start_score:.3f})"
+    )
+    typer.echo(report.best.decklist().rstrip())
+    typer.echo(
+        f"\n{_heading('Throughput')}: {report.evaluated} decks evaluated "
+        f"({report.cut} cut early, {report.games_saved} games saved), {report.cache_hits} cache hits, "
+        f"{report.games_played} games in {report.elapsed:.1f}s -> {report.decks_per_hour:,.0f} decks/hour"
+    )
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            fh.write(report.best.decklist())
+        typer.echo(f"Best decklist written to {output}")
+
+@app.command()
+def mcts(
+    games: int = typer.Option(10, help="Games to play"),
+    seed: int = typer.Option(42, help="Random seed for reproducibility"),
+    opponent: str = typer.Option("aggro", help="Agent the MCTS agent plays against"),
+    seat: str = typer.Option("A", help="Seat of the MCTS agent (A|B)"),
+    simulations: Optional[int] = typer.Option(None, help="Playouts per decision (default 200 unless --time-ms is given)"),
+    time_ms: Optional[float] = typer.Option(None, help="Milliseconds of search per decision"),
+    workers: int = typer.Option(1, help="Processes growing independent trees per decision (root parallel)"),
+    rollout: str = typer.Option("aggro", help="Heuristic agent used for the MCTS side in playouts"),
+    victory_score: int = typer.Option(8, help="Victory points needed to win via Hold/Conquer"),
+    verbose: bool = typer.Option(False, help="Print a line per decision"),
+) -> None:
+    """Play the MCTS agent against a heuristic and report playouts/sec per decision."""
+
+    from riftbound import simulate as simulate_api
+    from riftbound.ai.search.mcts import MCTSAgent
+    from riftbound.core.loop import GameLoop
+    from riftbound.simulate import MatchSettings
+    from riftbound.stats import MatchTally, wilson_interval
+
+    seat = seat.strip().upper()
+    if seat not in {"A", "B"}:
+        raise typer.BadParameter("--seat must be A or B")
+    if simulations is None and time_ms is None:
+        simulations = 200
+    for name in (opponent, rollout):
+        try:
+            simulate_api.resolve_agent(name)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc))
+
+    settings = MatchSettings(ai_a=opponent, ai_b=opponent, victory_score=victory_score)
+    tally = MatchTally()
+    decisions = []
+    for index, game_seed in simulate_api.game_seeds(seed, 0, games):
+        gs = simulate_api.build_game(game_seed, settings)
+        player = gs.get_player(seat)
+        try:
+            agent = MCTSAgent(
+                player,
+                simulations=simulations,
+                time_ms=time_ms,
+                workers=workers,
+                rollout=rollout,
                 seed=game_seed,
-                winner=result.winner,
-                turns=result.turns,
-                total_units=result.units_played,
-                total_spells=result.spells_cast,
-                game_id=game_id,
             )
-
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc))
+        player.agent = agent
+        result = GameLoop(gs).start()
+        tally.add(result)
+        searched = [d for d in agent.stats if d.playouts]
+        decisions += searched
         if verbose:
-            print("\n" + "=" * 90)
-            print(
-                f"[bold cyan]Game[/] {i+1}: "
-                f"Winner {result.winner} in {result.turns} turns "
-                f"(seed={game_seed}) "
-                f"[units={result.units_played}, spells={result.spells_cast}, "
-                f"VP_A={gs.points_A}, VP_B={gs.points_B}]"
-            )
-
+            for d in searched:
+                typer.echo(
+                    f"  game {index + 1} turn {d.turn}: {d.playouts} playouts in "
+                    f"{d.elapsed_ms:.1f} ms ({d.playouts_per_sec:,.0f}/s) -> {d.action[0]} {d.action[1] or ''}"
+                )
+        typer.echo(f"Game {index + 1}: winner {result.winner} in {result.turns} turns")
+
+    wins = tally.wins_A if seat == "A" else tally.wins_B
+    low, high = wilson_interval(wins + 0.5 * tally.draws, tally.games)
+    typer.echo(
+        f"\n{_heading(f'MCTS ({seat})')} vs {opponent}: W {wins} | "
+        f"L {tally.games - wins - tally.draws} | D {tally.draws} "
+        f"(score {(wins + 0.5 * tally.draws) / tally.games:.3f}, 95% CI {low:.3f}-{high:.3f})"
+    )
+    if decisions:
+        rates = sorted(d.playouts_per_sec for d in decisions)
+        playouts = sum(d.playouts for d in decisions)
+        elapsed = sum(d.elapsed_ms for d in decisions) / 1000.0
+        typer.echo(
+            f"Decisions searched: {len(decisions)} | playouts {playouts} | "
+            f"playouts/sec overall {playouts / elapsed:,.0f}, per decision "
+            f"min {rates[0]:,.0f} median {rates[len(rates) // 2]:,.0f} max {rates[-1]:,.0f}"
+        )
 
-            if i < 5:  # mostra solo le prime 5 partite per non spammare
-                for idx, bf in enumerate(gs.battlefields):
-                    typer.echo(
-                        f"  Battlefield {idx}: "
-                        f"A={len(bf.units_A)} B={len(bf.units_B)} ctl={bf.controller()}"
-                    )
-            typer.echo(f"  Energy A={gs.A.energy}, Energy B={gs.B.energy}")
-            typer.echo(f"  Points: A={gs.points_A} | B={gs.points_B}")
-            typer.echo("=" * 90)
+@app.command()
+def merge(
+    output: str = typer.Argument(..., help="SQLite database to create or append to."),
+    shards: List[str] = typer.Argument(..., help="Shard databases to merge, in order."),
+) -> None:
+    """Merge shard databases produced by `simulate --shard k/n --db ...`."""
 
-    if session:
-        session.commit()
-        session.close()
+    from riftbound.data.merge import merge_databases
 
-    total = config.games
-    avg_turns = turns_total / total if total else 0.0
-    typer.echo("")
-    print(f"[bold magenta]Summary[/]: A {wins_A} | B {wins_B} | DRAW {draws} | Avg Turns {avg_turns:.2f}")
+    try:
+        copied = merge_databases(output, shards)
+    except FileNotFoundError as exc:
+        typer.secho(str(exc), err=True, fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+    typer.echo(f"Merged {copied} games from {len(shards)} shard(s) into {output}")
 
 def main():
     app()
@@ -1,148 +1,404 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import InitVar, dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from .combat import CombatStats, UnitInPlay, deal_direct_damage, resolve_might_combat
+import copy
 
-@dataclass
+from .combat import CombatStats, UnitInPlay, assign_damage, remove_units
+from .enums import SIDE_NAMES, Keyword, side_index
+from .journal import new_stamp
+
+if TYPE_CHECKING:
+    from .journal import UndoJournal
+    from .zobrist import ZobristHasher
+
+_STATUS_FIELDS = ("contested_this_turn", "showdown_pending")
+_TURN_FIELDS = ("contested_this_turn", "showdown_pending", "last_side")
+_GUARD = Keyword.GUARD.value
+
+# ``occupancy`` has bit ``1 << side`` set while that side has units on the lane.
+_CONTESTED = 3
+_HOLDER = (None, 0, 1, None)
+_HOLDER_NAME = (None, SIDE_NAMES[0], SIDE_NAMES[1], None)
+
+@dataclass(slots=True)
 class Battlefield:
 
-    """Battlefield model with Might-based combat and contest tracking."""
+    """Battlefield model with Might-based combat and contest tracking.
+
+    Sides are indexed 0 (A) and 1 (B): ``units[side]`` is what ``units_A`` /
+    ``units_B`` read and write, and per-side flags and tallies are 2-element
+    lists. Public
+    methods accept a side index or name; the ``*_A``/``*_B`` attributes and
+    ``controller()`` keep the string API.
 
-    units_A: List[UnitInPlay] = field(default_factory=list)
-    units_B: List[UnitInPlay] = field(default_factory=list)
+    ``might[side]`` (total Might) and ``guards[side]`` (GUARD units in lane
+    order) are kept up to date by the mutators, so units must enter, leave
+    and change through them rather than by editing the lists directly.
+    They also keep ``occupancy`` (which sides have units), updated only when a
+    side empties or gains its first unit, so ``control_side()``,
+    ``controller()`` and ``contested`` are plain lookups.
+    """
+
+    # Starting units per side; ``None`` starts the side empty.
+    units_A: InitVar[Optional[List[UnitInPlay]]] = None
+    units_B: InitVar[Optional[List[UnitInPlay]]] = None
+    units: List[List[UnitInPlay]] = field(init=False)
 
     contested_this_turn: bool = False
-    scored_this_turn_A: bool = False
-    scored_this_turn_B: bool = False
+    scored: List[bool] = field(default_factory=lambda: [False, False])
 
-    last_controller: Optional[str] = None
+    # Side that controlled the lane at the start of the turn.
+    last_side: Optional[int] = None
     showdown_pending: bool = False
 
-    kills_A: int = 0
-    kills_B: int = 0
-    deaths_A: int = 0
-    deaths_B: int = 0
+    kills: List[int] = field(default_factory=lambda: [0, 0])
+    deaths: List[int] = field(default_factory=lambda: [0, 0])
+
+    might: List[int] = field(init=False, repr=False, compare=False)
+    guards: Tuple[List[UnitInPlay], List[UnitInPlay]] = field(init=False, repr=False, compare=False)
+    occupancy: int = field(init=False, repr=False, compare=False)
+
+    # Set by GameLoop.enable_journal(); mutators log how to undo themselves.
+    journal: Optional["UndoJournal"] = field(default=None, repr=False, compare=False)
+    # Set by GameLoop.enable_hashing(); mutators report changes to the hasher.
+    zobrist: Optional["ZobristHasher"] = field(default=None, repr=False, compare=False)
+    # Fresh whenever units arrive, leave or change; keys GameLoop.legal_actions().
+    stamp: int = field(default_factory=new_stamp, repr=False, compare=False)
+
+    def __post_init__(
+        self,
+        units_A: Optional[List[UnitInPlay]],
+        units_B: Optional[List[UnitInPlay]],
+    ) -> None:
+        self.units = [[] if units_A is None else units_A, [] if units_B is None else units_B]
+        self.might = [0, 0]
+        self.guards = ([], [])
+        self._recount(0)
+        self._recount(1)
+        self.occupancy = (1 if self.units[0] else 0) | (2 if self.units[1] else 0)
+
+    def _recount(self, side: int) -> None:
+        """Recompute ``might`` and ``guards`` for ``side`` from its units."""
+
+        units = self.units[side]
+        if self.journal is not None:
+            self.journal.record_item(self.might, side)
+            self.journal.record_list(self.guards[side])
+        self.might[side] = sum(unit.might for unit in units)
+        self.guards[side][:] = [u for u in units if u.card.keyword_mask & _GUARD]
+
+    def _gain(self, side: int, unit: UnitInPlay) -> None:
+        journal = self.journal
+        if journal is not None:
+            journal.record_item(self.might, side)
+        self.might[side] += unit.might
+        if unit.card.keyword_mask & _GUARD:
+            if journal is not None:
+                journal.record_append(self.guards[side])
+            self.guards[side].append(unit)
+        if len(self.units[side]) == 1:
+            self._set_occupancy(self.occupancy | (1 << side))
+
+    def _lose(self, side: int, units: List[UnitInPlay]) -> None:
+        """Take ``units`` (already identified as present) off ``side``."""
+
+        journal = self.journal
+        if journal is not None:
+            journal.record_item(self.might, side)
+        self.might[side] -= sum(unit.might for unit in units)
+        gone = [u for u in units if u.card.keyword_mask & _GUARD]
+        if gone:
+            remove_units(self.guards[side], gone, journal)
+        remove_units(self.units[side], units, journal)
+        if not self.units[side]:
+            self._set_occupancy(self.occupancy & ~(1 << side))
+
+    def _set_occupancy(self, value: int) -> None:
+        if self.journal is not None:
+            self.journal.record_attr(self, "occupancy")
+        self.occupancy = value
+
+    # ---- string-named views -------------------------------------------------
+
+    @property
+    def scored_this_turn_A(self) -> bool:
+        return self.scored[0]
+
+    @scored_this_turn_A.setter
+    def scored_this_turn_A(self, value: bool) -> None:
+        self.scored[0] = value
+
+    @property
+    def scored_this_turn_B(self) -> bool:
+        return self.scored[1]
+
+    @scored_this_turn_B.setter
+    def scored_this_turn_B(self, value: bool) -> None:
+        self.scored[1] = value
+
+    @property
+    def last_controller(self) -> Optional[str]:
+        return None if self.last_side is None else SIDE_NAMES[self.last_side]
+
+    @last_controller.setter
+    def last_controller(self, value: Optional[str]) -> None:
+        self.last_side = None if value is None else side_index(value)
+
+    @property
+    def kills_A(self) -> int:
+        return self.kills[0]
+
+    @property
+    def kills_B(self) -> int:
+        return self.kills[1]
+
+    @property
+    def deaths_A(self) -> int:
+        return self.deaths[0]
+
+    @property
+    def deaths_B(self) -> int:
+        return self.deaths[1]
+
+    def _touch(self) -> None:
+        if self.journal is not None:
+            self.journal.record_attr(self, "stamp")
+        self.stamp = new_stamp()
+
+    def _units_changed(self, side: Optional[int] = None) -> None:
+        """Report changed units of ``side`` (both sides if ``None``) and flags."""
+
+        self._touch()
+        if self.zobrist is not None:
+            self.zobrist.lane_changed(self, side)
+            self.zobrist.flags_changed(self)
+
+    def _update_status(self) -> None:
+        """Bring the contest flags in line with ``occupancy`` after units changed.
+
+        A lane held by both sides is contested for the rest of the turn and
+        has a showdown pending; otherwise no showdown is pending. Flags are
+        only written (and journaled) when they actually change.
+        """
+
+        if self.occupancy == _CONTESTED:
+            if self.contested_this_turn and self.showdown_pending:
+                return
+            if self.journal is not None:
+                self.journal.record_attrs(self, _STATUS_FIELDS)
+            self.contested_this_turn = True
+            self.showdown_pending = True
+        elif self.showdown_pending:
+            if self.journal is not None:
+                self.journal.record_attr(self, "showdown_pending")
+            self.showdown_pending = False
+
+    def _replace_units(self, side: int, units: List[UnitInPlay]) -> None:
+        """Make ``units`` (taken as is, not copied) the whole of ``side``'s lane."""
 
-    def _units_for(self, who: str) -> List[UnitInPlay]:
-        return self.units_A if who == "A" else self.units_B
+        if self.journal is not None:
+            self.journal.record_item(self.units, side)
+        self.units[side] = units
+        self._recount(side)
+        held = self.occupancy | (1 << side) if units else self.occupancy & ~(1 << side)
+        if held != self.occupancy:
+            self._set_occupancy(held)
+        self._update_status()
+        self._units_changed(side)
 
-    def count(self, who: str) -> int:
-        return len(self._units_for(who))
+    def _units_for(self, who: int | str) -> List[UnitInPlay]:
+        return self.units[side_index(who)]
+
+    def count(self, who: int | str) -> int:
+        return len(self.units[side_index(who)])
+
+    @property
+    def contested(self) -> bool:
+        """Whether both sides currently have units here."""
+
+        return self.occupancy == _CONTESTED
+
+    def control_side(self) -> Optional[int]:
+        """Index of the side holding the lane alone, or ``None``."""
+
+        return _HOLDER[self.occupancy]
 
     def controller(self) -> Optional[str]:
-        if self.units_A and not self.units_B:
-            return "A"
-        if self.units_B and not self.units_A:
-            return "B"
-        return None
+        return _HOLDER_NAME[self.occupancy]
+
+    def clone(self) -> "Battlefield":
+        return Battlefield(
+            units_A=[unit.clone() for unit in self.units[0]],
+            units_B=[unit.clone() for unit in self.units[1]],
+            contested_this_turn=self.contested_this_turn,
+            scored=list(self.scored),
+            last_side=self.last_side,
+            showdown_pending=self.showdown_pending,
+            kills=list(self.kills),
+            deaths=list(self.deaths),
+        )
+
+    def start_turn(self, who: int | str) -> None:
+        """Open ``who``'s turn on this lane in one step.
+
+        Clears the per-turn flags, remembers the current holder for Conquer,
+        re-flags the lane as contested if both sides are present and readies
+        ``who``'s units.
+        """
 
-    def begin_turn_reset(self) -> None:
-        
-        self.contested_this_turn = False
-        self.scored_this_turn_A = False
-        self.scored_this_turn_B = False
-        self.showdown_pending = False
+        if self.journal is not None:
+            self.journal.record_attrs(self, _TURN_FIELDS)
+            self.journal.record_list(self.scored)
+        contested = self.occupancy == _CONTESTED
+        self.contested_this_turn = contested
+        self.showdown_pending = contested
+        self.scored[0] = self.scored[1] = False
+        self.last_side = _HOLDER[self.occupancy]
+        # Reports the flag changes to the hasher along with the readied units.
+        self.ready_side(who)
 
-    def ready_side(self, who: str) -> None:
-        for unit in self._units_for(who):
+    def ready_side(self, who: int | str) -> None:
+        side = side_index(who)
+        journal = self.journal
+        for unit in self.units[side]:
+            if journal is not None and not unit.ready:
+                journal.record_attr(unit, "ready")
             unit.ready = True
+        self._units_changed(side)
 
-    def mark_contested_if_needed(self) -> None:
-        if self.units_A and self.units_B:
-            self.contested_this_turn = True
-            if self.controller() is None:
-                self.showdown_pending = True
-    
-    def add_unit(self, who: str, unit: UnitInPlay) -> None:
-        unit_list = self._units_for(who)
+    def add_unit(self, who: int | str, unit: UnitInPlay) -> None:
+        side = side_index(who)
+        unit_list = self.units[side]
+        if self.journal is not None:
+            self.journal.record_append(unit_list)
         unit_list.append(unit)
-        if self.units_A and self.units_B:
-            self.contested_this_turn = True
-            if self.controller() is None:
-                self.showdown_pending = True
-        else:
-            self.showdown_pending = False
+        self._gain(side, unit)
+        self._update_status()
+        self._touch()
+        if self.zobrist is not None:
+            self.zobrist.unit_added(self, side, unit)
+            self.zobrist.flags_changed(self)
 
-    def remove_unit(self, who: str, unit: UnitInPlay) -> None:
-        unit_list = self._units_for(who)
-        if unit in unit_list:
-            unit_list.remove(unit)
-        if self.units_A and self.units_B:
-            self.contested_this_turn = True
-            if self.controller() is None:
-                self.showdown_pending = True
-        else:
-            self.showdown_pending = False
+    def remove_unit(self, who: int | str, unit: UnitInPlay) -> None:
+        side = side_index(who)
+        if any(u is unit for u in self.units[side]):
+            self._lose(side, [unit])
+        self._update_status()
+        self._units_changed(side)
 
-    def pop_unit_for_movement(self, who: str) -> Optional[UnitInPlay]:
-        unit_list = self._units_for(who)
+    def pop_unit_for_movement(self, who: int | str) -> Optional[UnitInPlay]:
+        side = side_index(who)
+        unit_list = self.units[side]
         for unit in unit_list:
             if unit.ready:
-                unit_list.remove(unit)
-                if self.units_A and self.units_B:
-                    self.contested_this_turn = True
-                    if self.controller() is None:
-                        self.showdown_pending = True
-                else:
-                    self.showdown_pending = False
+                self._lose(side, [unit])
+                self._update_status()
+                self._units_changed(side)
                 return unit
         return None
 
+    def _take_damage(self, side: int, damage: int) -> Tuple[int, int]:
+        """Damage ``side`` guard-first, remove the dead; return (kills, assigned)."""
+
+        killed, assigned, survivor = assign_damage(
+            self.guards[side], self.units[side], damage, self.journal
+        )
+        if killed:
+            self._lose(side, killed)
+        if survivor is not None:
+            survivor.reset_damage()
+        return len(killed), assigned
+
     def resolve_combat_might(self) -> CombatStats:
-        stats = resolve_might_combat(self.units_A, self.units_B)
-        self.kills_A += stats.kills_A
-        self.kills_B += stats.kills_B
-        self.deaths_A += stats.deaths_A
-        self.deaths_B += stats.deaths_B
-        if self.units_A and self.units_B:
-            self.contested_this_turn = True
-            if self.controller() is None:
-                self.showdown_pending = True
-        else:
-            self.showdown_pending = False
+        journal = self.journal
+        if journal is not None:
+            journal.record_list(self.kills)
+            journal.record_list(self.deaths)
+        # Both sides strike at once with the Might they had before combat.
+        to_a, to_b = self.might[1], self.might[0]
+        kills_a, assigned_a = self._take_damage(0, to_a)
+        kills_b, assigned_b = self._take_damage(1, to_b)
+        stats = CombatStats(
+            kills_A=kills_a,
+            kills_B=kills_b,
+            deaths_A=kills_a,
+            deaths_B=kills_b,
+            damage_to_A=assigned_a,
+            damage_to_B=assigned_b,
+        )
+        self.kills[0] += kills_a
+        self.kills[1] += kills_b
+        self.deaths[0] += kills_a
+        self.deaths[1] += kills_b
+        self._update_status()
+        self._units_changed()
         return stats
 
-    def can_score_hold(self, active: str) -> bool:
-        ctl = self.controller()
-        if ctl != active:
-            return False
-        if active == "A" and self.scored_this_turn_A:
-            return False
-        if active == "B" and self.scored_this_turn_B:
-            return False
-        return True
+    def can_score_hold(self, active: int | str) -> bool:
+        side = side_index(active)
+        return self.control_side() == side and not self.scored[side]
 
-    def mark_scored(self, who: str) -> None:
-        if who == "A":
-            self.scored_this_turn_A = True
-        else:
-            self.scored_this_turn_B = True
+    def mark_scored(self, who: int | str) -> None:
+        side = side_index(who)
+        if self.journal is not None:
+            self.journal.record_item(self.scored, side)
+        self.scored[side] = True
+        if self.zobrist is not None:
+            self.zobrist.flags_changed(self)
 
-    def can_score_conquer(self, active: str) -> bool:
-        ctl_now = self.controller()
-        if ctl_now != active:
-            return False
-        if self.last_controller == ctl_now:
-            return False
-        if not self.contested_this_turn:
+    def can_score_conquer(self, active: int | str) -> bool:
+        side = side_index(active)
+        ctl_now = self.control_side()
+        if ctl_now != side:
             return False
-        if active == "A" and self.scored_this_turn_A:
+        if self.last_side == ctl_now:
             return False
-        if active == "B" and self.scored_this_turn_B:
-            return False
-        return True
-    
-    def apply_spell_damage(self, target: str, damage: int) -> int:
+        return self.contested_this_turn and not self.scored[side]
+
+    def apply_spell_damage(self, target: int | str, damage: int) -> int:
         """Deal direct damage to the target side; returns kills."""
 
-        units = self._units_for(target)
-        kills = deal_direct_damage(units, damage)
-        if self.units_A and self.units_B:
-            self.contested_this_turn = True
-            if self.controller() is None:
-                self.showdown_pending = True
-        else:
-            self.showdown_pending = False
+        side = side_index(target)
+        kills, _ = self._take_damage(side, damage) if damage > 0 else (0, 0)
+        self._update_status()
+        self._units_changed(side)
         return kills
+
+    def grant_might(self, who: int | str, amount: int, *, single: bool = False) -> None:
+        """Add ``amount`` Might to every unit of ``who`` (or only the first)."""
+
+        side = side_index(who)
+        units = self.units[side]
+        if not units:
+            return
+        journal = self.journal
+        if journal is not None:
+            journal.record_item(self.might, side)
+        for unit in units[:1] if single else units:
+            if journal is not None:
+                journal.record_attr(unit, "card")
+            # Cards may be shared between cloned states, so buff a private copy.
+            card = copy.copy(unit.card)
+            before = unit.might
+            card.might = int(card.might or 0) + amount
+            unit.card = card
+            self.might[side] += unit.might - before
+        self._units_changed(side)
+
+
+# Attached after the class body because ``units_A``/``units_B`` are InitVar
+# constructor parameters there.
+def _units_view(side: int) -> property:
+    def get(self: Battlefield) -> List[UnitInPlay]:
+        return self.units[side]
+
+    def set(self: Battlefield, units: List[UnitInPlay]) -> None:
+        self._replace_units(side, units)
+
+    return property(get, set, doc=f"Units of side {SIDE_NAMES[side]}, in lane order.")
+
+
+Battlefield.units_A = _units_view(0)
+Battlefield.units_B = _units_view(1)
@@ -0,0 +1,161 @@
+"""Inverted indexes over a card pool for fast multi-criteria queries.
+
+:class:`CardIndex` numbers the specs it is given and keeps, for every domain,
+category, energy cost, keyword and effect name, a bitset (a Python ``int``)
+of the cards that have it. A query ANDs one bitset per criterion, so its cost
+follows the number of criteria and matches rather than the size of the pool.
+The registry builds one lazily as ``CARD_REGISTRY.index``.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .cards_registry import CardSpec, _parse_card_type, _parse_domain
+from .enums import CardType, Domain, Keyword
+
+DomainArg = Union[Domain, str]
+CategoryArg = Union[CardType, str]
+KeywordArg = Union[Keyword, str]
+
+
+def _many(value) -> list:
+    if value is None:
+        return []
+    if isinstance(value, (str, Domain, CardType, Keyword)):
+        return [value]
+    return list(value)
+
+
+def _bitset(positions: List[int], size: int) -> int:
+    """An int with the given bit positions set, built in one pass over ``size`` bits."""
+
+    bits = bytearray((size + 7) // 8)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+class CardIndex:
+    """Card specs indexed by domain, category, cost, keyword and effect.
+
+    Within one criterion a collection means *any of* for ``domain`` and
+    ``category`` and *all of* for ``keywords`` and ``effects``; different
+    criteria are combined with AND. Results keep the order the specs were
+    given in.
+    """
+
+    def __init__(self, specs: Iterable[CardSpec]):
+        self.specs: List[CardSpec] = list(specs)
+        self._all = (1 << len(self.specs)) - 1
+        domains: Dict[Optional[Domain], List[int]] = {}
+        categories: Dict[CardType, List[int]] = {}
+        costs: Dict[int, List[int]] = {}
+        keywords: Dict[int, List[int]] = {}
+        effects: Dict[str, List[int]] = {}
+        for position, spec in enumerate(self.specs):
+            domains.setdefault(spec.domain, []).append(position)
+            categories.setdefault(spec.category, []).append(position)
+            costs.setdefault(spec.cost_energy, []).append(position)
+            flags = int(spec.keyword_flags)
+            while flags:
+                low = flags & -flags
+                keywords.setdefault(low, []).append(position)
+                flags ^= low
+            for effect in spec.effects:
+                effects.setdefault(effect.effect, []).append(position)
+        size = len(self.specs)
+        self._domain = {key: _bitset(p, size) for key, p in domains.items()}
+        self._category = {key: _bitset(p, size) for key, p in categories.items()}
+        self._cost = {key: _bitset(p, size) for key, p in costs.items()}
+        self._keyword = {key: _bitset(p, size) for key, p in keywords.items()}
+        self._effect = {key: _bitset(p, size) for key, p in effects.items()}
+        # Cards costing at most ``cost``, for range queries: one OR per distinct cost.
+        self._costs = sorted(self._cost)
+        self._cost_at_most: Dict[int, int] = {}
+        running = 0
+        for cost in self._costs:
+            running |= self._cost[cost]
+            self._cost_at_most[cost] = running
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    # ---- bitset helpers -------------------------------------------------------
+
+    def _at_most(self, cost: int) -> int:
+        position = bisect_right(self._costs, cost)
+        return self._cost_at_most[self._costs[position - 1]] if position else 0
+
+    def _mask(
+        self,
+        *,
+        domain: Union[DomainArg, Iterable[DomainArg], None] = None,
+        category: Union[CategoryArg, Iterable[CategoryArg], None] = None,
+        cost: Optional[int] = None,
+        min_cost: Optional[int] = None,
+        max_cost: Optional[int] = None,
+        keywords: Union[KeywordArg, Iterable[KeywordArg], None] = None,
+        effects: Union[str, Iterable[str], None] = None,
+    ) -> int:
+        mask = self._all
+        domains = _many(domain)
+        if domains:
+            wanted = 0
+            for value in domains:
+                key = _parse_domain(value) if isinstance(value, str) else value
+                wanted |= self._domain.get(key, 0)
+            mask &= wanted
+        categories = _many(category)
+        if categories:
+            wanted = 0
+            for value in categories:
+                key = _parse_card_type(value) if isinstance(value, str) else value
+                wanted |= self._category.get(key, 0)
+            mask &= wanted
+        if cost is not None:
+            mask &= self._cost.get(cost, 0)
+        if max_cost is not None:
+            mask &= self._at_most(max_cost)
+        if min_cost is not None:
+            mask &= ~self._at_most(min_cost - 1)
+        for value in _many(keywords):
+            flag = value if isinstance(value, Keyword) else Keyword.__members__.get(value.upper())
+            if flag is None:
+                raise ValueError(f"Unknown keyword '{value}'")
+            mask &= self._keyword.get(flag.value, 0)
+        for name in _many(effects):
+            mask &= self._effect.get(name, 0)
+        return mask
+
+    def _specs(self, mask: int) -> Iterator[CardSpec]:
+        specs = self.specs
+        # Lowest bit first; str.find skips runs of zeros in C.
+        bits = format(mask, "b")[::-1]
+        position = bits.find("1")
+        while position >= 0:
+            yield specs[position]
+            position = bits.find("1", position + 1)
+
+    # ---- queries --------------------------------------------------------------
+
+    def query(self, **criteria) -> List[CardSpec]:
+        """Specs matching every given criterion (see the class docstring).
+
+        Accepted criteria: ``domain``, ``category``, ``cost``, ``min_cost``,
+        ``max_cost`` (energy, inclusive), ``keywords`` and ``effects``.
+        """
+
+        return list(self._specs(self._mask(**criteria)))
+
+    def count(self, **criteria) -> int:
+        """Number of specs :meth:`query` would return, without building them."""
+
+        return self._mask(**criteria).bit_count()
+
+    def names(self, **criteria) -> List[str]:
+        return [spec.name for spec in self._specs(self._mask(**criteria))]
+
+
+__all__ = ["CardIndex"]
@@ -1,28 +1,92 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional
-from uuid import uuid4
+import itertools
+import os
 
-from .enums import CardType, Domain
+from .effects import CompiledEffect, compile_effect, compile_effects
+from .enums import CardType, Domain, Keyword, keyword_mask
+
+_CARD_IDS = itertools.count(1)
+# Random high half of every ``Card.uuid`` minted by this process, so ids from
+# worker processes and separate shards do not collide once merged.
+_UUID_PREFIX = 0
+
+
+def _new_uuid_prefix() -> None:
+    global _UUID_PREFIX
+    _UUID_PREFIX = int.from_bytes(os.urandom(8), "big")
+
+
+_new_uuid_prefix()
+# Forked pool workers inherit the parent's prefix and counter; re-draw the prefix.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_new_uuid_prefix)
+
+
+def next_card_id() -> int:
+    """Process-wide integer id for a new card instance."""
+
+    return next(_CARD_IDS)
 
 
 @dataclass
 class Card:
-    """Base Riftbound card model used by the simulator."""
+    """Base Riftbound card model used by the simulator.
+
+    ``tags``, ``keywords`` and ``effects`` are tuples so every copy of a card
+    can share them: :meth:`spawn` makes a new instance that only differs from
+    its prototype in ``uid``. ``keywords`` is compiled into ``keyword_mask``
+    (:class:`Keyword` bits) on construction, and ``effects`` into
+    ``handlers`` on first use (registry prototypes do it at load).
+    """
     name: str
     category: CardType
     cost_energy: int = 0
     cost_power: Optional[Domain] = None
     domain: Optional[Domain] = None
-    tags: list[str] = field(default_factory=list)
-    keywords: list[str] = field(default_factory=list)
+    tags: tuple[str, ...] = ()
+    keywords: tuple[str, ...] = ()
     might: Optional[int] = None
-    effects: list[dict[str, object]] = field(default_factory=list)
-    uuid: str = field(default_factory=lambda: str(uuid4()), compare=False)
+    effects: tuple[dict[str, object], ...] = ()
+    uid: int = field(default_factory=next_card_id, compare=False)
+    keyword_mask: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.keyword_mask = keyword_mask(self.keywords)
 
-    def has_keyword(self, keyword: str) -> bool:
-        return keyword.upper() in {k.upper() for k in self.keywords}   
+    @property
+    def uuid(self) -> str:
+        """Globally unique id in UUID form, as stored by :mod:`riftbound.data.writer`.
+
+        ``uid`` is only unique within one process; this prefixes it with 64
+        random bits drawn per process.
+        """
+
+        digits = f"{_UUID_PREFIX:016x}{self.uid:016x}"
+        return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+    def spawn(self) -> "Card":
+        """New instance sharing this card's definition, with a fresh ``uid``."""
+
+        card = object.__new__(type(self))
+        card.__dict__.update(self.__dict__)
+        card.uid = next(_CARD_IDS)
+        return card
+
+    @cached_property
+    def handlers(self) -> tuple[CompiledEffect, ...]:
+        """``effects`` as bound callables taking an ``EffectContext``."""
+
+        return compile_effects(self.effects)
+
+    def has_keyword(self, keyword: "Keyword | str") -> bool:
+        if isinstance(keyword, Keyword):
+            return bool(self.keyword_mask & keyword.value)
+        member = Keyword.__members__.get(keyword.upper())
+        return member is not None and bool(self.keyword_mask & member.value)
 
 @dataclass
 class UnitCard(Card):
@@ -46,10 +110,10 @@ class UnitCard(Card):
             cost_energy=cost_energy,
             cost_power=cost_power,
             domain=domain,
-            tags=list(tags or []),
-            keywords=list(keywords or []),
+            tags=tuple(tags or ()),
+            keywords=tuple(keywords or ()),
             might=might,
-            effects=list(effects or []),
+            effects=tuple(effects or ()),
         )
 
 @dataclass
@@ -76,12 +140,20 @@ class SpellCard(Card):
             cost_energy=cost_energy,
             cost_power=cost_power,
             domain=domain,
-            tags=list(tags or []),
-            keywords=list(keywords or []),
-            effects=list(effects or []),
+            tags=tuple(tags or ()),
+            keywords=tuple(keywords or ()),
+            effects=tuple(effects or ()),
         )
         self.damage = damage
 
+    @cached_property
+    def handlers(self) -> tuple[CompiledEffect, ...]:
+        """Spells without listed effects deal ``damage`` to the opponent."""
+
+        if self.effects:
+            return compile_effects(self.effects)
+        return (compile_effect({"effect": "deal_damage", "amount": self.damage}),)
+
 
 @dataclass
 class GearCard(Card):
@@ -102,9 +174,9 @@ class GearCard(Card):
             cost_energy=cost_energy,
             cost_power=cost_power,
             domain=domain,
-            tags=list(tags or []),
-            keywords=list(keywords or []),
-            effects=list(effects or []),
+            tags=tuple(tags or ()),
+            keywords=tuple(keywords or ()),
+            effects=tuple(effects or ()),
         )
 
 
@@ -125,9 +197,9 @@ class RuneCard(Card):
             cost_energy=0,
             cost_power=None,
             domain=domain,
-            tags=list(tags or []),
-            keywords=list(keywords or []),
-            effects=list(effects or []),
+            tags=tuple(tags or ()),
+            keywords=tuple(keywords or ()),
+            effects=tuple(effects or ()),
         )
 
 
@@ -151,10 +223,10 @@ class LegendCard(Card):
             cost_energy=cost_energy,
             cost_power=cost_power,
             domain=domain,
-            tags=list(tags or []),
-            keywords=list(keywords or []),
+            tags=tuple(tags or ()),
+            keywords=tuple(keywords or ()),
             might=might,
-            effects=list(effects or []),
+            effects=tuple(effects or ()),
         )
 
 
@@ -171,7 +243,7 @@ class BattlefieldCard(Card):
         super().__init__(
             name=name,
             category=CardType.BATTLEFIELD,
-            tags=list(tags or []),
-            keywords=list(keywords or []),
-            effects=list(effects or []),
+            tags=tuple(tags or ()),
+            keywords=tuple(keywords or ()),
+            effects=tuple(effects or ()),
         )
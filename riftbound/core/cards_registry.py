@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional
+import hashlib
 import json
+import os
+import pickle
+import re
 
 from .cards import (
     Card,
@@ -14,7 +19,11 @@ from .cards import (
     SpellCard,
     UnitCard,
 )
-from .enums import CardType, Domain
+from .effects import CompiledEffect, compile_effects
+from .enums import CardType, Domain, Keyword, keyword_mask
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .card_index import CardIndex
 
 
 def _parse_domain(value: Optional[str]) -> Optional[Domain]:
@@ -69,7 +78,9 @@ class CardSpec:
     keywords: tuple[str, ...] = ()
     tags: tuple[str, ...] = ()
     effects: tuple[EffectSpec, ...] = ()
-    raw: Dict[str, Any] = field(default_factory=dict)
+    keyword_flags: Keyword = Keyword(0)
+    # ``effects`` compiled and validated by from_dict; shared by every instance.
+    handlers: tuple[CompiledEffect, ...] = field(default=(), repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> "CardSpec":
@@ -83,9 +94,17 @@ class CardSpec:
         might = data.get("might")
         damage = data.get("damage")
         keywords = tuple(str(k) for k in data.get("keywords", []))
+        try:
+            keyword_flags = Keyword(keyword_mask(keywords))
+        except ValueError as exc:
+            raise ValueError(f"Card '{name}': {exc}") from None
         tags = tuple(str(t) for t in data.get("tags", []))
         effects_data = data.get("effects", [])
         effects = tuple(EffectSpec.from_dict(e) for e in effects_data)
+        try:
+            handlers = compile_effects(effect.to_dict() for effect in effects)
+        except ValueError as exc:
+            raise ValueError(f"Card '{name}': {exc}") from None
         return cls(
             name=name,
             category=category,
@@ -97,10 +116,25 @@ class CardSpec:
             keywords=keywords,
             tags=tags,
             effects=effects,
-            raw=dict(data),
+            keyword_flags=keyword_flags,
+            handlers=handlers,
         )
 
+    @cached_property
+    def prototype(self) -> Card:
+        """The card built from this spec once; :meth:`instantiate` copies it."""
+
+        card = self._build()
+        # Compile before any copy is spawned so every instance shares the handlers.
+        card.handlers = self.handlers or card.handlers
+        return card
+
     def instantiate(self) -> Card:
+        """A new card instance sharing the spec's prototype data."""
+
+        return self.prototype.spawn()
+
+    def _build(self) -> Card:
         effects = [effect.to_dict() for effect in self.effects]
         if self.category is CardType.UNIT:
             might = self.might if self.might is not None else 0
@@ -110,8 +144,8 @@ class CardSpec:
                 cost_power=self.cost_power,
                 domain=self.domain,
                 might=might,
-                tags=list(self.tags),
-                keywords=list(self.keywords),
+                tags=self.tags,
+                keywords=self.keywords,
                 effects=effects,
             )
         if self.category is CardType.SPELL:
@@ -122,8 +156,8 @@ class CardSpec:
                 cost_power=self.cost_power,
                 domain=self.domain,
                 damage=damage,
-                tags=list(self.tags),
-                keywords=list(self.keywords),
+                tags=self.tags,
+                keywords=self.keywords,
                 effects=effects,
             )
         if self.category is CardType.GEAR:
@@ -132,8 +166,8 @@ class CardSpec:
                 cost_energy=self.cost_energy,
                 cost_power=self.cost_power,
                 domain=self.domain,
-                tags=list(self.tags),
-                keywords=list(self.keywords),
+                tags=self.tags,
+                keywords=self.keywords,
                 effects=effects,
             )
         if self.category is CardType.RUNE:
@@ -142,8 +176,8 @@ class CardSpec:
             return RuneCard(
                 name=self.name,
                 domain=self.domain,
-                tags=list(self.tags),
-                keywords=list(self.keywords),
+                tags=self.tags,
+                keywords=self.keywords,
                 effects=effects,
             )
         if self.category is CardType.LEGEND:
@@ -152,43 +186,208 @@ class CardSpec:
                 cost_energy=self.cost_energy,
                 cost_power=self.cost_power,
                 domain=self.domain,
-                tags=list(self.tags),
-                keywords=list(self.keywords),
+                tags=self.tags,
+                keywords=self.keywords,
                 might=self.might,
                 effects=effects,
             )
         if self.category is CardType.BATTLEFIELD:
             return BattlefieldCard(
                 name=self.name,
-                tags=list(self.tags),
-                keywords=list(self.keywords),
+                tags=self.tags,
+                keywords=self.keywords,
                 effects=effects,
             )
         raise ValueError(f"Unsupported card category for '{self.name}'")
 
 
-def load_cards_json(base_path: Optional[Path] = None) -> dict[str, CardSpec]:
-    """Load every card specification from the data directory."""
+CARDS_ROOT = Path(__file__).resolve().parent.parent / "data" / "cards"
 
-    if base_path is None:
-        base_path = Path(__file__).resolve().parent.parent / "data" / "cards"
-    registry: dict[str, CardSpec] = {}
-    if not base_path.exists():
-        return registry
+# Bump when CardSpec or the compiled effect format changes shape.
+_CACHE_VERSION = 1
+# Modules whose code shapes the cached objects; their bytes are part of the key.
+_CACHE_SOURCES = ("cards_registry.py", "cards.py", "effects.py", "enums.py")
+
+
+def default_cache_dir() -> Path:
+    """``$RBSIM_CARD_CACHE``, else ``rbsim/cards`` under the user cache directory.
+
+    Cache files are unpickled on load, so this must be a directory only
+    trusted users can write to.
+    """
 
-    for json_path in sorted(base_path.rglob("*.json")):
+    override = os.environ.get("RBSIM_CARD_CACHE")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "rbsim" / "cards"
+
+
+def _prune_stale(cache_dir: Path, name: str, keep: Path) -> None:
+    # Exact ``<name>-<key>.pickle`` match, so set "core" spares "core-extra".
+    stale = re.compile(re.escape(name) + r"-[0-9a-f]{32}\.pickle")
+    for path in cache_dir.glob(f"{name}-*.pickle"):
+        if path != keep and stale.fullmatch(path.name):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _set_files(entry: Path) -> List[Path]:
+    return sorted(entry.rglob("*.json")) if entry.is_dir() else [entry]
+
+
+def _parse_files(paths: Iterable[Path]) -> dict[str, CardSpec]:
+    specs: dict[str, CardSpec] = {}
+    for json_path in paths:
         with json_path.open("r", encoding="utf-8") as handle:
             payload = json.load(handle)
         if not isinstance(payload, list):
             raise ValueError(f"Card file '{json_path}' must contain a list of card specs")
         for entry in payload:
             spec = CardSpec.from_dict(entry)
-            registry[spec.name] = spec
-    return registry
+            specs[spec.name] = spec
+    return specs
+
+
+def load_cards_json(base_path: Optional[Path] = None) -> dict[str, CardSpec]:
+    """Parse every card specification under ``base_path`` now, bypassing any cache."""
+
+    if base_path is None:
+        base_path = CARDS_ROOT
+    if not base_path.exists():
+        return {}
+    return _parse_files(sorted(base_path.rglob("*.json")))
+
+
+class CardRegistry(Mapping[str, CardSpec]):
+    """Card specifications by name, loaded on first use.
+
+    Each directory (or loose ``.json`` file) directly under ``root`` is a
+    card set. :meth:`card_set` loads a single set; any name lookup loads them
+    all, with later sets overriding earlier ones. A parsed set is pickled to
+    ``cache_dir`` under a key hashed from its files' bytes and the code that
+    builds specs, so later processes skip JSON parsing and validation until
+    either changes. ``cache_dir`` defaults to :func:`default_cache_dir`;
+    ``cache=False`` disables caching. An unwritable or corrupt cache is
+    ignored. Writing a set's new key deletes its older pickles. The cache is
+    unpickled, so ``cache_dir`` must be trusted.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        *,
+        cache_dir: Optional[Path] = None,
+        cache: bool = True,
+    ):
+        self.root = CARDS_ROOT if root is None else Path(root)
+        self._cache_dir = cache_dir
+        self.cache = cache
+        self._sets: dict[str, dict[str, CardSpec]] = {}
+        self._merged: Optional[dict[str, CardSpec]] = None
+        self._index: Optional["CardIndex"] = None
+
+    @property
+    def cache_dir(self) -> Optional[Path]:
+        if not self.cache:
+            return None
+        return default_cache_dir() if self._cache_dir is None else Path(self._cache_dir)
+
+    def _entries(self) -> dict[str, Path]:
+        if not self.root.exists():
+            return {}
+        return {
+            entry.stem if entry.is_file() else entry.name: entry
+            for entry in sorted(self.root.iterdir())
+            if entry.is_dir() or entry.suffix == ".json"
+        }
+
+    def set_names(self) -> List[str]:
+        """Names of the available card sets (nothing is loaded)."""
+
+        return list(self._entries())
+
+    def card_set(self, name: str) -> Mapping[str, CardSpec]:
+        """The cards of one set, loading (only) that set if needed."""
+
+        specs = self._sets.get(name)
+        if specs is None:
+            entry = self._entries().get(name)
+            if entry is None:
+                raise KeyError(f"Unknown card set '{name}'")
+            specs = self._sets[name] = self._load_set(name, _set_files(entry))
+        return specs
+
+    def _load_set(self, name: str, files: List[Path]) -> dict[str, CardSpec]:
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return _parse_files(files)
+        digest = hashlib.sha256(str(_CACHE_VERSION).encode())
+        here = Path(__file__).resolve().parent
+        for path in [here / source for source in _CACHE_SOURCES] + files:
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        cache_path = cache_dir / f"{name}-{digest.hexdigest()[:32]}.pickle"
+        try:
+            with cache_path.open("rb") as handle:
+                return pickle.load(handle)
+        except Exception:  # missing, corrupt or from an incompatible build: rebuild
+            pass
+        specs = _parse_files(files)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            partial_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with partial_path.open("wb") as handle:
+                pickle.dump(specs, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial_path, cache_path)
+            _prune_stale(cache_dir, name, cache_path)
+        except OSError:
+            pass
+        return specs
+
+    def _all(self) -> dict[str, CardSpec]:
+        merged = self._merged
+        if merged is None:
+            merged = {}
+            for name in self._entries():
+                merged.update(self.card_set(name))
+            self._merged = merged
+        return merged
+
+    @property
+    def index(self) -> "CardIndex":
+        """A :class:`~riftbound.core.card_index.CardIndex` over every card, built once."""
+
+        if self._index is None:
+            from .card_index import CardIndex
+
+            self._index = CardIndex(self._all().values())
+        return self._index
+
+    def clear(self) -> None:
+        """Forget every loaded set; the next lookup reloads (from cache)."""
+
+        self._sets.clear()
+        self._merged = None
+        self._index = None
+
+    def __getitem__(self, name: str) -> CardSpec:
+        return self._all()[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._all()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._all())
+
+    def __len__(self) -> int:
+        return len(self._all())
 
 
-CARD_REGISTRY: dict[str, CardSpec] = load_cards_json()
+CARD_REGISTRY = CardRegistry()
 
 
 def iter_cards() -> Iterable[CardSpec]:
-    return CARD_REGISTRY.values()
\ No newline at end of file
+    return CARD_REGISTRY.values()
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Iterable, List
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
 from .cards import UnitCard
+from .enums import Keyword
 
+if TYPE_CHECKING:
+    from .journal import UndoJournal
 
-@dataclass
+_GUARD = Keyword.GUARD.value
+
+
+@dataclass(slots=True)
 class UnitInPlay:
     """Runtime representation of a unit on the battlefield or at base."""
 
@@ -17,15 +23,20 @@ class UnitInPlay:
     def reset_damage(self) -> None:
         self.damage = 0
 
+    def clone(self) -> "UnitInPlay":
+        """Copy the runtime counters; the card itself is shared."""
+
+        return UnitInPlay(self.card, self.damage, self.ready)
+
     @property
     def might(self) -> int:
         return int(self.card.might or 0)
 
-    def has_keyword(self, keyword: str) -> bool:
+    def has_keyword(self, keyword: "Keyword | str") -> bool:
         return self.card.has_keyword(keyword)
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatStats:
     """Summary of a single combat step for logging or analytics."""
 
@@ -41,69 +52,102 @@ def _total_might(units: Iterable[UnitInPlay]) -> int:
     return sum(unit.might for unit in units)
 
 
-def _ordered_targets(units: List[UnitInPlay]) -> List[UnitInPlay]:
-    guards = [u for u in units if u.has_keyword("GUARD")]
-    others = [u for u in units if not u.has_keyword("GUARD")]
-    # Guards defend first; otherwise maintain insertion order
-    return guards + others
+def _guards(units: Iterable[UnitInPlay]) -> List[UnitInPlay]:
+    return [u for u in units if u.card.keyword_mask & _GUARD]
 
 
-def _apply_damage(units: List[UnitInPlay], damage: int) -> tuple[int, int]:
-    """Apply damage to the provided units; return (kills, damage_assigned)."""
+def assign_damage(
+    guards: List[UnitInPlay],
+    units: List[UnitInPlay],
+    damage: int,
+    journal: Optional["UndoJournal"] = None,
+) -> Tuple[List[UnitInPlay], int, Optional[UnitInPlay]]:
+    """Deal ``damage`` to a lane side, guards first, then the rest in order.
 
+    ``guards`` must be the GUARD units of ``units`` in the same order. Only
+    units that take damage are visited, so the cost follows the damage dealt
+    rather than the size of the lane. Returns ``(killed, assigned,
+    survivor)``, where ``survivor`` is the one unit that may have taken
+    damage without dying (every earlier target absorbed its full might).
+    Nothing is removed from ``units``.
+    """
+
+    killed: List[UnitInPlay] = []
     assigned = 0
-    kills = 0
-    for unit in _ordered_targets(units):
-        if damage <= 0:
-            break
-        remaining = max(0, unit.might - unit.damage)
-        if remaining <= 0:
-            continue
-        to_assign = min(remaining, damage)
-        unit.damage += to_assign
-        damage -= to_assign
-        assigned += to_assign
-        if unit.damage >= unit.might and unit.might > 0:
-            kills += 1
-    return kills, assigned
+    last: Optional[UnitInPlay] = None
+    for group, skip_guards in ((guards, False), (units, True)):
+        for unit in group:
+            if damage <= 0:
+                break
+            if skip_guards and unit.card.keyword_mask & _GUARD:
+                continue
+            might = unit.might
+            remaining = might - unit.damage
+            if remaining <= 0:
+                continue
+            dealt = remaining if remaining < damage else damage
+            if journal is not None:
+                journal.record_attr(unit, "damage")
+            unit.damage += dealt
+            damage -= dealt
+            assigned += dealt
+            last = unit
+            if unit.damage >= might:
+                killed.append(unit)
+    survivor = last if last is not None and last.damage < last.might else None
+    return killed, assigned, survivor
+
+
+def remove_units(
+    units: List[UnitInPlay],
+    doomed: List[UnitInPlay],
+    journal: Optional["UndoJournal"] = None,
+) -> None:
+    """Remove ``doomed`` (by identity) from ``units``, scanning only as far as needed."""
+
+    pending = {id(unit) for unit in doomed}
+    idx = 0
+    while pending:
+        if id(units[idx]) in pending:
+            pending.discard(id(units[idx]))
+            if journal is not None:
+                journal.record_pop(units, idx)
+            del units[idx]
+        else:
+            idx += 1
 
 
 def resolve_might_combat(units_a: List[UnitInPlay], units_b: List[UnitInPlay]) -> CombatStats:
     """Resolve simultaneous combat between two unit groups."""
 
-    stats = CombatStats()
-
     damage_to_a = _total_might(units_b)
     damage_to_b = _total_might(units_a)
 
-    kills_a, assigned_a = _apply_damage(units_a, damage_to_a)
-    kills_b, assigned_b = _apply_damage(units_b, damage_to_b)
-
-    stats.kills_A = kills_a
-    stats.kills_B = kills_b
-    stats.deaths_A = kills_a
-    stats.deaths_B = kills_b
-    stats.damage_to_A = assigned_a
-    stats.damage_to_B = assigned_b
-
-    # Remove defeated units
-    units_a[:] = [u for u in units_a if u.damage < u.might or u.might == 0]
-    units_b[:] = [u for u in units_b if u.damage < u.might or u.might == 0]
+    killed_a, assigned_a, survivor_a = assign_damage(_guards(units_a), units_a, damage_to_a)
+    killed_b, assigned_b, survivor_b = assign_damage(_guards(units_b), units_b, damage_to_b)
 
-    # Survivors clear damage after combat concludes
-    for unit in units_a:
-        unit.reset_damage()
-    for unit in units_b:
-        unit.reset_damage()
+    # Remove defeated units; survivors clear damage after combat concludes
+    remove_units(units_a, killed_a)
+    remove_units(units_b, killed_b)
+    for unit in (survivor_a, survivor_b):
+        if unit is not None:
+            unit.reset_damage()
 
-    return stats
+    return CombatStats(
+        kills_A=len(killed_a),
+        kills_B=len(killed_b),
+        deaths_A=len(killed_a),
+        deaths_B=len(killed_b),
+        damage_to_A=assigned_a,
+        damage_to_B=assigned_b,
+    )
 
 
 def deal_direct_damage(units: List[UnitInPlay], damage: int) -> int:
     """Apply spell or ability damage to a unit group; returns kills."""
 
-    kills, _ = _apply_damage(units, damage)
-    units[:] = [u for u in units if u.damage < u.might or u.might == 0]
-    for unit in units:
-        unit.reset_damage()
-    return kills
\ No newline at end of file
+    killed, _, survivor = assign_damage(_guards(units), units, damage)
+    remove_units(units, killed)
+    if survivor is not None:
+        survivor.reset_damage()
+    return len(killed)
@@ -0,0 +1,183 @@
+"""Decklist files compiled into reusable deck templates.
+
+A decklist is a small text file::
+
+    # Anything after '#' is a comment.
+    Legend: Some Legend
+    Main:
+    10 Stalwart Recruit
+    10x Bolt
+    Runes:
+    6 Calm
+    6 R
+
+``Main:`` is the default section, so a bare list of ``<count> <card name>``
+lines is a valid deck. Runes are counted by domain (name or letter code) and
+the legend line is optional.
+
+:func:`compile_decklist` resolves every name against the card registry once
+and returns a :class:`DeckTemplate` holding the card prototypes in list order
+and the rune counts. Dealing a game's decks from a template only spawns the
+prototypes and shuffles, so hundreds of lists can be simulated without
+re-reading files or re-resolving names per game.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Mapping, Optional, Tuple, Union
+
+from .cards import Card
+from .cards_registry import CARD_REGISTRY, CardSpec, _parse_domain
+from .enums import CardType, Domain
+from .player import Deck, Rune, RuneDeck
+
+# Card categories allowed in the main deck.
+_MAIN_CATEGORIES = (CardType.UNIT, CardType.SPELL, CardType.GEAR)
+_SECTIONS = {"main": "main", "main deck": "main", "deck": "main", "runes": "runes", "rune deck": "runes"}
+_ENTRY = re.compile(r"^(\d+)\s*[xX]?\s+(.+)$")
+
+
+@dataclass(frozen=True, eq=False)
+class DeckTemplate:
+    """A compiled decklist: card prototypes in list order plus rune counts.
+
+    Templates are immutable and picklable, so they can ride along in
+    :class:`~riftbound.simulate.MatchSettings` to worker processes.
+    """
+
+    name: str
+    cards: Tuple[Card, ...]
+    runes: Tuple[Tuple[Domain, int], ...]
+    legend: Optional[Card] = None
+
+    def deck(self, rng: Optional[random.Random] = None) -> Deck:
+        """A fresh main deck (new card instances), shuffled with ``rng`` if given."""
+
+        deck = Deck([card.spawn() for card in self.cards])
+        if rng is not None:
+            deck.shuffle(rng)
+        return deck
+
+    def rune_deck(self, rng: Optional[random.Random] = None) -> RuneDeck:
+        """A fresh rune deck, shuffled with ``rng`` if given."""
+
+        runes = [Rune(domain=domain) for domain, count in self.runes for _ in range(count)]
+        if rng is not None:
+            rng.shuffle(runes)
+        return RuneDeck(runes=runes)
+
+    def spawn_legend(self) -> Optional[Card]:
+        return None if self.legend is None else self.legend.spawn()
+
+    @property
+    def digest(self) -> str:
+        """Hash of the compiled contents: every card definition in list order, runes and legend.
+
+        Unlike ``name`` it changes whenever the list or a card it uses does.
+        """
+
+        parts = [_definition(card) for card in self.cards]
+        parts.append(repr(tuple((domain.name, count) for domain, count in self.runes)))
+        parts.append(_definition(self.legend))
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def _definition(card: Optional[Card]) -> str:
+    if card is None:
+        return "-"
+    # Compared fields are the definition; ``uid`` and derived caches are not.
+    return repr((type(card).__name__, *(getattr(card, f.name) for f in fields(card) if f.compare)))
+
+
+def parse_decklist(text: str) -> Tuple[Optional[str], List[Tuple[int, str]], List[Tuple[int, str]]]:
+    """Split decklist text into ``(legend, main entries, rune entries)``.
+
+    Entries are ``(count, name)`` pairs in file order. Raises ``ValueError``
+    naming the offending line.
+    """
+
+    legend: Optional[str] = None
+    sections: dict = {"main": [], "runes": []}
+    section = "main"
+    for number, raw in enumerate(text.splitlines(), start=1):
+        line = raw.split("#", 1)[0].strip()
+        if not line:
+            continue
+        key, sep, value = line.partition(":")
+        header = key.strip().lower()
+        if sep and header == "legend":
+            if not value.strip():
+                raise ValueError(f"line {number}: legend name is missing")
+            legend = value.strip()
+            continue
+        if sep and header in _SECTIONS and not value.strip():
+            section = _SECTIONS[header]
+            continue
+        match = _ENTRY.match(line)
+        if match is None:
+            raise ValueError(f"line {number}: expected '<count> <name>', got {raw.strip()!r}")
+        count = int(match.group(1))
+        if count < 1:
+            raise ValueError(f"line {number}: count must be at least 1")
+        sections[section].append((count, match.group(2).strip()))
+    return legend, sections["main"], sections["runes"]
+
+
+def compile_decklist(
+    text: str,
+    *,
+    name: str = "deck",
+    registry: Optional[Mapping[str, CardSpec]] = None,
+) -> DeckTemplate:
+    """Parse ``text`` and resolve it against ``registry`` (default: the card registry)."""
+
+    registry = CARD_REGISTRY if registry is None else registry
+    try:
+        legend_name, main, runes = parse_decklist(text)
+        if not main:
+            raise ValueError("the main deck is empty")
+        cards: List[Card] = []
+        for count, card_name in main:
+            spec = registry.get(card_name)
+            if spec is None:
+                raise ValueError(f"unknown card '{card_name}'")
+            if spec.category not in _MAIN_CATEGORIES:
+                raise ValueError(f"'{card_name}' is a {spec.category.name.lower()} card, not a main-deck card")
+            cards += [spec.prototype] * count
+        rune_counts: dict = {}
+        for count, domain_name in runes:
+            domain = _parse_domain(domain_name)
+            if domain is None:
+                raise ValueError(f"unknown domain '{domain_name}'")
+            rune_counts[domain] = rune_counts.get(domain, 0) + count
+        legend = None
+        if legend_name is not None:
+            spec = registry.get(legend_name)
+            if spec is None or spec.category is not CardType.LEGEND:
+                raise ValueError(f"unknown legend '{legend_name}'")
+            legend = spec.prototype
+    except ValueError as exc:
+        raise ValueError(f"Decklist '{name}': {exc}") from None
+    return DeckTemplate(name=name, cards=tuple(cards), runes=tuple(rune_counts.items()), legend=legend)
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: str, mtime_ns: int) -> DeckTemplate:
+    file = Path(path)
+    return compile_decklist(file.read_text(encoding="utf-8"), name=file.stem)
+
+
+def load_decklist(path: Union[str, Path]) -> DeckTemplate:
+    """Compile the decklist at ``path``, reusing the template while the file is unchanged."""
+
+    file = Path(path).resolve()
+    return _load_cached(str(file), file.stat().st_mtime_ns)
+
+
+__all__ = ["DeckTemplate", "compile_decklist", "load_decklist", "parse_decklist"]
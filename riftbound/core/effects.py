@@ -1,72 +1,109 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Mapping
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional
 
-EffectHandler = Callable[["EffectContext", Mapping[str, Any]], None]
+from .enums import Domain
 
-REGISTRY: dict[str, EffectHandler] = {}
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from riftbound.core.loop import EffectContext
 
+# A card effect with its parameters already bound; called with the resolving context.
+CompiledEffect = Callable[["EffectContext"], None]
+# Turns one effect's raw parameters into a CompiledEffect, raising ValueError if they are bad.
+EffectCompiler = Callable[[Mapping[str, Any]], CompiledEffect]
 
-def effect(name: str) -> Callable[[EffectHandler], EffectHandler]:
-    """Decorator used to register effect handlers by name."""
+REGISTRY: dict[str, EffectCompiler] = {}
+
+# Relative player targets used by effect parameters, by lowercase name.
+ACTOR = 0
+OPPONENT = 1
+TARGETS = {"actor": ACTOR, "ally": ACTOR, "self": ACTOR, "opponent": OPPONENT, "enemy": OPPONENT}
+_TARGET_NAMES = ("actor", "opponent")
+_SCOPES = ("all", "single")
+
+
+def target_kind(target: str) -> Optional[int]:
+    kind = TARGETS.get(target)
+    if kind is None:
+        kind = TARGETS.get(target.lower())
+    return kind
+
+
+def effect(name: str) -> Callable[[EffectCompiler], EffectCompiler]:
+    """Decorator used to register effect compilers by name."""
 
     key = name.strip()
     if not key:
         raise ValueError("Effect name cannot be empty")
 
-    def decorator(func: EffectHandler) -> EffectHandler:
+    def decorator(func: EffectCompiler) -> EffectCompiler:
         REGISTRY[key] = func
         return func
 
     return decorator
 
 
-@effect("deal_damage")
-def _deal_damage(ctx: "EffectContext", spec: Mapping[str, Any]) -> None:
-    amount = int(spec.get("amount", 0))
-    target = str(spec.get("target", "opponent"))
-    ctx.deal_damage(amount, target=target)
+def compile_effect(spec: Mapping[str, Any]) -> CompiledEffect:
+    """Validate one effect mapping (``{"effect": name, **params}``) and bind it."""
 
+    name = str(spec.get("effect", "")).strip()
+    compiler = REGISTRY.get(name)
+    if compiler is None:
+        raise ValueError(f"Unknown effect '{name}'")
+    try:
+        return compiler(spec)
+    except ValueError as exc:
+        raise ValueError(f"Effect '{name}': {exc}") from None
 
-@effect("grant_might")
-def _grant_might(ctx: "EffectContext", spec: Mapping[str, Any]) -> None:
-    amount = int(spec.get("amount", 0))
-    target = str(spec.get("target", "actor"))
-    scope = str(spec.get("scope", "all"))
-    ctx.grant_might(amount, target=target, scope=scope)
 
-@effect("draw_cards")
-def _draw_cards(ctx: "EffectContext", spec: Mapping[str, Any]) -> None:
-    count = int(spec.get("count", spec.get("amount", 1)))
-    target = str(spec.get("target", "actor"))
-    source = str(spec.get("source", "effect"))
-    ctx.draw_cards(count, target=target, source=source)
+def compile_effects(specs: Iterable[Mapping[str, Any]]) -> tuple[CompiledEffect, ...]:
+    return tuple(compile_effect(spec) for spec in specs)
 
 
-@effect("gain_energy")
-def _gain_energy(ctx: "EffectContext", spec: Mapping[str, Any]) -> None:
-    amount = int(spec.get("amount", 0))
-    target = str(spec.get("target", "actor"))
-    ctx.gain_energy(amount, target=target)
+# ---- parameter parsing (load time) -------------------------------------------
 
 
-@effect("ready_units")
-def _ready_units(ctx: "EffectContext", spec: Mapping[str, Any]) -> None:
-    target = str(spec.get("target", "actor"))
-    scope = str(spec.get("scope", "all"))
-    ctx.ready_units(target=target, scope=scope)
+def _int(spec: Mapping[str, Any], key: str, default: Any) -> int:
+    value = spec.get(key, default)
+    if isinstance(value, bool):
+        raise ValueError(f"'{key}' must be an integer, got {value!r}")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{key}' must be an integer, got {value!r}") from None
 
 
-@effect("add_rune")
-def _add_rune(ctx: "EffectContext", spec: Mapping[str, Any]) -> None:
-    if "domain" not in spec:
-        raise ValueError("add_rune effect requires a 'domain' parameter")
+def _target(spec: Mapping[str, Any], default: str) -> str:
+    value = str(spec.get("target", default))
+    kind = target_kind(value)
+    if kind is None:
+        raise ValueError(f"Unknown player target '{value}'")
+    return _TARGET_NAMES[kind]
 
-    domain = spec.get("domain")
-    target = str(spec.get("target", "actor"))
-    ready_value = spec.get("ready", True)
-    ready = _coerce_bool(ready_value)
-    ctx.add_rune(domain, target=target, ready=ready)
+
+def _scope(spec: Mapping[str, Any]) -> str:
+    # Lowercased here so EffectContext compares it as-is on every resolution.
+    value = str(spec.get("scope", "all")).strip().lower()
+    if value not in _SCOPES:
+        raise ValueError(f"Unknown scope '{value}'")
+    return value
+
+
+def parse_domain(value: object) -> Domain:
+    if isinstance(value, Domain):
+        return value
+    if isinstance(value, str):
+        key = value.strip().upper()
+        if not key:
+            raise ValueError("Domain value cannot be empty")
+        try:
+            return Domain[key]
+        except KeyError:
+            for domain in Domain:
+                if domain.value.upper() == key:
+                    return domain
+    raise ValueError(f"Unknown domain '{value}'")
 
 
 def _coerce_bool(value: Any) -> bool:
@@ -81,12 +118,68 @@ def _coerce_bool(value: Any) -> bool:
     return bool(value)
 
 
+# ---- effects -------------------------------------------------------------------
+# Compilers return ``functools.partial`` objects over module-level runners so
+# compiled cards stay picklable (search agents ship states to worker processes).
+
+
+def _run_deal_damage(amount: int, target: str, ctx: "EffectContext") -> None:
+    ctx.deal_damage(amount, target=target)
+
+
+@effect("deal_damage")
+def _deal_damage(spec: Mapping[str, Any]) -> CompiledEffect:
+    return partial(_run_deal_damage, _int(spec, "amount", 0), _target(spec, "opponent"))
 
-# Late import for type checking support without circular dependency
-try:  # pragma: no cover - best effort typing support
-    from typing import TYPE_CHECKING
 
-    if TYPE_CHECKING:  # pragma: no cover
-        from riftbound.core.loop import EffectContext  # noqa: F401
-except Exception:  # pragma: no cover - typing helper only
-    pass
\ No newline at end of file
+def _run_grant_might(amount: int, target: str, scope: str, ctx: "EffectContext") -> None:
+    ctx.grant_might(amount, target=target, scope=scope)
+
+
+@effect("grant_might")
+def _grant_might(spec: Mapping[str, Any]) -> CompiledEffect:
+    return partial(_run_grant_might, _int(spec, "amount", 0), _target(spec, "actor"), _scope(spec))
+
+
+def _run_draw_cards(count: int, target: str, source: str, ctx: "EffectContext") -> None:
+    ctx.draw_cards(count, target=target, source=source)
+
+
+@effect("draw_cards")
+def _draw_cards(spec: Mapping[str, Any]) -> CompiledEffect:
+    count = _int(spec, "count", spec.get("amount", 1))
+    return partial(_run_draw_cards, count, _target(spec, "actor"), str(spec.get("source", "effect")))
+
+
+def _run_gain_energy(amount: int, target: str, ctx: "EffectContext") -> None:
+    ctx.gain_energy(amount, target=target)
+
+
+@effect("gain_energy")
+def _gain_energy(spec: Mapping[str, Any]) -> CompiledEffect:
+    return partial(_run_gain_energy, _int(spec, "amount", 0), _target(spec, "actor"))
+
+
+def _run_ready_units(target: str, scope: str, ctx: "EffectContext") -> None:
+    ctx.ready_units(target=target, scope=scope)
+
+
+@effect("ready_units")
+def _ready_units(spec: Mapping[str, Any]) -> CompiledEffect:
+    return partial(_run_ready_units, _target(spec, "actor"), _scope(spec))
+
+
+def _run_add_rune(domain: Domain, target: str, ready: bool, ctx: "EffectContext") -> None:
+    ctx.add_rune(domain, target=target, ready=ready)
+
+
+@effect("add_rune")
+def _add_rune(spec: Mapping[str, Any]) -> CompiledEffect:
+    if "domain" not in spec:
+        raise ValueError("add_rune effect requires a 'domain' parameter")
+    return partial(
+        _run_add_rune,
+        parse_domain(spec["domain"]),
+        _target(spec, "actor"),
+        _coerce_bool(spec.get("ready", True)),
+    )
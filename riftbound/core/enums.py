@@ -1,4 +1,5 @@
-from enum import Enum, auto
+from enum import Enum, IntFlag, auto
+from typing import Iterable
 
 class Domain(Enum):
     FURY = "R"
@@ -23,3 +24,48 @@ class Phase(Enum):
     ACTION = auto()
     COMBAT = auto()   # explicit combat phase (contested → 1-for-1 → control/Conquer)
     END = auto()
+
+class Keyword(IntFlag):
+    """Card keywords as bits, so a card's keyword set is one int."""
+
+    ACCELERATE = auto()
+    ACTION = auto()
+    ASSAULT = auto()
+    DEATHKNELL = auto()
+    DEFLECT = auto()
+    GANKING = auto()
+    GUARD = auto()
+    HIDDEN = auto()
+    LEGION = auto()
+    REACTION = auto()
+    SHIELD = auto()
+    TANK = auto()
+    TEMPORARY = auto()
+    VISION = auto()
+
+
+def keyword_mask(keywords: Iterable[str]) -> int:
+    """OR of the :class:`Keyword` bits named in ``keywords`` (case-insensitive).
+
+    Raises ``ValueError`` on a name that is not a known keyword.
+    """
+
+    mask = 0
+    for name in keywords:
+        member = Keyword.__members__.get(str(name).strip().upper())
+        if member is None:
+            raise ValueError(f"Unknown keyword '{name}'")
+        mask |= member.value
+    return mask
+
+
+# Sides are indices inside the engine (0 = A, 1 = B); the names only appear at
+# the edges (recorder, results, CLI). Per-side data lives in 2-element lists.
+SIDE_NAMES = ("A", "B")
+SIDE_INDEX = {"A": 0, "B": 1}
+
+
+def side_index(who: "int | str") -> int:
+    """``who`` as a side index, accepting either an index or a name."""
+
+    return who if who.__class__ is int else SIDE_INDEX[who]
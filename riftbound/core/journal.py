@@ -0,0 +1,124 @@
+"""Undo journal used by :class:`~riftbound.core.loop.GameLoop` for apply/undo.
+
+Mutating methods on players, battlefields and the loop check an optional
+``journal`` attribute and, when one is attached, append a small tuple
+describing how to reverse the change *before* making it. Rolling back to a
+:meth:`UndoJournal.mark` replays those tuples in reverse order, so search code
+can walk a line of play and return to the original position without copying
+the state.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Iterable, List, MutableMapping, Tuple
+
+_ATTR = 0
+_POP = 1
+_APPEND = 2
+_LIST = 3
+_DICT = 4
+_ITEM = 5
+
+_MISSING = object()
+
+Entry = Tuple[Any, ...]
+
+_STAMPS = itertools.count(1)
+
+
+def new_stamp() -> int:
+    """A version stamp never handed out before.
+
+    Players and battlefields take a fresh stamp whenever they change, and
+    caches compare stamps. Because stamps are never reused, undoing a change
+    (which restores the old stamp) cannot make a stale cache entry look valid.
+    """
+
+    return next(_STAMPS)
+
+
+class UndoJournal:
+    """Append-only log of reversible state changes."""
+
+    __slots__ = ("_entries",)
+
+    def __init__(self) -> None:
+        self._entries: List[Entry] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def mark(self) -> int:
+        """Position to pass to :meth:`rollback` later."""
+
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Forget every entry, making the current state the new baseline."""
+
+        self._entries.clear()
+
+    # ---- recording (call before mutating) ----------------------------------
+
+    def record_attr(self, obj: Any, name: str) -> None:
+        self._entries.append((_ATTR, obj, name, getattr(obj, name)))
+
+    def record_attrs(self, obj: Any, names: Iterable[str]) -> None:
+        entries = self._entries
+        for name in names:
+            entries.append((_ATTR, obj, name, getattr(obj, name)))
+
+    def record_pop(self, items: list, index: int) -> None:
+        """``items[index]`` is about to be removed."""
+
+        self._entries.append((_POP, items, index, items[index]))
+
+    def record_append(self, items: list) -> None:
+        """An item is about to be appended to ``items``."""
+
+        self._entries.append((_APPEND, items))
+
+    def record_list(self, items: list) -> None:
+        """``items`` is about to be rewritten wholesale (e.g. combat deaths)."""
+
+        self._entries.append((_LIST, items, items[:]))
+
+    def record_item(self, items: list, index: int) -> None:
+        """``items[index]`` is about to be overwritten (per-side counters and flags)."""
+
+        self._entries.append((_ITEM, items, index, items[index]))
+
+    def record_dict(self, mapping: MutableMapping[Any, Any], key: Any) -> None:
+        self._entries.append((_DICT, mapping, key, mapping.get(key, _MISSING)))
+
+    # ---- undo ----------------------------------------------------------------
+
+    def rollback(self, mark: int = 0) -> None:
+        """Undo every change recorded after ``mark``, newest first."""
+
+        entries = self._entries
+        if not 0 <= mark <= len(entries):
+            raise ValueError(f"Invalid journal mark {mark} (journal has {len(entries)} entries)")
+        while len(entries) > mark:
+            entry = entries.pop()
+            kind = entry[0]
+            if kind == _ATTR:
+                setattr(entry[1], entry[2], entry[3])
+            elif kind == _POP:
+                entry[1].insert(entry[2], entry[3])
+            elif kind == _APPEND:
+                entry[1].pop()
+            elif kind == _LIST:
+                entry[1][:] = entry[2]
+            elif kind == _ITEM:
+                entry[1][entry[2]] = entry[3]
+            else:
+                mapping, key, old = entry[1], entry[2], entry[3]
+                if old is _MISSING:
+                    mapping.pop(key, None)
+                else:
+                    mapping[key] = old
+
+
+__all__ = ["UndoJournal", "new_stamp"]
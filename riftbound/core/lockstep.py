@@ -0,0 +1,471 @@
+"""Batched NumPy engine that advances many vanilla games in lockstep.
+
+The reference :class:`~riftbound.core.loop.GameLoop` plays one game with
+per-object Python logic. For decks made only of keyword-less, effect-less units
+and single ``deal_damage`` spells (no power costs), the whole game state fits in
+a handful of integer arrays, so thousands of games can be advanced together:
+
+* hands are per-card-type counts, decks are shuffled card-type rows;
+* each lane side is a FIFO of unit Might values with a head/tail pointer and a
+  running total (with no Guards, damage always kills a prefix of the lane);
+* runes, energy, VP and lane flags are plain per-game arrays.
+
+Every game in a batch is on the same turn with the same active player, so the
+only per-game control flow is the ``alive`` mask of unfinished games. The two
+heuristic agents are re-expressed as array rules; ties between different card
+types of equal cost are broken by card type rather than by hand position, so
+results match the reference engine statistically rather than game for game.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency at runtime
+    import numpy as np
+except ModuleNotFoundError:  # pragma: no cover - environment without NumPy
+    np = None  # type: ignore[assignment]
+    _HAS_NUMPY = False
+else:  # pragma: no cover - import success path exercised in tests when available
+    _HAS_NUMPY = True
+
+from .cards_registry import CARD_REGISTRY, CardSpec
+from .enums import CardType
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from riftbound.stats import MatchTally
+
+LANES = 2
+MAX_RUNES = 12
+RUNE_DECK_SIZE = 12
+AGGRO = "aggro"
+CONTROL = "control"
+
+_WINNER_NAMES = ("A", "B", "DRAW")
+_DRAW = 2
+_PENDING = -1
+
+
+class LockstepUnsupported(ValueError):
+    """Raised when a deck or agent cannot be expressed by the lockstep engine."""
+
+
+def _require_numpy() -> None:
+    if not _HAS_NUMPY:
+        raise RuntimeError(
+            "NumPy is required for the lockstep engine. "
+            "Install the 'numpy' package (or the 'fast' extra) to use it."
+        )
+
+
+def default_deck() -> List[CardSpec]:
+    """Card list matching :func:`riftbound.simulate.make_simple_deck`."""
+
+    return [CARD_REGISTRY["Stalwart Recruit"]] * 10 + [CARD_REGISTRY["Bolt"]] * 10
+
+
+def policy_for(agent_name: str) -> str:
+    """Map an ``AI_REGISTRY`` name onto one of the array policies."""
+
+    from riftbound.ai.heuristics.simple_aggro import SimpleAggro
+    from riftbound.ai.heuristics.simple_control import SimpleControl
+    from riftbound.simulate import resolve_agent
+
+    cls = resolve_agent(agent_name)
+    if cls is SimpleAggro:
+        return AGGRO
+    if cls is SimpleControl:
+        return CONTROL
+    raise LockstepUnsupported(f"Agent '{agent_name}' has no lockstep policy")
+
+
+def _spell_damage(spec: CardSpec) -> int:
+    if not spec.effects:
+        return int(spec.damage or 0)
+    if len(spec.effects) != 1 or spec.effects[0].effect != "deal_damage":
+        raise LockstepUnsupported(f"Spell '{spec.name}' must have a single deal_damage effect")
+    params = spec.effects[0].params
+    if str(params.get("target", "opponent")).lower() not in {"opponent", "enemy"}:
+        raise LockstepUnsupported(f"Spell '{spec.name}' must target the opponent")
+    return int(params.get("amount", 0))
+
+
+@dataclass(frozen=True)
+class CardTable:
+    """Per-card-type columns shared by both decks in a batch."""
+
+    names: Tuple[str, ...]
+    is_unit: Any
+    is_spell: Any
+    cost: Any
+    might: Any
+    damage: Any
+
+    @classmethod
+    def compile(cls, specs: Sequence[CardSpec]) -> "CardTable":
+        _require_numpy()
+        names: List[str] = []
+        rows = []
+        for spec in specs:
+            if spec.name in names:
+                continue
+            if spec.cost_power is not None:
+                raise LockstepUnsupported(f"'{spec.name}' has a power cost")
+            if spec.keywords:
+                raise LockstepUnsupported(f"'{spec.name}' has keywords")
+            if spec.category is CardType.UNIT:
+                if spec.effects:
+                    raise LockstepUnsupported(f"Unit '{spec.name}' has effects")
+                might = int(spec.might or 0)
+                if might < 1:
+                    raise LockstepUnsupported(f"Unit '{spec.name}' needs Might of at least 1")
+                rows.append((True, False, spec.cost_energy, might, 0))
+            elif spec.category is CardType.SPELL:
+                rows.append((False, True, spec.cost_energy, 0, _spell_damage(spec)))
+            else:
+                raise LockstepUnsupported(f"'{spec.name}' is a {spec.category.name} card")
+            names.append(spec.name)
+        columns = list(zip(*rows)) if rows else [(), (), (), (), ()]
+        return cls(
+            names=tuple(names),
+            is_unit=np.array(columns[0], dtype=bool),
+            is_spell=np.array(columns[1], dtype=bool),
+            cost=np.array(columns[2], dtype=np.int32),
+            might=np.array(columns[3], dtype=np.int32),
+            damage=np.array(columns[4], dtype=np.int32),
+        )
+
+    def deck_row(self, specs: Sequence[CardSpec]) -> Any:
+        return np.array([self.names.index(spec.name) for spec in specs], dtype=np.int16)
+
+
+@dataclass
+class LockstepBatch:
+    """Final per-game results for one batch; winners use 0=A, 1=B, 2=DRAW."""
+
+    winners: Any
+    turns: Any
+    units_played: Any
+    spells_cast: Any
+    points: Any
+
+    def __len__(self) -> int:
+        return int(self.winners.shape[0])
+
+    def winner_names(self) -> List[str]:
+        return [_WINNER_NAMES[w] for w in self.winners.tolist()]
+
+    def add_to(self, tally: "MatchTally") -> None:
+        counts = np.bincount(self.winners, minlength=3)
+        tally.games += len(self)
+        tally.wins_A += int(counts[0])
+        tally.wins_B += int(counts[1])
+        tally.draws += int(counts[2])
+        tally.turns_total += int(self.turns.sum())
+
+
+class _BatchState:
+    """Struct-of-arrays state for ``n`` games sharing one card table."""
+
+    def __init__(
+        self,
+        n: int,
+        table: CardTable,
+        decks: Sequence[Any],
+        rng: Any,
+        starting_energy: int,
+    ) -> None:
+        self.n = n
+        self.table = table
+        types = len(table.names)
+        size = max(len(d) for d in decks)
+        slots = max(1, size)
+
+        self.deck = np.zeros((n, 2, size), dtype=np.int16)
+        self.deck_left = np.zeros((n, 2), dtype=np.int32)
+        for side, row in enumerate(decks):
+            if len(row):
+                self.deck[:, side, : len(row)] = rng.permuted(np.tile(row, (n, 1)), axis=1)
+            self.deck_left[:, side] = len(row)
+        self.hand = np.zeros((n, 2, types), dtype=np.int32)
+        self.energy = np.full((n, 2), starting_energy, dtype=np.int32)
+        self.runes = np.zeros((n, 2), dtype=np.int32)
+        self.rune_deck = np.full((n, 2), RUNE_DECK_SIZE, dtype=np.int32)
+        self.points = np.zeros((n, 2), dtype=np.int32)
+
+        # Lane FIFOs: units occupy slots [head, tail) in arrival order.
+        self.mights = np.zeros((n, 2, LANES, slots), dtype=np.int32)
+        self.head = np.zeros((n, 2, LANES), dtype=np.int32)
+        self.tail = np.zeros((n, 2, LANES), dtype=np.int32)
+        self.lane_might = np.zeros((n, 2, LANES), dtype=np.int32)
+        self.slot_ids = np.arange(slots, dtype=np.int32)
+
+        self.contested = np.zeros((n, LANES), dtype=bool)
+        self.scored = np.zeros((n, LANES), dtype=bool)
+        self.last_controller = np.full((n, LANES), -1, dtype=np.int8)
+
+        self.alive = np.ones(n, dtype=bool)
+        self.winner = np.full(n, _PENDING, dtype=np.int8)
+        self.turns = np.zeros(n, dtype=np.int32)
+        self.units_played = np.zeros(n, dtype=np.int32)
+        self.spells_cast = np.zeros(n, dtype=np.int32)
+        self.rows = np.arange(n)
+
+    # ---- helpers -------------------------------------------------------
+
+    def counts(self) -> Any:
+        return self.tail - self.head  # (n, 2, LANES)
+
+    def controller(self) -> Any:
+        counts = self.counts()
+        a = counts[:, 0] > 0
+        b = counts[:, 1] > 0
+        return np.where(a & ~b, 0, np.where(b & ~a, 1, -1)).astype(np.int8)
+
+    def draw(self, side: int, mask: Any) -> None:
+        can = mask & (self.deck_left[:, side] > 0)
+        rows = self.rows[can]
+        if rows.size == 0:
+            return
+        top = self.deck_left[rows, side] - 1
+        cards = self.deck[rows, side, top]
+        np.add.at(self.hand, (rows, side, cards), 1)
+        self.deck_left[rows, side] = top
+
+    def unlock_runes(self, side: int, count: int, mask: Any) -> None:
+        room = np.minimum(MAX_RUNES - self.runes[:, side], self.rune_deck[:, side])
+        take = np.where(mask, np.clip(np.minimum(count, room), 0, None), 0)
+        self.runes[:, side] += take
+        self.rune_deck[:, side] -= take
+
+    def channel(self, side: int, mask: Any) -> None:
+        self.energy[:, side] += np.where(mask, np.minimum(2, self.runes[:, side]), 0)
+
+    def damage_lanes(self, side: int, damage: Any) -> None:
+        """Apply ``damage`` (n, LANES) to ``side``'s lanes, killing from the front."""
+
+        slots = self.slot_ids
+        window = (slots >= self.head[:, side, :, None]) & (slots < self.tail[:, side, :, None])
+        mights = np.where(window, self.mights[:, side], 0)
+        killed = window & (np.cumsum(mights, axis=-1) <= damage[..., None])
+        self.head[:, side] += killed.sum(axis=-1, dtype=np.int32)
+        self.lane_might[:, side] -= np.where(killed, mights, 0).sum(axis=-1, dtype=np.int32)
+
+    def settle(self, mask: Any, winner: Any, turn: int) -> None:
+        self.winner[mask] = winner[mask] if np.ndim(winner) else winner
+        self.turns[mask] = turn
+        self.alive &= ~mask
+
+    def check_victory(self, victory_score: int, turn: int, mask: Any) -> None:
+        won_a = mask & (self.points[:, 0] >= victory_score)
+        won_b = mask & ~won_a & (self.points[:, 1] >= victory_score)
+        self.settle(won_a, 0, turn)
+        self.settle(won_b, 1, turn)
+
+    # ---- policies ------------------------------------------------------
+
+    def choose_lane(self, side: int, policy: str) -> Any:
+        counts = self.counts()
+        mine = counts[:, side]
+        theirs = counts[:, 1 - side]
+        if policy == AGGRO:
+            # max over (lane empty of enemies, -(mine - theirs)); first lane wins ties
+            key = (theirs == 0) * 10_000 - (mine - theirs)
+            return np.argmax(key, axis=1)
+        # min over (mine - theirs, -lane): the later lane wins ties
+        key = (mine - theirs) * LANES - np.arange(LANES)
+        return np.argmin(key, axis=1)
+
+    def choose_card(self, side: int, policy: str, kind: Any) -> Any:
+        """Index of the card type to play from ``kind`` cards, or -1."""
+
+        types = len(self.table.names)
+        cost = self.table.cost
+        playable = (
+            (self.hand[:, side] > 0)
+            & kind[None, :]
+            & (cost[None, :] <= self.energy[:, side, None])
+        )
+        order = np.arange(types)
+        if policy == AGGRO:
+            key = np.where(playable, cost * types + (types - 1 - order), -1)
+            best = np.argmax(key, axis=1)
+            return np.where(key.max(axis=1) >= 0, best, -1)
+        big = np.iinfo(np.int32).max
+        key = np.where(playable, cost * types + order, big)
+        best = np.argmin(key, axis=1)
+        return np.where(key.min(axis=1) < big, best, -1)
+
+    def act(self, side: int, policy: str) -> None:
+        alive = self.alive
+        lane = self.choose_lane(side, policy)
+        table = self.table
+
+        unit = np.where(alive, self.choose_card(side, policy, table.is_unit), -1)
+        rows = self.rows[unit >= 0]
+        if rows.size:
+            cards = unit[rows]
+            lanes = lane[rows]
+            self.energy[rows, side] -= table.cost[cards]
+            self.hand[rows, side, cards] -= 1
+            slot = self.tail[rows, side, lanes]
+            self.mights[rows, side, lanes, slot] = table.might[cards]
+            self.tail[rows, side, lanes] += 1
+            self.lane_might[rows, side, lanes] += table.might[cards]
+            self.units_played[rows] += 1
+
+        spell = np.where(alive & (unit < 0), self.choose_card(side, policy, table.is_spell), -1)
+        rows = self.rows[spell >= 0]
+        if rows.size:
+            cards = spell[rows]
+            self.energy[rows, side] -= table.cost[cards]
+            self.hand[rows, side, cards] -= 1
+            self.spells_cast[rows] += 1
+            damage = np.zeros((self.n, LANES), dtype=np.int32)
+            damage[rows, lane[rows]] = table.damage[cards]
+            self.damage_lanes(1 - side, damage)
+
+        counts = self.counts()
+        self.contested |= alive[:, None] & (counts[:, 0] > 0) & (counts[:, 1] > 0)
+
+
+def _play_batch(
+    n: int,
+    table: CardTable,
+    decks: Sequence[Any],
+    policies: Tuple[str, str],
+    rng: Any,
+    *,
+    victory_score: int,
+    starting_energy: int,
+    max_turns: int,
+) -> LockstepBatch:
+    st = _BatchState(n, table, decks, rng, starting_energy)
+    everyone = st.alive.copy()
+
+    for _ in range(5):
+        st.draw(0, everyone)
+        st.draw(1, everyone)
+    st.unlock_runes(0, 2, everyone)
+    st.unlock_runes(1, 3, everyone)
+
+    active = 0
+    for turn in range(1, max_turns + 1):
+        alive = st.alive
+        if not alive.any():
+            break
+        other = 1 - active
+
+        # BEGINNING: reset flags, remember controllers, runes, Hold scoring.
+        controller = st.controller()
+        counts = st.counts()
+        st.last_controller = np.where(alive[:, None], controller, st.last_controller)
+        st.contested = alive[:, None] & (counts[:, 0] > 0) & (counts[:, 1] > 0)
+        st.unlock_runes(active, 2, alive)
+        st.channel(active, alive)
+        st.channel(other, alive)
+        hold = alive[:, None] & (controller == active)
+        st.scored = hold
+        gained = hold.sum(axis=1, dtype=np.int32)
+        st.points[:, active] += gained
+        st.check_victory(victory_score, turn, gained > 0)
+
+        # DRAW and ACTION
+        st.draw(active, st.alive)
+        st.act(active, policies[active])
+
+        # COMBAT on contested lanes, then Conquer.
+        alive = st.alive
+        fighting = alive[:, None] & st.contested
+        damage_to_a = np.where(fighting, st.lane_might[:, 1], 0)
+        damage_to_b = np.where(fighting, st.lane_might[:, 0], 0)
+        st.damage_lanes(0, damage_to_a)
+        st.damage_lanes(1, damage_to_b)
+        conquer = (
+            fighting
+            & (st.controller() == active)
+            & (st.last_controller != active)
+            & ~st.scored
+        )
+        st.scored |= conquer
+        st.points[:, active] += conquer.sum(axis=1, dtype=np.int32)
+        st.check_victory(victory_score, turn, alive)
+
+        active = other
+
+    remaining = st.alive
+    if remaining.any():
+        a, b = st.points[:, 0], st.points[:, 1]
+        by_points = np.where(a > b, 0, np.where(b > a, 1, _DRAW)).astype(np.int8)
+        st.settle(remaining, by_points, max_turns)
+
+    return LockstepBatch(
+        winners=st.winner.copy(),
+        turns=st.turns.copy(),
+        units_played=st.units_played.copy(),
+        spells_cast=st.spells_cast.copy(),
+        points=st.points.copy(),
+    )
+
+
+def iter_lockstep(
+    games: int,
+    *,
+    seed: int = 42,
+    ai_a: str = AGGRO,
+    ai_b: str = AGGRO,
+    victory_score: int = 8,
+    starting_energy: int = 0,
+    max_turns: int = 40,
+    deck_a: Optional[Sequence[CardSpec]] = None,
+    deck_b: Optional[Sequence[CardSpec]] = None,
+    batch_size: int = 4096,
+) -> Iterator[LockstepBatch]:
+    """Play ``games`` games in batches of ``batch_size``, yielding each batch.
+
+    Raises :class:`LockstepUnsupported` up front if a deck or agent falls
+    outside what the array engine models.
+    """
+
+    _require_numpy()
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    specs_a = list(deck_a) if deck_a is not None else default_deck()
+    specs_b = list(deck_b) if deck_b is not None else default_deck()
+    table = CardTable.compile(specs_a + specs_b)
+    decks = (table.deck_row(specs_a), table.deck_row(specs_b))
+    policies = (policy_for(ai_a), policy_for(ai_b))
+    return _iter_batches(
+        games, seed, table, decks, policies, batch_size,
+        victory_score=victory_score,
+        starting_energy=starting_energy,
+        max_turns=max_turns,
+    )
+
+
+def _iter_batches(
+    games: int,
+    seed: int,
+    table: CardTable,
+    decks: Tuple[Any, Any],
+    policies: Tuple[str, str],
+    batch_size: int,
+    **rules: int,
+) -> Iterator[LockstepBatch]:
+    rng = np.random.default_rng(seed)
+    done = 0
+    while done < games:
+        n = min(batch_size, games - done)
+        yield _play_batch(n, table, decks, policies, rng, **rules)
+        done += n
+
+
+__all__ = [
+    "CardTable",
+    "LockstepBatch",
+    "LockstepUnsupported",
+    "default_deck",
+    "iter_lockstep",
+    "policy_for",
+]
@@ -2,16 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Optional, Tuple, TYPE_CHECKING
-from typing import Optional, Tuple, TYPE_CHECKING, Iterable
+from typing import Optional, Tuple, TYPE_CHECKING, Iterable, List
 
 from .state import GameState
 from .cards import Card, GearCard, SpellCard, UnitCard
 from .combat import UnitInPlay
 from .player import Player
 from .battlefield import Battlefield
-from .cards_registry import CARD_REGISTRY, EffectSpec
-from .effects import REGISTRY as EFFECT_REGISTRY
-from .enums import Domain
+from .effects import ACTOR as _ACTOR, parse_domain, target_kind as _target_kind
+from .enums import SIDE_NAMES, Domain, Keyword, side_index
+from .journal import UndoJournal
+from .zobrist import ZobristHasher
 
 if TYPE_CHECKING:
     from riftbound.data.writer import GameRecorder
@@ -32,73 +33,56 @@ class EffectContext:
     opponent: Player
     battlefield: Battlefield
 
-    def _side_for_player(self, player: Player) -> str:
-        return "A" if player is self.loop.gs.A else "B"
+    def _side_for_player(self, player: Player) -> int:
+        return 0 if player is self.loop.gs.A else 1
 
     @property
     def actor_side(self) -> str:
-        return self._side_for_player(self.actor)
+        return SIDE_NAMES[self._side_for_player(self.actor)]
 
     @property
     def opponent_side(self) -> str:
-        return self._side_for_player(self.opponent)
-    
+        return SIDE_NAMES[self._side_for_player(self.opponent)]
+
     def _player_for_target(self, target: str) -> Player:
-        key = target.lower()
-        if key in {"actor", "ally", "self"}:
-            return self.actor
-        if key in {"opponent", "enemy"}:
-            return self.opponent
-        raise ValueError(f"Unknown player target '{target}'")
+        kind = _target_kind(target)
+        if kind is None:
+            raise ValueError(f"Unknown player target '{target}'")
+        return self.actor if kind == _ACTOR else self.opponent
+
+    def _side_for_target(self, target: str) -> int:
+        """Side hit by a damage/buff ``target``; anything but an ally reads as the opponent."""
 
-    def _units_for_side(self, side: str) -> list[UnitInPlay]:
-        return self.battlefield.units_A if side == "A" else self.battlefield.units_B
+        player = self.actor if _target_kind(target) == _ACTOR else self.opponent
+        return self._side_for_player(player)
 
     def _units_for_target(self, target: str) -> list[UnitInPlay]:
-        player = self._player_for_target(target)
-        return self._units_for_side(self._side_for_player(player))
+        return self.battlefield.units[self._side_for_player(self._player_for_target(target))]
 
     def deal_damage(self, amount: int, *, target: str = "opponent") -> None:
         if amount <= 0:
             return
 
-        before_a = list(self.battlefield.units_A)
-        before_b = list(self.battlefield.units_B)
-
-        target_key = target.lower()
-        if target_key in {"actor", "ally", "self"}:
-            target_side = self.actor_side
-        else:
-            target_side = self.opponent_side
+        battlefield = self.battlefield
+        if not self.loop.recorder:
+            # Cost follows the damage dealt; lanes are only copied to log deaths.
+            battlefield.apply_spell_damage(self._side_for_target(target), amount)
+            return
 
-        self.battlefield.apply_spell_damage(target_side, amount)
+        before_a = list(battlefield.units_A)
+        before_b = list(battlefield.units_B)
+        battlefield.apply_spell_damage(self._side_for_target(target), amount)
+        self.loop._record_spell_deaths(battlefield, before_a, before_b)
 
-        if self.loop.recorder:
-            self.loop._record_spell_deaths(self.battlefield, before_a, before_b)
+    # ``scope`` is "all" or "single"; compiled effects normalise it at load time.
 
     def grant_might(self, amount: int, *, target: str = "actor", scope: str = "all") -> None:
         if amount == 0:
             return
 
-        target_key = target.lower()
-        if target_key in {"actor", "ally", "self"}:
-            side = self.actor_side
-        else:
-            side = self.opponent_side
-
-        units = self.battlefield.units_A if side == "A" else self.battlefield.units_B
-        if not units:
-            return
-
-        scope_key = scope.lower()
-        if scope_key == "single":
-            iterable = units[:1]
-        else:
-            iterable = units
-
-        for unit in iterable:
-            current = int(unit.card.might or 0)
-            unit.card.might = current + amount
+        self.battlefield.grant_might(
+            self._side_for_target(target), amount, single=scope == "single"
+        )
 
     def draw_cards(self, count: int, *, target: str = "actor", source: str = "effect") -> None:
         if count <= 0:
@@ -122,21 +106,24 @@ class EffectContext:
             return
 
         player = self._player_for_target(target)
-        player.energy += amount
+        player._set_energy(player.energy + amount)
 
     def ready_units(self, *, target: str = "actor", scope: str = "all") -> None:
         units = self._units_for_target(target)
         if not units:
             return
 
-        scope_key = scope.lower()
-        if scope_key == "single":
+        if scope == "single":
             iterable: Iterable[UnitInPlay] = units[:1]
         else:
             iterable = units
 
+        journal = self.loop.journal
         for unit in iterable:
+            if journal is not None:
+                journal.record_attr(unit, "ready")
             unit.ready = True
+        self.battlefield._units_changed(self._side_for_player(self._player_for_target(target)))
 
     def add_rune(self, domain: object, *, target: str = "actor", ready: bool = True) -> None:
         domain_obj = self._coerce_domain(domain)
@@ -144,19 +131,7 @@ class EffectContext:
         player.add_rune(domain_obj, ready=ready)
 
     def _coerce_domain(self, value: object) -> Domain:
-        if isinstance(value, Domain):
-            return value
-        if isinstance(value, str):
-            key = value.strip().upper()
-            if not key:
-                raise ValueError("Domain value cannot be empty")
-            try:
-                return Domain[key]
-            except KeyError:
-                for domain in Domain:
-                    if domain.value.upper() == key:
-                        return domain
-        raise ValueError(f"Unknown domain '{value}'")      
+        return parse_domain(value)
 
 
 # Legacy action signature retained for agents:
@@ -164,6 +139,12 @@ class EffectContext:
 # Agents implemented before MOVE support still emit 3-tuples; the loop normalises them.
 Action = Tuple[str, Optional[int], Optional[int], Optional[int]]
 
+PASS_ACTION: Action = ("PASS", None, None)  # type: ignore[assignment]
+
+# Hand positions addressable by the fixed-size action mask; legal_mask() raises
+# for a playable card past the last slot rather than leaving it out.
+MAX_HAND_SLOTS = 32
+
 
 class GameLoop:
     """Core turn structure, extended with Might combat, rune channeling and movement."""
@@ -173,45 +154,164 @@ class GameLoop:
         self.units_played = 0
         self.spells_cast = 0
         self.recorder = recorder
+        self.journal: Optional[UndoJournal] = None
+        self.zobrist: Optional[ZobristHasher] = None
+        self._effect_context: Optional[EffectContext] = None
+        # per side: [stamps the entry was computed at, actions, mask or None until asked for]
+        self._legal_cache: List[Optional[list]] = [None, None]
 
         if hasattr(gs.A, "agent") and gs.A.agent:
             gs.A.agent.player.battlefields = gs.battlefields
+            gs.A.agent.loop = self
         if hasattr(gs.B, "agent") and gs.B.agent:
             gs.B.agent.player.battlefields = gs.battlefields
+            gs.B.agent.loop = self
+
+    # ====== LEGAL ACTIONS ======
+
+    def _legal_entry(self, player: Player) -> list:
+        key = (player.stamp,) + tuple(bf.stamp for bf in self.gs.battlefields)
+        entry = self._legal_cache[player.side]
+        if entry is None or entry[0] != key:
+            entry = [key, self._generate_legal_actions(player), None]
+            self._legal_cache[player.side] = entry
+        return entry
+
+    def legal_actions(self, player: Player) -> List[Action]:
+        """Every action ``_apply_action`` would carry out for ``player`` right now.
+
+        Covers PASS, UNIT/SPELL/GEAR for each affordable card and lane, and
+        MOVE out of a lane or the base when a ready unit there can make the
+        move. The
+        list is computed once per decision point and reused until the
+        player's hand, energy, runes/power or base, or any battlefield's units,
+        change. Treat it as read-only.
+        """
+
+        return self._legal_entry(player)[1]
+
+    def legal_mask(self, player: Player) -> Tuple[bool, ...]:
+        """``legal_actions`` as a fixed-size mask indexed by :meth:`action_index`.
+
+        Raises ``ValueError`` if a legal play sits past ``MAX_HAND_SLOTS`` in
+        the hand, since the mask has no position for it.
+        """
+
+        entry = self._legal_entry(player)
+        if entry[2] is None:
+            mask = [False] * self.action_space_size
+            for action in entry[1]:
+                index = self.action_index(action)
+                if index is None:
+                    raise ValueError(
+                        f"Hand of {len(player.hand)} cards does not fit the "
+                        f"{MAX_HAND_SLOTS}-slot action mask"
+                    )
+                mask[index] = True
+            entry[2] = tuple(mask)
+        return entry[2]
 
-    # ====== PHASE HELPERS ======
-
-    def _ready_active_units(self, active: str) -> None:
-        player = self.gs.get_player(active)
-        player.ready_base_units()
-        for bf in self.gs.battlefields:
-            bf.ready_side(active)
-
-    def _phase_beginning(self, active: str) -> int:
-        for bf in self.gs.battlefields:
-            bf.begin_turn_reset()
-        for bf in self.gs.battlefields:
-            bf.last_controller = bf.controller()
-        for bf in self.gs.battlefields:
-            if bf.units_A and bf.units_B:
-                bf.contested_this_turn = True
-                if bf.controller() is None:
-                    bf.showdown_pending = True
+    @property
+    def action_space_size(self) -> int:
+        lanes = len(self.gs.battlefields)
+        return 1 + MAX_HAND_SLOTS * lanes + (lanes + 1) * lanes
+
+    def action_index(self, action: Action) -> Optional[int]:
+        """Position of ``action`` in the mask: PASS, then card slot x lane, then MOVEs.
+
+        Returns ``None`` for actions the mask cannot represent (hand slots past
+        ``MAX_HAND_SLOTS`` or out-of-range lanes).
+        """
+
+        kind = action[0]
+        lanes = len(self.gs.battlefields)
+        if kind == "PASS":
+            return 0
+        if kind == "MOVE":
+            src, dst = action[2], action[3] if len(action) > 3 else None
+            if src is None or dst is None or src == dst or not (0 <= src <= lanes and 0 <= dst <= lanes):
+                return None
+            return 1 + MAX_HAND_SLOTS * lanes + src * lanes + (dst if dst < src else dst - 1)
+        idx, lane = action[1], action[2]
+        if idx is None or lane is None or not (0 <= idx < MAX_HAND_SLOTS and 0 <= lane < lanes):
+            return None
+        return 1 + idx * lanes + lane
+
+    def action_from_index(self, index: int, player: Player) -> Action:
+        """Inverse of :meth:`action_index`; card kinds are read from ``player``'s hand."""
+
+        lanes = len(self.gs.battlefields)
+        if index == 0:
+            return PASS_ACTION
+        cards = MAX_HAND_SLOTS * lanes
+        if 1 <= index <= cards:
+            idx, lane = divmod(index - 1, lanes)
+            card = player.hand[idx] if idx < len(player.hand) else None
+            if isinstance(card, UnitCard):
+                return ("UNIT", idx, lane)  # type: ignore[return-value]
+            if isinstance(card, SpellCard):
+                return ("SPELL", idx, lane)  # type: ignore[return-value]
+            if isinstance(card, GearCard):
+                return ("GEAR", idx, lane)  # type: ignore[return-value]
+            return PASS_ACTION
+        src, rest = divmod(index - 1 - cards, lanes)
+        if not 0 <= src <= lanes:
+            raise ValueError(f"Action index {index} out of range")
+        dst = rest if rest < src else rest + 1
+        return ("MOVE", None, src, dst)
+
+    def _generate_legal_actions(self, player: Player) -> List[Action]:
+        side = player.side
+        lanes = range(len(self.gs.battlefields))
+        actions: List[Action] = [PASS_ACTION]
+        for idx, card in enumerate(player.hand):
+            if isinstance(card, UnitCard):
+                kind = "UNIT"
+            elif isinstance(card, SpellCard):
+                kind = "SPELL"
+            elif isinstance(card, GearCard):
+                kind = "GEAR"
+            else:
+                continue
+            if not player.can_pay_cost(card.cost_energy, card.cost_power):
+                continue
+            for lane in lanes:
+                actions.append((kind, idx, lane))  # type: ignore[arg-type]
+
+        # MOVE sources are the lanes and then the base (index ``base``).
+        base = len(self.gs.battlefields)
+        for src in range(base + 1):
+            units = player.base_units if src == base else self.gs.battlefields[src].units[side]
+            mover = next((unit for unit in units if unit.ready), None)
+            if mover is None:
+                continue
+            for dst in range(base + 1):
+                if dst == src:
+                    continue
+                # Lane-to-lane moves only happen for GANKING units; otherwise the unit stays put.
+                if src != base and dst != base and not mover.has_keyword(Keyword.GANKING):
+                    continue
+                actions.append(("MOVE", None, src, dst))
+        return actions
 
-        self._ready_active_units(active)
+    # ====== PHASE HELPERS ======
 
-        active_player = self.gs.get_player(active)
+    def _phase_beginning(self, active: int | str) -> int:
+        side = side_index(active)
+        active_player = self.gs.players[side]
+        active_player.ready_base_units()
         active_player.unlock_runes(2)
         active_player.channel()
-        opposing_player = self.gs.get_player(self.gs.other(active))
+        opposing_player = self.gs.players[1 - side]
         opposing_player.channel()
 
-
+        # One pass per lane: reset, note the holder, ready units, then Hold.
         vps = 0
         for bf in self.gs.battlefields:
-            if bf.can_score_hold(active):
+            bf.start_turn(side)
+            if bf.can_score_hold(side):
                 vps += 1
-                bf.mark_scored(active)
+                bf.mark_scored(side)
         return vps
 
     def _phase_draw(self, ap: Player) -> None:
@@ -226,28 +326,21 @@ class GameLoop:
         actor: Player,
         opponent: Player,
     ) -> None:
-        spec = CARD_REGISTRY.get(card.name)
-        effect_specs: list[EffectSpec] = []
-        if spec and spec.effects:
-            effect_specs = list(spec.effects)
-        elif getattr(card, "effects", None):
-            try:
-                effect_specs = [EffectSpec.from_dict(e) for e in card.effects]  # type: ignore[arg-type]
-            except Exception:
-                effect_specs = []
-
-        context = EffectContext(self, card, actor, opponent, battlefield)
-
-        if not effect_specs:
-            if isinstance(card, SpellCard):
-                context.deal_damage(int(getattr(card, "damage", 0)), target="opponent")
+        # Effects were compiled when the card definition was loaded.
+        handlers = card.handlers
+        if not handlers:
             return
-
-        for effect_spec in effect_specs:
-            handler = EFFECT_REGISTRY.get(effect_spec.effect)
-            if not handler:
-                continue
-            handler(context, effect_spec.params)        
+        # One context per loop, rebound for each resolution (effects never nest).
+        context = self._effect_context
+        if context is None:
+            context = self._effect_context = EffectContext(self, card, actor, opponent, battlefield)
+        else:
+            context.card = card
+            context.actor = actor
+            context.opponent = opponent
+            context.battlefield = battlefield
+        for handler in handlers:
+            handler(context)
 
     def _apply_action(self, ap: Player, action: Action) -> None:
         if len(action) == 3:  # type: ignore[arg-type]
@@ -256,14 +349,15 @@ class GameLoop:
         else:
             kind, idx, lane, dst_lane = action
 
-        if lane is not None and not (0 <= lane < len(self.gs.battlefields)):
-            lane = 0
-        if dst_lane is not None and not (0 <= dst_lane < len(self.gs.battlefields) + 1):
-            dst_lane = None
-
         base_index = len(self.gs.battlefields)
+        # MOVE endpoints may also name the base, one past the last lane.
+        last = base_index if kind == "MOVE" else base_index - 1
+        if lane is not None and not 0 <= lane <= last:
+            raise ValueError(f"{kind} lane {lane} is out of range (0..{last})")
+        if dst_lane is not None and not 0 <= dst_lane <= base_index:
+            raise ValueError(f"{kind} destination {dst_lane} is out of range (0..{base_index})")
 
-        opponent = self.gs.get_player(self.gs.other(self.gs.active))           
+        opponent = self.gs.players[1 - self.gs.side]
 
         if kind == "UNIT" and idx is not None and 0 <= idx < len(ap.hand):
             card = ap.hand[idx]
@@ -273,12 +367,12 @@ class GameLoop:
                 if not ap.pay_cost(card.cost_energy, card.cost_power):
                     return
                 target: Battlefield = self.gs.battlefields[lane if lane is not None else 0]
-                unit = UnitInPlay(card=card, ready=card.has_keyword("ACCELERATE"))
-                target.add_unit(self.gs.active, unit)
+                unit = UnitInPlay(card=card, ready=card.has_keyword(Keyword.ACCELERATE))
+                target.add_unit(self.gs.side, unit)
                 if not unit.ready:
                     unit.ready = False
                 ap.remove_from_hand(idx)
-                self.units_played += 1
+                self._set(self, "units_played", self.units_played + 1)
                 if self.recorder:
                     self.recorder.record_play(
                         ap.name,
@@ -299,7 +393,7 @@ class GameLoop:
                 target: Battlefield = self.gs.battlefields[lane if lane is not None else 0]
                 self._resolve_card_effects(card, target, ap, opponent)
                 ap.remove_from_hand(idx)
-                self.spells_cast += 1
+                self._set(self, "spells_cast", self.spells_cast + 1)
                 if self.recorder:
                     self.recorder.record_play(
                         ap.name,
@@ -332,13 +426,8 @@ class GameLoop:
             dst = dst_lane
             if src is None or dst is None or src == dst:
                 return
-            if src not in range(len(self.gs.battlefields) + 1):
-                return
-            if dst not in range(len(self.gs.battlefields) + 1):
-                return
             
-            side = self.gs.active
-            base = ap.base_units
+            side = self.gs.side
 
             if src == base_index:
                 if dst == base_index:
@@ -346,7 +435,7 @@ class GameLoop:
                 unit = ap.pop_base_unit()
                 if unit is None:
                     return
-                unit.ready = False
+                self._set(unit, "ready", False)
                 target_bf = self.gs.battlefields[dst]
                 target_bf.add_unit(side, unit)
             elif dst == base_index:
@@ -354,49 +443,141 @@ class GameLoop:
                 unit = src_bf.pop_unit_for_movement(side)
                 if unit is None:
                     return
-                unit.ready = True
-                base.append(unit)
+                self._set(unit, "ready", True)
+                ap.add_base_unit(unit)
             else:
                 src_bf = self.gs.battlefields[src]
                 dst_bf = self.gs.battlefields[dst]
                 unit = src_bf.pop_unit_for_movement(side)
                 if unit is None:
                     return
-                if not unit.has_keyword("GANKING"):
+                if not unit.has_keyword(Keyword.GANKING):
                     src_bf.add_unit(side, unit)
-                    unit.ready = True
+                    self._set(unit, "ready", True)
                     return
-                unit.ready = False
+                self._set(unit, "ready", False)
                 dst_bf.add_unit(side, unit)
 
-    def _phase_showdown(self, active: str, opponent: str) -> None:
+    def _phase_showdown(self, active: int, opponent: int) -> None:
         for bf in self.gs.battlefields:
             if bf.showdown_pending and bf.controller() is None:
                 # Placeholder: acknowledge showdown without additional actions
-                bf.showdown_pending = False
+                self._set(bf, "showdown_pending", False)
 
-    def _phase_combat_and_conquer(self, active: str) -> None:
+    def _phase_combat_and_conquer(self, active: int | str) -> None:
+        side = side_index(active)
 
+        recorder = self.recorder
         for bf in self.gs.battlefields:
-            before_A = list(bf.units_A)
-            before_B = list(bf.units_B)
             if bf.contested_this_turn:
-                bf.resolve_combat_might()
-                if self.recorder:
+                if recorder:
+                    # Lanes are only copied when deaths are being logged.
+                    before_A = list(bf.units_A)
+                    before_B = list(bf.units_B)
+                    bf.resolve_combat_might()
                     self._record_combat_deaths(bf, before_A, before_B)
-                if bf.can_score_conquer(active):
-                    if active == "A":
-                        self.gs.points_A += 1
-                    else:
-                        self.gs.points_B += 1
-                    bf.mark_scored(active)
+                else:
+                    bf.resolve_combat_might()
+                if bf.can_score_conquer(side):
+                    self._add_points(side, 1)
+                    bf.mark_scored(side)
+
+
+    # ====== UNDO JOURNAL ======
+
+    def _set(self, obj: object, name: str, value: object) -> None:
+        if self.journal is not None:
+            self.journal.record_attr(obj, name)
+        setattr(obj, name, value)
+        if self.zobrist is not None:
+            if obj is self.gs:
+                self.zobrist.state_changed()
+            elif isinstance(obj, Battlefield):
+                self.zobrist.flags_changed(obj)
+
+    def _add_points(self, side: int, amount: int) -> None:
+        points = self.gs.points
+        if self.journal is not None:
+            self.journal.record_item(points, side)
+        points[side] += amount
+        if self.zobrist is not None:
+            self.zobrist.state_changed()
+
+    def enable_journal(self) -> UndoJournal:
+        """Journal every state change from now on so it can be rolled back.
+
+        Attaches one :class:`UndoJournal` to the loop, both players and every
+        battlefield. Recorder output is not journaled, so search should run
+        without a recorder.
+        """
+
+        journal = UndoJournal()
+        self.journal = journal
+        self.gs.A.journal = journal
+        self.gs.B.journal = journal
+        for bf in self.gs.battlefields:
+            bf.journal = journal
+        if self.zobrist is not None:
+            self.zobrist.journal = journal
+        return journal
+
+    def enable_hashing(self, *, debug: bool = False) -> ZobristHasher:
+        """Maintain a 64-bit position hash, read in O(1) from ``zobrist.value``.
+
+        The hash covers hands, deck order, energy, runes, base and lane units,
+        battlefield flags, VP, the active player and the turn. With ``debug``
+        every read is checked against a full recomputation. Undo restores the
+        hash along with the state.
+        """
+
+        hasher = ZobristHasher(self.gs, debug=debug)
+        hasher.journal = self.journal
+        self.zobrist = hasher
+        self.gs.A.zobrist = hasher
+        self.gs.B.zobrist = hasher
+        for bf in self.gs.battlefields:
+            bf.zobrist = hasher
+        return hasher
+
+    def apply(self, action: Action) -> int:
+        """Apply ``action`` for the active player; return a mark for :meth:`undo`."""
+
+        if self.journal is None:
+            raise RuntimeError("Call enable_journal() before apply()/undo()")
+        mark = self.journal.mark()
+        self._apply_action(self.gs.players[self.gs.side], action)
+        return mark
+
+    def undo(self, mark: int) -> None:
+        """Roll the game back to the position where ``mark`` was taken.
+
+        Marks come from :meth:`apply` or :meth:`UndoJournal.mark`, so a whole
+        line of play (several actions and turn steps) can be undone at once.
+        """
 
+        if self.journal is None:
+            raise RuntimeError("Call enable_journal() before apply()/undo()")
+        self.journal.rollback(mark)
 
     # ====== MAIN LOOP ======
 
-    def start(self) -> Result:
+    def _check_victory(self) -> Optional[Result]:
         gs = self.gs
+        points = gs.points
+        if points[0] >= gs.victory_score:
+            winner = "A"
+        elif points[1] >= gs.victory_score:
+            winner = "B"
+        else:
+            return None
+        if self.recorder:
+            self._snapshot_state()
+        return Result(winner, gs.turn, self.units_played, self.spells_cast)
 
+    def setup(self) -> None:
+        """Opening hands and runes, before turn 1."""
+
+        gs = self.gs
         for _ in range(5):
             card_a = gs.A.draw()
             card_b = gs.B.draw()
@@ -412,55 +593,42 @@ class GameLoop:
         if self.recorder:
             self._snapshot_state(turn_override=0)
 
-        while gs.turn <= gs.max_turns:
-            gained = self._phase_beginning(gs.active)
-            if gained:
-                if gs.active == "A":
-                    gs.points_A += gained
-                else:
-                    gs.points_B += gained
-                if gs.points_A >= gs.victory_score:
-                    if self.recorder:
-                        self._snapshot_state()
-                    return Result("A", gs.turn, self.units_played, self.spells_cast)
-                if gs.points_B >= gs.victory_score:
-                    if self.recorder:
-                        self._snapshot_state()
-                    return Result("B", gs.turn, self.units_played, self.spells_cast)
-
-
-            ap: Player = gs.get_player(gs.active)
-            op: Player = gs.get_player(gs.other(gs.active))
-            self._phase_draw(ap)
-
-
-            if ap.agent is None:
-                act: Action = ("PASS", None, None)
-            else:
-                act = ap.agent.decide_action(op)
-            self._apply_action(ap, act)
+    def begin_turn(self) -> Optional[Result]:
+        """Beginning phase (Hold scoring) and draw; returns the result if the game ends."""
 
-            self._phase_showdown(gs.active, gs.other(gs.active))
+        gs = self.gs
+        gained = self._phase_beginning(gs.side)
+        if gained:
+            self._add_points(gs.side, gained)
+            result = self._check_victory()
+            if result:
+                return result
 
-            self._phase_combat_and_conquer(gs.active)
-            if gs.points_A >= gs.victory_score:
-                if self.recorder:
-                    self._snapshot_state()
-                return Result("A", gs.turn, self.units_played, self.spells_cast)
-            if gs.points_B >= gs.victory_score:
-                if self.recorder:
-                    self._snapshot_state()
-                return Result("B", gs.turn, self.units_played, self.spells_cast)
+        self._phase_draw(gs.players[gs.side])
+        return None
 
+    def end_turn(self) -> Optional[Result]:
+        """Showdown, combat and Conquer, then pass the turn; returns the result if the game ends."""
 
-            gs.active = gs.other(gs.active)
-            gs.turn += 1
-            if self.recorder:
-                self._snapshot_state()
+        gs = self.gs
+        self._phase_showdown(gs.side, 1 - gs.side)
+        self._phase_combat_and_conquer(gs.side)
+        result = self._check_victory()
+        if result:
+            return result
+
+        self._set(gs, "side", 1 - gs.side)
+        self._set(gs, "turn", gs.turn + 1)
+        if self.recorder:
+            self._snapshot_state()
+        return None
 
-        if gs.points_A > gs.points_B:
+    def result_at_turn_limit(self) -> Result:
+        gs = self.gs
+        points_a, points_b = gs.points
+        if points_a > points_b:
             winner = "A"
-        elif gs.points_B > gs.points_A:
+        elif points_b > points_a:
             winner = "B"
         else:
             winner = "DRAW"
@@ -468,6 +636,29 @@ class GameLoop:
             self._snapshot_state()
         return Result(winner, gs.turn - 1, self.units_played, self.spells_cast)
 
+    def start(self) -> Result:
+        gs = self.gs
+        self.setup()
+
+        while gs.turn <= gs.max_turns:
+            result = self.begin_turn()
+            if result:
+                return result
+
+            ap: Player = gs.players[gs.side]
+            op: Player = gs.players[1 - gs.side]
+            if ap.agent is None:
+                act: Action = ("PASS", None, None)
+            else:
+                act = ap.agent.decide_action(op)
+            self._apply_action(ap, act)
+
+            result = self.end_turn()
+            if result:
+                return result
+
+        return self.result_at_turn_limit()
+
     def _snapshot_state(self, *, turn_override: Optional[int] = None) -> None:
         if not self.recorder:
             return
@@ -549,10 +740,9 @@ class GameLoop:
         if not self.recorder:
             return
 
-        remaining = {getattr(unit.card, "uuid", None) for unit in after}
+        remaining = {unit.card.uid for unit in after}
         for unit in before:
-            uuid = getattr(unit.card, "uuid", None)
-            if uuid not in remaining:
+            if unit.card.uid not in remaining:
                 self.recorder.record_play(
                     owner,
                     self.gs.turn,
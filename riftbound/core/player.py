@@ -1,15 +1,33 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Deque, Dict, List, Mapping, Optional, Tuple
+import copy
 import random
 
 from .cards import Card
 from .combat import UnitInPlay
 from .enums import Domain
+from .journal import new_stamp
 
+if TYPE_CHECKING:
+    from .battlefield import Battlefield
+    from .journal import UndoJournal
+    from .zobrist import ZobristHasher
 
-@dataclass
+# Rune and power counters are indexed by domain in channel order (by name).
+DOMAIN_ORDER = tuple(sorted(Domain, key=lambda d: d.name))
+DOMAIN_SLOT = {domain: slot for slot, domain in enumerate(DOMAIN_ORDER)}
+MAX_RUNES_IN_PLAY = 12
+
+
+def _counters() -> List[int]:
+    return [0] * len(DOMAIN_ORDER)
+
+
+@dataclass(slots=True)
 class Rune:
     domain: Domain
     ready: bool = True
@@ -23,21 +41,33 @@ class Rune:
     def refresh(self) -> None:
         self.ready = True
 
-@dataclass
+    def clone(self) -> "Rune":
+        return Rune(self.domain, self.ready)
+
+@dataclass(slots=True)
 class RuneDeck:
-    runes: List[Rune]
+    """Runes waiting to be unlocked: drawn from the front, recycled to the back."""
+
+    runes: Deque[Rune]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.runes, deque):
+            self.runes = deque(self.runes)
 
     def draw(self) -> Optional[Rune]:
         if not self.runes:
             return None
-        return self.runes.pop(0)
+        return self.runes.popleft()
 
     def recycle(self, rune: Rune) -> None:
         rune.refresh()
         self.runes.append(rune)
 
+    def clone(self) -> "RuneDeck":
+        return RuneDeck(deque([rune.clone() for rune in self.runes]))
+
 
-@dataclass
+@dataclass(slots=True)
 class Deck:
     cards: List[Card]
 
@@ -49,8 +79,11 @@ class Deck:
             return None
         return self.cards.pop()
 
+    def clone(self) -> "Deck":
+        return Deck(list(self.cards))
+
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     hp: int = 10  # legacy; not used in VP rules but kept for compatibility
@@ -61,81 +94,196 @@ class Player:
     energy: int = 0
 
     rune_deck: RuneDeck = field(default_factory=lambda: RuneDeck([]))
-    rune_pool: Dict[Domain, List[Rune]] = field(default_factory=dict)
-    power_pool: Dict[Domain, int] = field(default_factory=dict)
+    # Runes in play and power tokens as per-domain counts, indexed by DOMAIN_SLOT.
+    runes_ready: List[int] = field(default_factory=_counters)
+    runes_exhausted: List[int] = field(default_factory=_counters)
+    power: List[int] = field(default_factory=_counters)
     base_units: List[UnitInPlay] = field(default_factory=list)
-
-    def add_rune(self, domain: Domain, *, ready: bool = True) -> Rune:
-        rune = Rune(domain=domain, ready=ready)
-        self.rune_pool.setdefault(domain, []).append(rune)
-        return rune
+    # Injected by GameLoop so agents can inspect the lanes.
+    battlefields: List["Battlefield"] = field(default_factory=list, repr=False, compare=False)
+    # Engine index of the seat this player occupies (0 = A, 1 = B), assigned by
+    # GameState; ``name`` is only a label.
+    side: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Set by GameLoop.enable_journal(); mutators log how to undo themselves.
+    journal: Optional["UndoJournal"] = field(default=None, repr=False, compare=False)
+    # Set by GameLoop.enable_hashing(); mutators report changes to the hasher.
+    zobrist: Optional["ZobristHasher"] = field(default=None, repr=False, compare=False)
+    # Fresh on every change to hand, energy, runes/power or base; keys GameLoop.legal_actions().
+    stamp: int = field(default_factory=new_stamp, repr=False, compare=False)
+
+    def _touch(self) -> None:
+        if self.journal is not None:
+            self.journal.record_attr(self, "stamp")
+        self.stamp = new_stamp()
+
+    def _runes_changed(self) -> None:
+        self._touch()
+        if self.zobrist is not None:
+            self.zobrist.runes_changed(self)
+
+    def _base_changed(self) -> None:
+        self._touch()
+        if self.zobrist is not None:
+            self.zobrist.base_changed(self)
+
+    def _log_runes(self) -> None:
+        journal = self.journal
+        journal.record_list(self.runes_ready)
+        journal.record_list(self.runes_exhausted)
+        journal.record_list(self.power)
+
+    def _set_energy(self, value: int) -> None:
+        if self.journal is not None:
+            self.journal.record_attr(self, "energy")
+        self.energy = value
+        self._touch()
+        if self.zobrist is not None:
+            self.zobrist.energy_changed(self)
+
+    @property
+    def rune_pool(self) -> Mapping[Domain, Tuple[Rune, ...]]:
+        """Read-only view of the runes in play per domain, exhausted ones first.
+
+        Built from the counters on each access. It cannot be written to: put
+        runes into play with :meth:`add_rune` or through the counters.
+        """
+
+        pool: Dict[Domain, Tuple[Rune, ...]] = {}
+        for domain, ready, exhausted in zip(DOMAIN_ORDER, self.runes_ready, self.runes_exhausted):
+            if ready or exhausted:
+                pool[domain] = tuple(Rune(domain, False) for _ in range(exhausted)) + tuple(
+                    Rune(domain) for _ in range(ready)
+                )
+        return MappingProxyType(pool)
+
+    @property
+    def power_pool(self) -> Mapping[Domain, int]:
+        """Read-only view of unspent power tokens per domain (domains with none omitted)."""
+
+        return MappingProxyType(
+            {domain: count for domain, count in zip(DOMAIN_ORDER, self.power) if count}
+        )
+
+    def add_rune(self, domain: Domain, *, ready: bool = True) -> None:
+        """Put one ``domain`` rune into play (ready or exhausted).
+
+        Runes in play are counters, not objects; read them back through
+        ``runes_ready``/``runes_exhausted`` or the read-only ``rune_pool``.
+        """
+
+        if self.journal is not None:
+            self._log_runes()
+        slot = DOMAIN_SLOT[domain]
+        if ready:
+            self.runes_ready[slot] += 1
+        else:
+            self.runes_exhausted[slot] += 1
+        self._runes_changed()
 
     def total_runes_in_play(self) -> int:
-        return sum(len(runes) for runes in self.rune_pool.values())
+        return sum(self.runes_ready) + sum(self.runes_exhausted)
 
     def unlock_runes(self, n: int = 2) -> None:
         """Bring n runes from the deck into play (max 12 total)."""
 
-        for _ in range(n):
-            if self.total_runes_in_play() >= 12:
-                break
-            rune = self.rune_deck.draw()
-            if rune is None:
-                break
-            rune.refresh()
-            self.rune_pool.setdefault(rune.domain, []).append(rune)
+        runes = self.rune_deck.runes
+        take = min(n, MAX_RUNES_IN_PLAY - self.total_runes_in_play(), len(runes))
+        if take <= 0:
+            self._runes_changed()
+            return
+        journal = self.journal
+        if journal is not None:
+            self._log_runes()
+        ready = self.runes_ready
+        zobrist = self.zobrist
+        for _ in range(take):
+            if journal is not None:
+                journal.record_pop(runes, 0)
+            domain = runes.popleft().domain
+            ready[DOMAIN_SLOT[domain]] += 1
+            if zobrist is not None:
+                zobrist.rune_drawn(self, domain)
+        self._runes_changed()
 
     def recycle_rune(self, domain: Domain) -> bool:
         """Recycle one rune of the given domain (move from play to bottom of deck)."""
 
-        runes = self.rune_pool.get(domain, [])
-        if not runes:
+        slot = DOMAIN_SLOT[domain]
+        if not (self.runes_exhausted[slot] or self.runes_ready[slot]):
             return False
-        rune = runes.pop(0)
-        if not runes:
-            self.rune_pool.pop(domain, None)
-        self.rune_deck.recycle(rune)
+        if self.journal is not None:
+            self._log_runes()
+            self.journal.record_append(self.rune_deck.runes)
+        # Spent runes go first, as they sit at the front of the pool.
+        if self.runes_exhausted[slot]:
+            self.runes_exhausted[slot] -= 1
+        else:
+            self.runes_ready[slot] -= 1
+        self.rune_deck.runes.append(Rune(domain))
+        if self.zobrist is not None:
+            self.zobrist.rune_recycled(self, domain)
+        self._runes_changed()
         return True
 
     def channel(self) -> None:
-        """Channel up to two ready runes, producing energy and power tokens."""
+        """Channel up to two ready runes, producing energy and power tokens.
+
+        Every rune is readied first, then domains are channelled in name order.
+        """
 
-        # Refresh all runes at the beginning of the channel step
-        for runes in self.rune_pool.values():
-            for rune in runes:
-                rune.refresh()
+        if self.journal is not None:
+            self._log_runes()
+            self.journal.record_attr(self, "energy")
 
+        ready = self.runes_ready
+        exhausted = self.runes_exhausted
+        power = self.power
         channels_remaining = 2
-        for domain in sorted(self.rune_pool, key=lambda d: d.name):
-            runes = self.rune_pool[domain]
-            for rune in runes:
-                if channels_remaining <= 0:
-                    break
-                if rune.ready:
-                    result = rune.activate()
-                    if result is not None:
-                        self.energy += 1
-                        self.power_pool[result] = self.power_pool.get(result, 0) + 1
-                        channels_remaining -= 1
-            if channels_remaining <= 0:
-                break
+        for slot in range(len(DOMAIN_ORDER)):
+            count = ready[slot] + exhausted[slot]
+            used = count if count < channels_remaining else channels_remaining
+            ready[slot] = count - used
+            exhausted[slot] = used
+            power[slot] += used
+            channels_remaining -= used
+        self.energy += 2 - channels_remaining
+
+        self._touch()
+        if self.zobrist is not None:
+            self.zobrist.runes_changed(self)
+            self.zobrist.energy_changed(self)
 
     def ready_base_units(self) -> None:
+        journal = self.journal
         for unit in self.base_units:
+            if journal is not None and not unit.ready:
+                journal.record_attr(unit, "ready")
             unit.ready = True
+        self._base_changed()
 
     def pop_base_unit(self) -> Optional[UnitInPlay]:
         for idx, unit in enumerate(self.base_units):
             if unit.ready:
-                return self.base_units.pop(idx)
+                if self.journal is not None:
+                    self.journal.record_pop(self.base_units, idx)
+                self.base_units.pop(idx)
+                self._base_changed()
+                return unit
         return None
 
+    def add_base_unit(self, unit: UnitInPlay) -> None:
+        if self.journal is not None:
+            self.journal.record_append(self.base_units)
+        self.base_units.append(unit)
+        self._base_changed()
+
     def can_pay(self, cost: int) -> bool:
         return self.energy >= cost
 
     def pay(self, cost: int) -> bool:
         if self.energy >= cost:
-            self.energy -= cost
+            self._set_energy(self.energy - cost)
             return True
         return False
 
@@ -144,29 +292,73 @@ class Player:
             return False
         if cost_power is None:
             return True
-        if self.power_pool.get(cost_power, 0) <= 0:
+        slot = DOMAIN_SLOT[cost_power]
+        if self.power[slot] <= 0:
             return False
-        return bool(self.rune_pool.get(cost_power))
+        return bool(self.runes_ready[slot] or self.runes_exhausted[slot])
 
     def pay_cost(self, cost_energy: int = 0, cost_power: Optional[Domain] = None) -> bool:
         if not self.can_pay_cost(cost_energy, cost_power):
             return False
-        self.energy -= cost_energy
+        self._set_energy(self.energy - cost_energy)
         if cost_power is not None:
-            current = self.power_pool.get(cost_power, 0) - 1
-            if current <= 0:
-                self.power_pool.pop(cost_power, None)
-            else:
-                self.power_pool[cost_power] = current
+            slot = DOMAIN_SLOT[cost_power]
+            if self.journal is not None:
+                self.journal.record_item(self.power, slot)
+            self.power[slot] -= 1
+            self._runes_changed()
             if not self.recycle_rune(cost_power):
                 return False
         return True
 
     def draw(self) -> Optional[Card]:
+        journal = self.journal
+        if journal is not None and self.deck.cards:
+            journal.record_pop(self.deck.cards, len(self.deck.cards) - 1)
+            journal.record_append(self.hand)
         card = self.deck.draw()
         if card:
             self.hand.append(card)
+            self._touch()
+            if self.zobrist is not None:
+                self.zobrist.deck_popped(self, len(self.deck.cards), card)
+                self.zobrist.hand_added(self, card)
         return card
 
     def remove_from_hand(self, idx: int) -> None:
+        if self.journal is not None:
+            self.journal.record_pop(self.hand, idx)
+        if self.zobrist is not None:
+            self.zobrist.hand_removed(self, self.hand[idx])
         del self.hand[idx]
+        self._touch()
+
+    def clone(self) -> "Player":
+        """Copy this player's mutable state, sharing the (immutable) card objects.
+
+        The agent, if any, is shallow-copied, re-pointed at the new player and
+        detached from its loop.
+        ``battlefields`` is left empty for the caller to rebind.
+        """
+
+        copy_ = Player(
+            name=self.name,
+            hp=self.hp,
+            hand=list(self.hand),
+            deck=self.deck.clone(),
+            energy=self.energy,
+            rune_deck=self.rune_deck.clone(),
+            runes_ready=list(self.runes_ready),
+            runes_exhausted=list(self.runes_exhausted),
+            power=list(self.power),
+            base_units=[unit.clone() for unit in self.base_units],
+        )
+        copy_.side = self.side
+        if self.agent is not None:
+            agent = copy.copy(self.agent)
+            agent.player = copy_
+            # The copy belongs to no loop until a GameLoop is built around it.
+            if getattr(agent, "loop", None) is not None:
+                agent.loop = None
+            copy_.agent = agent
+        return copy_
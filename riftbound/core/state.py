@@ -1,39 +1,140 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field, replace
 from typing import Optional
 import random
 from .player import Player
 from .battlefield import Battlefield
 from .cards import LegendCard
+from .enums import SIDE_INDEX, SIDE_NAMES, side_index
 
 
-@dataclass
+@dataclass(slots=True)
 class LegendZone:
     legend: LegendCard
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
+    """Whole-game state. Sides are indices internally: ``players[side]``,
+    ``points[side]`` and ``side`` (whose turn it is); ``A``/``B``,
+    ``active``, ``points_A``/``points_B``, ``get_player`` and ``other`` are
+    views that keep the "A"/"B" names for callers, and the constructor still
+    accepts them.
+    """
+
     rng: random.Random
-    A: Player
-    B: Player
+    A: InitVar[Player]
+    B: InitVar[Player]
 
     turn: int = 1
     max_turns: int = 40
-    active: str = "A"
+    side: int = 0  # active side
 
     legend_A: Optional[LegendCard] = None
     legend_B: Optional[LegendCard] = None
 
     # Victory points via Hold/Conquer
-    points_A: int = 0
-    points_B: int = 0
+    points: list[int] = field(default_factory=lambda: [0, 0])
     victory_score: int = 8  # Duel Mode default
 
     # Exactly two battlefields total in 1v1
     battlefields: list[Battlefield] = field(default_factory=lambda: [Battlefield(), Battlefield()])
 
+    # Name-keyed spellings of ``side`` and ``points``; ``None`` keeps those as given.
+    active: InitVar[Optional[str]] = None
+    points_A: InitVar[Optional[int]] = None
+    points_B: InitVar[Optional[int]] = None
+
+    players: list[Player] = field(init=False)
+
+    def __post_init__(
+        self,
+        A: Player,
+        B: Player,
+        active: Optional[str],
+        points_A: Optional[int],
+        points_B: Optional[int],
+    ) -> None:
+        # The seat, not the player's name, decides which side a player plays.
+        A.side = 0
+        B.side = 1
+        self.players = [A, B]
+        if active is not None:
+            if active not in SIDE_INDEX:
+                raise ValueError(f"active must be one of {SIDE_NAMES}, got {active!r}")
+            self.side = SIDE_INDEX[active]
+        if points_A is not None:
+            self.points[0] = points_A
+        if points_B is not None:
+            self.points[1] = points_B
+
     def other(self, who: str) -> str:
         return "B" if who == "A" else "A"
 
-    def get_player(self, who: str) -> Player:
-        return self.A if who == "A" else self.B
+    def get_player(self, who: int | str) -> Player:
+        return self.players[side_index(who)]
+
+    def clone(self) -> "GameState":
+        """Independent copy for search and what-if analysis.
+
+        Much cheaper than ``copy.deepcopy``: card objects (hands, decks, units,
+        legends) are shared because the engine never mutates a dealt card, and
+        only runtime state is copied - zones, unit damage/ready flags, runes,
+        energy, VP, battlefield flags and the RNG state.
+        """
+
+        # Skip Random.__init__: seeding from the OS would be wasted work.
+        rng = random.Random.__new__(type(self.rng))
+        rng.setstate(self.rng.getstate())
+        battlefields = [bf.clone() for bf in self.battlefields]
+        players = []
+        for player in self.players:
+            copy_ = player.clone()
+            if player.battlefields:
+                copy_.battlefields = battlefields
+            players.append(copy_)
+        return replace(
+            self,
+            rng=rng,
+            A=players[0],
+            B=players[1],
+            points=list(self.points),
+            battlefields=battlefields,
+        )
+
+
+# Attached after the class body: the names above are InitVar constructor
+# parameters, so the properties cannot be declared alongside them.
+def _player_view(side: int) -> property:
+    def get(self: GameState) -> Player:
+        return self.players[side]
+
+    def set(self: GameState, player: Player) -> None:
+        player.side = side
+        self.players[side] = player
+
+    return property(get, set, doc=f"Player on side {SIDE_NAMES[side]}.")
+
+
+def _points_view(side: int) -> property:
+    def get(self: GameState) -> int:
+        return self.points[side]
+
+    def set(self: GameState, value: int) -> None:
+        self.points[side] = value
+
+    return property(get, set, doc=f"Victory points of side {SIDE_NAMES[side]}.")
+
+
+def _get_active(self: GameState) -> str:
+    return SIDE_NAMES[self.side]
+
+
+def _set_active(self: GameState, who: str) -> None:
+    self.side = side_index(who)
+
+
+GameState.A = _player_view(0)
+GameState.B = _player_view(1)
+GameState.points_A = _points_view(0)
+GameState.points_B = _points_view(1)
+GameState.active = property(_get_active, _set_active, doc="Name of the side whose turn it is.")
@@ -0,0 +1,249 @@
+"""Incrementally maintained 64-bit position hashes for :class:`GameState`.
+
+Each position is described by a set of *features* (a card in a hand, a card at
+a deck position, a unit in a lane, a player's energy, ...). Every feature maps
+to a fixed pseudo-random 64-bit key and the position hash is the sum of the
+keys modulo 2**64. Summing rather than XOR-ing keeps duplicate features (two
+copies of the same card in hand) from cancelling out.
+
+Features are grouped into components so that mutators only touch what they
+change: drawing a card moves one key from the deck component to the hand
+component, while small structures such as a lane's unit list or a player's
+rune pool are re-summed from scratch when they change. The rune deck, drawn
+from the front and recycled to the back, weights the key of the rune at
+position ``i`` by ``RUNE_STEP ** i``; a draw or recycle is then one multiply
+and one add. Reading the hash is O(1). With ``debug=True`` every read is
+checked against a full recomputation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from .enums import SIDE_NAMES
+from .player import DOMAIN_ORDER
+
+if TYPE_CHECKING:
+    from .battlefield import Battlefield
+    from .combat import UnitInPlay
+    from .journal import UndoJournal
+    from .player import Player
+    from .state import GameState
+
+MASK = (1 << 64) - 1
+
+ComponentKey = Tuple[Hashable, ...]
+
+
+@lru_cache(maxsize=1 << 16)
+def feature_key(*feature: Hashable) -> int:
+    """Deterministic 64-bit key for ``feature`` (stable across processes)."""
+
+    digest = hashlib.blake2b(repr(feature).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+# Odd, so it is invertible modulo 2**64 and a draw can shift the whole deck down.
+RUNE_STEP = feature_key("rune_step") | 1
+_RUNE_STEP_INVERSE = pow(RUNE_STEP, -1, 1 << 64)
+
+
+def _unit_feature(unit: "UnitInPlay") -> Tuple[Hashable, ...]:
+    return (unit.card.name, unit.might, unit.ready, unit.damage)
+
+
+def _units_component(tag: Tuple[Hashable, ...], units: Iterable["UnitInPlay"]) -> int:
+    return sum(feature_key(*tag, pos, *_unit_feature(u)) for pos, u in enumerate(units)) & MASK
+
+
+class ZobristMismatch(RuntimeError):
+    """Raised in debug mode when the incremental hash drifts from a recomputation."""
+
+
+class ZobristHasher:
+    """Keeps ``value`` equal to the hash of ``gs`` as the game is played.
+
+    Attach it with :meth:`GameLoop.enable_hashing`, which wires the hasher
+    into both players and every battlefield so their mutators report changes.
+    """
+
+    def __init__(self, gs: "GameState", *, debug: bool = False) -> None:
+        self.gs = gs
+        self.debug = debug
+        self.journal: Optional["UndoJournal"] = None
+        self._lanes: Dict[int, int] = {id(bf): i for i, bf in enumerate(gs.battlefields)}
+        self.components: Dict[ComponentKey, int] = compute_components(gs)
+        self._value = sum(self.components.values()) & MASK
+
+    @property
+    def value(self) -> int:
+        if self.debug:
+            self.verify()
+        return self._value
+
+    def verify(self) -> None:
+        """Compare against a from-scratch recomputation, naming stale components."""
+
+        fresh = compute_components(self.gs)
+        stale = sorted(
+            (str(key) for key in set(fresh) | set(self.components)
+             if fresh.get(key, 0) != self.components.get(key, 0)),
+        )
+        expected = sum(fresh.values()) & MASK
+        if stale or expected != self._value:
+            raise ZobristMismatch(
+                f"Incremental hash {self._value:#018x} != recomputed {expected:#018x}; "
+                f"stale components: {', '.join(stale) or '(none)'}"
+            )
+
+    # ---- primitive updates ---------------------------------------------------
+
+    def _store(self, key: ComponentKey, new: int) -> None:
+        old = self.components.get(key, 0)
+        if old == new:
+            return
+        if self.journal is not None:
+            self.journal.record_dict(self.components, key)
+            self.journal.record_attr(self, "_value")
+        self.components[key] = new
+        self._value = (self._value + new - old) & MASK
+
+    def add_feature(self, key: ComponentKey, *feature: Hashable) -> None:
+        self._store(key, (self.components.get(key, 0) + feature_key(*key, *feature)) & MASK)
+
+    def remove_feature(self, key: ComponentKey, *feature: Hashable) -> None:
+        self._store(key, (self.components.get(key, 0) - feature_key(*key, *feature)) & MASK)
+
+    # ---- notifications from mutators ---------------------------------------------
+
+    def deck_popped(self, player: "Player", index: int, card: Any) -> None:
+        self.remove_feature(("deck", SIDE_NAMES[player.side]), index, card.name)
+
+    def hand_added(self, player: "Player", card: Any) -> None:
+        self.add_feature(("hand", SIDE_NAMES[player.side]), card.name)
+
+    def hand_removed(self, player: "Player", card: Any) -> None:
+        self.remove_feature(("hand", SIDE_NAMES[player.side]), card.name)
+
+    def energy_changed(self, player: "Player") -> None:
+        self._store(("energy", SIDE_NAMES[player.side]), feature_key("energy", SIDE_NAMES[player.side], player.energy))
+
+    def runes_changed(self, player: "Player") -> None:
+        self._store(("runes", SIDE_NAMES[player.side]), _runes_component(player))
+
+    def rune_drawn(self, player: "Player", domain: Any) -> None:
+        """``domain`` left the front of the rune deck; every later rune moves up one."""
+
+        key = ("rune_deck", SIDE_NAMES[player.side])
+        front = feature_key(*key, domain.name)
+        self._store(key, (self.components.get(key, 0) - front) * _RUNE_STEP_INVERSE & MASK)
+
+    def rune_recycled(self, player: "Player", domain: Any) -> None:
+        """``domain`` was appended to the back of the rune deck."""
+
+        key = ("rune_deck", SIDE_NAMES[player.side])
+        weight = pow(RUNE_STEP, len(player.rune_deck.runes) - 1, 1 << 64)
+        self._store(key, (self.components.get(key, 0) + feature_key(*key, domain.name) * weight) & MASK)
+
+    def base_changed(self, player: "Player") -> None:
+        tag = ("base", SIDE_NAMES[player.side])
+        self._store(tag, _units_component(tag, player.base_units))
+
+    def unit_added(self, bf: "Battlefield", side: int, unit: "UnitInPlay") -> None:
+        lane = self._lanes.get(id(bf))
+        if lane is None:
+            return
+        units = bf.units[side]
+        self.add_feature(("lane", lane, SIDE_NAMES[side]), len(units) - 1, *_unit_feature(unit))
+
+    def lane_changed(self, bf: "Battlefield", side: Optional[int] = None) -> None:
+        lane = self._lanes.get(id(bf))
+        if lane is None:
+            return
+        for s in (0, 1) if side is None else (side,):
+            tag = ("lane", lane, SIDE_NAMES[s])
+            self._store(tag, _units_component(tag, bf.units[s]))
+
+    def flags_changed(self, bf: "Battlefield") -> None:
+        lane = self._lanes.get(id(bf))
+        if lane is not None:
+            self._store(("flags", lane), _flags_component(lane, bf))
+
+    def state_changed(self) -> None:
+        self._store(("state",), _state_component(self.gs))
+
+
+# ---- from-scratch computation ----------------------------------------------------
+
+
+def _runes_component(player: "Player") -> int:
+    side = SIDE_NAMES[player.side]
+    total = 0
+    for domain, ready, exhausted, power in zip(
+        DOMAIN_ORDER, player.runes_ready, player.runes_exhausted, player.power
+    ):
+        if ready or exhausted:
+            total += feature_key("pool", side, domain.name, exhausted, ready)
+        if power:
+            total += feature_key("power", side, domain.name, power)
+    return total & MASK
+
+
+def _rune_deck_component(player: "Player") -> int:
+    key = ("rune_deck", SIDE_NAMES[player.side])
+    total = 0
+    for rune in reversed(player.rune_deck.runes):
+        total = (total * RUNE_STEP + feature_key(*key, rune.domain.name)) & MASK
+    return total
+
+
+def _flags_component(lane: int, bf: "Battlefield") -> int:
+    return feature_key(
+        "flags",
+        lane,
+        bf.contested_this_turn,
+        bf.scored_this_turn_A,
+        bf.scored_this_turn_B,
+        bf.last_controller,
+        bf.showdown_pending,
+    )
+
+
+def _state_component(gs: "GameState") -> int:
+    return feature_key("state", gs.points_A, gs.points_B, gs.active, gs.turn)
+
+
+def compute_components(gs: "GameState") -> Dict[ComponentKey, int]:
+    """Every hash component of ``gs`` computed from scratch."""
+
+    components: Dict[ComponentKey, int] = {("state",): _state_component(gs)}
+    for player in (gs.A, gs.B):
+        side = SIDE_NAMES[player.side]
+        hand = ("hand", side)
+        deck = ("deck", side)
+        base = ("base", side)
+        components[hand] = sum(feature_key(*hand, c.name) for c in player.hand) & MASK
+        components[deck] = (
+            sum(feature_key(*deck, i, c.name) for i, c in enumerate(player.deck.cards)) & MASK
+        )
+        components[("energy", side)] = feature_key("energy", side, player.energy)
+        components[("runes", side)] = _runes_component(player)
+        components[("rune_deck", side)] = _rune_deck_component(player)
+        components[base] = _units_component(base, player.base_units)
+    for lane, bf in enumerate(gs.battlefields):
+        for side, units in (("A", bf.units_A), ("B", bf.units_B)):
+            tag = ("lane", lane, side)
+            components[tag] = _units_component(tag, units)
+        components[("flags", lane)] = _flags_component(lane, bf)
+    return components
+
+
+def compute_hash(gs: "GameState") -> int:
+    """Hash of ``gs`` recomputed from scratch (what ``ZobristHasher.value`` tracks)."""
+
+    return sum(compute_components(gs).values()) & MASK
+
+
+__all__ = ["ZobristHasher", "ZobristMismatch", "compute_hash", "feature_key"]
@@ -0,0 +1,128 @@
+"""Bulk maintenance of simulation databases: merging shards, trimming runs."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from riftbound.data.session import make_engine
+
+# Tables keyed to ``games.id`` through a ``game_id`` column, copied after ``games``.
+GAME_CHILD_TABLES = ("decks", "draws", "hands", "boards", "plays", "turns")
+
+_GAME_COLUMNS = ("seed", "winner", "turns", "total_units_played", "total_spells_cast")
+
+
+def _columns(conn: sqlite3.Connection, schema: str, table: str) -> List[str]:
+    rows = conn.execute(f"PRAGMA {schema}.table_info({table})").fetchall()
+    return [row[1] for row in rows]
+
+
+def merge_databases(target: str, sources: Iterable[str]) -> int:
+    """Append every game from ``sources`` into ``target``; return the number of games copied.
+
+    Rows are copied with ``ATTACH`` + ``INSERT ... SELECT`` so nothing is loaded
+    into Python. Each shard's ``games.id`` values are shifted past the highest id
+    already in ``target`` and child rows follow their game via ``game_id``.
+    Shards are appended in the order given, one transaction per shard.
+    """
+
+    # Let SQLAlchemy create the schema so the merged file matches make_session().
+    make_engine(target).dispose()
+
+    conn = sqlite3.connect(target, isolation_level=None)
+    copied = 0
+    try:
+        conn.execute("PRAGMA synchronous = OFF")
+        for source in sources:
+            if not Path(source).exists():
+                raise FileNotFoundError(f"Shard database '{source}' does not exist")
+            conn.execute("ATTACH DATABASE ? AS shard", (source,))
+            try:
+                copied += _merge_attached(conn)
+            finally:
+                conn.execute("DETACH DATABASE shard")
+    finally:
+        conn.close()
+    return copied
+
+
+def last_game_id(db_path: str) -> Optional[int]:
+    """Highest ``games.id`` in ``db_path``, or ``None`` when it has no games."""
+
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT MAX(id) FROM games").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def discard_games_after(db_path: str, game_id: Optional[int]) -> int:
+    """Delete games with ``id > game_id`` (all games when ``None``) and their rows.
+
+    Used on resume to drop games committed after the last checkpoint, so the
+    database matches the checkpointed counters. Returns the games removed.
+    """
+
+    threshold = 0 if game_id is None else game_id
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        tables = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        if "games" not in tables:
+            return 0
+        conn.execute("BEGIN")
+        for table in GAME_CHILD_TABLES:
+            if table in tables:
+                conn.execute(f"DELETE FROM {table} WHERE game_id > ?", (threshold,))
+        removed = conn.execute("DELETE FROM games WHERE id > ?", (threshold,)).rowcount
+        conn.execute("COMMIT")
+        return removed
+    finally:
+        conn.close()
+
+
+def _merge_attached(conn: sqlite3.Connection) -> int:
+    shard_tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM shard.sqlite_master WHERE type = 'table'")
+    }
+    if "games" not in shard_tables:
+        return 0
+
+    conn.execute("BEGIN")
+    try:
+        offset = conn.execute("SELECT COALESCE(MAX(id), 0) FROM main.games").fetchone()[0]
+        columns = ", ".join(_GAME_COLUMNS)
+        cursor = conn.execute(
+            f"INSERT INTO main.games (id, {columns}) "
+            f"SELECT id + ?, {columns} FROM shard.games ORDER BY id",
+            (offset,),
+        )
+        games = cursor.rowcount
+
+        for table in GAME_CHILD_TABLES:
+            if table not in shard_tables:
+                continue
+            shard_columns = set(_columns(conn, "shard", table))
+            names = [
+                name
+                for name in _columns(conn, "main", table)
+                if name != "id" and name in shard_columns
+            ]
+            select = ", ".join("game_id + ?" if name == "game_id" else name for name in names)
+            conn.execute(
+                f"INSERT INTO main.{table} ({', '.join(names)}) "
+                f"SELECT {select} FROM shard.{table} ORDER BY id",
+                (offset,),
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return games
+
+
+__all__ = ["GAME_CHILD_TABLES", "discard_games_after", "last_game_id", "merge_databases"]
@@ -0,0 +1,566 @@
+"""Genetic search over decklists, scored by win rate against a fixed gauntlet.
+
+A candidate is a :class:`DeckGenome`: canonical card and rune counts, so every
+route to the same list hashes alike. :func:`optimize_deck` caches evaluations
+by genome and never plays a deck twice. Candidates play each
+:class:`Opponent` with alternating seats on the same game seeds, so score
+differences come from the decks rather than the shuffles.
+
+Evaluation is raced. A generation's new decks first play ``screen_games`` per
+opponent. Decks whose Wilson upper bound already falls below the best fully
+evaluated score are cut there, and only the survivors play the rest of
+``games``. Both stages go through one worker pool that lives for the whole
+search.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from riftbound.core.cards_registry import CARD_REGISTRY, _parse_domain
+from riftbound.core.decklist import _MAIN_CATEGORIES, DeckTemplate, load_decklist
+from riftbound.core.enums import Domain
+from riftbound.core.player import DOMAIN_SLOT
+from riftbound.simulate import (
+    GameTask,
+    MatchSettings,
+    game_seeds,
+    resolve_agent,
+    run_tasks,
+    worker_pool,
+)
+from riftbound.stats import wilson_interval, z_score
+from riftbound.tournament import default_agents
+
+
+@dataclass(frozen=True)
+class DeckGenome:
+    """A deck as card counts (by name) and rune counts (in channel order).
+
+    Equal lists compare and hash equal whatever order they were built in.
+    """
+
+    cards: Tuple[Tuple[str, int], ...]
+    runes: Tuple[Tuple[Domain, int], ...]
+    legend: Optional[str] = None
+
+    @classmethod
+    def from_counts(
+        cls,
+        cards: Mapping[str, int],
+        runes: Mapping[Domain, int],
+        legend: Optional[str] = None,
+    ) -> "DeckGenome":
+        return cls(
+            cards=tuple(sorted((name, count) for name, count in cards.items() if count > 0)),
+            runes=tuple(
+                sorted(
+                    ((domain, count) for domain, count in runes.items() if count > 0),
+                    key=lambda item: DOMAIN_SLOT[item[0]],
+                )
+            ),
+            legend=legend,
+        )
+
+    @classmethod
+    def from_template(cls, template: DeckTemplate) -> "DeckGenome":
+        runes: Counter = Counter()
+        for domain, count in template.runes:
+            runes[domain] += count
+        legend = None if template.legend is None else template.legend.name
+        return cls.from_counts(Counter(card.name for card in template.cards), runes, legend)
+
+    @property
+    def size(self) -> int:
+        return sum(count for _, count in self.cards)
+
+    def decklist(self) -> str:
+        """The genome as decklist text (see :mod:`riftbound.core.decklist`)."""
+
+        lines = [] if self.legend is None else [f"Legend: {self.legend}"]
+        lines += ["Main:"] + [f"{count} {name}" for name, count in self.cards]
+        if self.runes:
+            lines += ["Runes:"] + [f"{count} {domain.name.title()}" for domain, count in self.runes]
+        return "\n".join(lines) + "\n"
+
+    @property
+    def digest(self) -> str:
+        """Short content hash of the list, used as the compiled deck's name."""
+
+        return hashlib.sha1(self.decklist().encode("utf-8")).hexdigest()[:12]
+
+    def template(self) -> DeckTemplate:
+        cards: list = []
+        for name, count in self.cards:
+            cards += [CARD_REGISTRY[name].prototype] * count
+        legend = None if self.legend is None else CARD_REGISTRY[self.legend].prototype
+        return DeckTemplate(name=self.digest, cards=tuple(cards), runes=self.runes, legend=legend)
+
+
+@dataclass(frozen=True)
+class DeckSpace:
+    """The decks a search may visit: fixed deck and rune-deck sizes, a card
+    pool and the domains runes may come from."""
+
+    pool: Tuple[str, ...]
+    domains: Tuple[Domain, ...]
+    size: int
+    rune_count: int
+    max_copies: int
+
+    @classmethod
+    def around(
+        cls,
+        genome: DeckGenome,
+        *,
+        domains: Optional[Sequence[Domain]] = None,
+        max_copies: Optional[int] = None,
+    ) -> "DeckSpace":
+        """Main-deck cards in ``domains`` (default: the domains ``genome`` uses).
+
+        Colourless cards are always allowed. Raises ``ValueError`` when
+        ``genome`` itself breaks the constraints.
+        """
+
+        if domains is None:
+            used = {CARD_REGISTRY[name].domain for name, _ in genome.cards}
+            used.update(domain for domain, _ in genome.runes)
+            used.discard(None)
+            domains = used
+        allowed = tuple(sorted(set(domains), key=DOMAIN_SLOT.__getitem__))
+        if max_copies is not None and max_copies < 1:
+            raise ValueError("max_copies must be at least 1")
+        pool = tuple(
+            spec.name
+            for spec in CARD_REGISTRY.index.query(category=_MAIN_CATEGORIES, domain=[*allowed, None])
+            if spec.cost_power is None or spec.cost_power in allowed
+        )
+        space = cls(
+            pool=pool,
+            domains=allowed,
+            size=genome.size,
+            rune_count=sum(count for _, count in genome.runes),
+            max_copies=genome.size if max_copies is None else max_copies,
+        )
+        space.check(genome)
+        return space
+
+    def check(self, genome: DeckGenome) -> None:
+        pool = set(self.pool)
+        for name, count in genome.cards:
+            if name not in pool:
+                raise ValueError(f"'{name}' is not a main-deck card in domains {self._domain_names()}")
+            if count > self.max_copies:
+                raise ValueError(f"{count} copies of '{name}', at most {self.max_copies} allowed")
+        for domain, _ in genome.runes:
+            if domain not in self.domains:
+                raise ValueError(f"{domain.name.title()} runes are outside domains {self._domain_names()}")
+        if genome.size != self.size:
+            raise ValueError(f"the deck has {genome.size} cards, expected {self.size}")
+
+    def _domain_names(self) -> str:
+        return ", ".join(domain.name.title() for domain in self.domains) or "(none)"
+
+    def mutate(self, genome: DeckGenome, rng: random.Random, swaps: int = 1) -> DeckGenome:
+        """Apply ``swaps`` one-for-one swaps of a card copy or a rune.
+
+        Every copy in the deck and rune deck is equally likely to be replaced,
+        so sizes never change.
+        """
+
+        cards = Counter(dict(genome.cards))
+        runes = Counter(dict(genome.runes))
+        total = self.size + self.rune_count
+        for _ in range(swaps):
+            if len(self.domains) > 1 and rng.randrange(total) < self.rune_count:
+                out = rng.choice(list(runes.elements()))
+                runes[out] -= 1
+                runes[rng.choice([domain for domain in self.domains if domain is not out])] += 1
+                continue
+            out = rng.choice(list(cards.elements()))
+            choices = [name for name in self.pool if name != out and cards[name] < self.max_copies]
+            if choices:
+                cards[out] -= 1
+                cards[rng.choice(choices)] += 1
+        return DeckGenome.from_counts(cards, runes, genome.legend)
+
+    def crossover(self, a: DeckGenome, b: DeckGenome, rng: random.Random) -> DeckGenome:
+        """A child drawn from both parents' copies, at the same sizes."""
+
+        cards = _mix(a.cards, b.cards, self.size, self.max_copies, rng)
+        runes = _mix(a.runes, b.runes, self.rune_count, self.rune_count, rng)
+        return DeckGenome.from_counts(cards, runes, a.legend)
+
+
+def _mix(a, b, size: int, cap: int, rng: random.Random) -> Counter:
+    # Each parent alone fills ``size`` under ``cap``, so the shuffled union always can.
+    copies = list(Counter(dict(a)).elements()) + list(Counter(dict(b)).elements())
+    rng.shuffle(copies)
+    child: Counter = Counter()
+    taken = 0
+    for item in copies:
+        if taken == size:
+            break
+        if child[item] < cap:
+            child[item] += 1
+            taken += 1
+    return child
+
+
+@dataclass(frozen=True)
+class Opponent:
+    """A gauntlet entry: an agent playing a fixed deck (``None``: the starter deck)."""
+
+    agent: str
+    deck: Optional[DeckTemplate] = None
+
+    @property
+    def label(self) -> str:
+        return self.agent if self.deck is None else f"{self.agent}@{self.deck.name}"
+
+
+def default_gauntlet() -> List[Opponent]:
+    """Every distinct heuristic agent with the starter deck."""
+
+    return [Opponent(name) for name in default_agents()]
+
+
+def parse_gauntlet(text: str) -> List[Opponent]:
+    """Parse comma-separated ``AGENT`` or ``AGENT@DECKLIST`` entries."""
+
+    opponents = []
+    for entry in text.split(","):
+        agent, sep, path = entry.partition("@")
+        agent = agent.strip()
+        if not agent:
+            continue
+        resolve_agent(agent)
+        deck = None
+        if sep:
+            path = path.strip()
+            if not path:
+                raise ValueError(f"'{entry.strip()}': the decklist path is missing")
+            try:
+                deck = load_decklist(path)
+            except FileNotFoundError:
+                raise ValueError(f"no decklist at {path}") from None
+            except OSError as exc:
+                raise ValueError(f"cannot read decklist {path!r}: {exc.strerror or exc}") from None
+        opponents.append(Opponent(agent, deck))
+    if not opponents:
+        raise ValueError("the gauntlet is empty")
+    return opponents
+
+
+def parse_domains(text: str) -> List[Domain]:
+    """Parse comma-separated domain names or letter codes."""
+
+    domains = [_parse_domain(part) for part in text.split(",") if part.strip()]
+    if not domains:
+        raise ValueError("no domains given")
+    return domains
+
+
+@dataclass
+class Evaluation:
+    """Points (draws count half) a deck scored over the games it played."""
+
+    points: float = 0.0
+    games: int = 0
+    # False when the deck was cut after screening.
+    complete: bool = False
+
+    @property
+    def score(self) -> float:
+        return self.points / self.games if self.games else 0.0
+
+
+@dataclass
+class GenerationSummary:
+    generation: int
+    best_score: float
+    mean_score: float
+    evaluated: int
+    cache_hits: int
+    cut: int
+
+
+@dataclass
+class OptimizeReport:
+    """The best deck found plus search and throughput figures."""
+
+    start: DeckGenome
+    start_score: float
+    best: DeckGenome
+    best_score: float
+    history: List[GenerationSummary] = field(default_factory=list)
+    evaluated: int = 0
+    cache_hits: int = 0
+    cut: int = 0
+    games_played: int = 0
+    games_saved: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def decks_per_hour(self) -> float:
+        return self.evaluated * 3600.0 / self.elapsed if self.elapsed else 0.0
+
+
+class _Evaluator:
+    """Plays candidates against the gauntlet, caching and racing evaluations."""
+
+    def __init__(
+        self,
+        gauntlet: Sequence[Opponent],
+        agent: str,
+        games: int,
+        screen_games: int,
+        z: float,
+        victory_score: int,
+        seed: int,
+        workers: int,
+        chunk_size: Optional[int],
+        pool,
+    ):
+        self.gauntlet = list(gauntlet)
+        self.agent = agent
+        self.games = games
+        self.screen_games = screen_games
+        self.z = z
+        self.victory_score = victory_score
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.pool = pool
+        base_rng = random.Random(seed)
+        # The same seeds for every candidate (common random numbers).
+        self.seeds = [
+            [game_seed for _, game_seed in game_seeds(base_rng.randrange(1 << 30), 0, games)]
+            for _ in self.gauntlet
+        ]
+        self.cache: Dict[DeckGenome, Evaluation] = {}
+        self.best: Optional[DeckGenome] = None
+        self.cache_hits = 0
+        self.cut = 0
+        self.games_played = 0
+        self.games_saved = 0
+
+    @property
+    def best_score(self) -> float:
+        return -1.0 if self.best is None else self.cache[self.best].score
+
+    def score(self, genome: DeckGenome) -> float:
+        return self.cache[genome].score
+
+    def ranked(self, genomes: Sequence[DeckGenome]) -> List[DeckGenome]:
+        """Distinct fully evaluated ``genomes``, best first (the incumbent if there are none).
+
+        Decks cut at screening only have a partial score, so they never
+        survive as elites or become parents.
+        """
+
+        complete = [genome for genome in dict.fromkeys(genomes) if self.cache[genome].complete]
+        return sorted(complete, key=lambda genome: -self.cache[genome].score) or [self.best]
+
+    def _tasks(self, templates: Sequence[DeckTemplate], start: int, stop: int) -> Iterator[GameTask]:
+        for template in templates:
+            for opponent, seeds in zip(self.gauntlet, self.seeds):
+                as_a = MatchSettings(
+                    ai_a=self.agent, ai_b=opponent.agent, victory_score=self.victory_score,
+                    deck_a=template, deck_b=opponent.deck,
+                )
+                as_b = MatchSettings(
+                    ai_a=opponent.agent, ai_b=self.agent, victory_score=self.victory_score,
+                    deck_a=opponent.deck, deck_b=template,
+                )
+                for index in range(start, stop):
+                    # The candidate takes seat A on even games and B on odd ones.
+                    yield index, seeds[index], as_a if index % 2 == 0 else as_b
+
+    def _play(self, genomes: Sequence[DeckGenome], templates: Sequence[DeckTemplate], start: int, stop: int) -> None:
+        per_deck = len(self.gauntlet) * (stop - start)
+        if not genomes or per_deck <= 0:
+            return
+        chunk_size = self.chunk_size
+        if chunk_size is None:
+            chunk_size = max(1, min(64, per_deck * len(genomes) // (self.workers * 8)))
+        outcomes = run_tasks(
+            self._tasks(templates, start, stop),
+            workers=self.workers,
+            chunk_size=chunk_size,
+            pool=self.pool,
+        )
+        for position, outcome in enumerate(outcomes):
+            evaluation = self.cache[genomes[position // per_deck]]
+            winner = outcome.result.winner
+            seat = "A" if outcome.index % 2 == 0 else "B"
+            evaluation.points += 1.0 if winner == seat else 0.5 if winner not in ("A", "B") else 0.0
+            evaluation.games += 1
+        self.games_played += per_deck * len(genomes)
+
+    def evaluate(self, genomes: Sequence[DeckGenome]) -> Tuple[int, int, int]:
+        """Score every genome not yet cached; returns ``(new, cache hits, cut)``."""
+
+        fresh = list(dict.fromkeys(genome for genome in genomes if genome not in self.cache))
+        hits = len(genomes) - len(fresh)
+        for genome in fresh:
+            self.cache[genome] = Evaluation()
+        templates = [genome.template() for genome in fresh]
+
+        self._play(fresh, templates, 0, self.screen_games)
+        survivors = list(range(len(fresh)))
+        if self.best is not None and self.screen_games < self.games:
+            bar = self.best_score
+            survivors = [
+                i for i in survivors
+                if wilson_interval(self.cache[fresh[i]].points, self.cache[fresh[i]].games, self.z)[1] >= bar
+            ]
+        cut = len(fresh) - len(survivors)
+        self._play(
+            [fresh[i] for i in survivors],
+            [templates[i] for i in survivors],
+            self.screen_games,
+            self.games,
+        )
+
+        for i in survivors:
+            genome = fresh[i]
+            self.cache[genome].complete = True
+            if self.cache[genome].score > self.best_score:
+                self.best = genome
+        self.cache_hits += hits
+        self.cut += cut
+        self.games_saved += cut * len(self.gauntlet) * (self.games - self.screen_games)
+        return len(fresh), hits, cut
+
+
+def _select(ranked: Sequence[DeckGenome], score: Callable[[DeckGenome], float], rng: random.Random) -> DeckGenome:
+    # Binary tournament: the better of two random members.
+    a, b = rng.choice(ranked), rng.choice(ranked)
+    return a if score(a) >= score(b) else b
+
+
+def optimize_deck(
+    start: DeckTemplate,
+    *,
+    gauntlet: Optional[Sequence[Opponent]] = None,
+    agent: str = "aggro",
+    generations: int = 10,
+    population: int = 12,
+    elite: int = 2,
+    games: int = 40,
+    screen_games: Optional[int] = None,
+    swaps: int = 2,
+    domains: Optional[Sequence[Domain]] = None,
+    max_copies: Optional[int] = None,
+    confidence: float = 0.95,
+    victory_score: int = 8,
+    seed: int = 42,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    progress: Optional[Callable[[GenerationSummary], None]] = None,
+) -> OptimizeReport:
+    """Search for the deck that scores best against ``gauntlet``.
+
+    ``start`` seeds the first population and fixes the deck and rune-deck
+    sizes. Each generation keeps the ``elite`` best decks and fills the rest
+    with crossovers of tournament-selected parents, each mutated by one to
+    ``swaps`` swaps. A full evaluation is ``games`` games per opponent;
+    ``screen_games`` (default a quarter of that) is the cheap first pass.
+    Results do not depend on ``workers``.
+    """
+
+    gauntlet = list(gauntlet) if gauntlet else default_gauntlet()
+    if games < 1:
+        raise ValueError("games must be at least 1")
+    if screen_games is None:
+        screen_games = max(1, games // 4)
+    if not 1 <= screen_games <= games:
+        raise ValueError("screen_games must be between 1 and games")
+    if generations < 1 or population < 1:
+        raise ValueError("generations and population must be at least 1")
+    if not 0 <= elite <= population:
+        raise ValueError("elite must be between 0 and population")
+    if swaps < 1:
+        raise ValueError("swaps must be at least 1")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    resolve_agent(agent)
+    z = z_score(confidence)
+
+    first = DeckGenome.from_template(start)
+    try:
+        space = DeckSpace.around(first, domains=domains, max_copies=max_copies)
+    except ValueError as exc:
+        raise ValueError(f"Decklist '{start.name}': {exc}") from None
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    pool = worker_pool(workers) if workers > 1 else None
+    try:
+        evaluator = _Evaluator(
+            gauntlet, agent, games, screen_games, z, victory_score,
+            rng.randrange(1 << 30), workers, chunk_size, pool,
+        )
+        evaluator.evaluate([first])
+        start_score = evaluator.score(first)
+        history: List[GenerationSummary] = []
+        members = [first] + [space.mutate(first, rng, rng.randint(1, swaps)) for _ in range(population - 1)]
+        for generation in range(1, generations + 1):
+            fresh, hits, cut = evaluator.evaluate(members)
+            ranked = evaluator.ranked(members)
+            summary = GenerationSummary(
+                generation=generation,
+                best_score=evaluator.best_score,
+                mean_score=sum(evaluator.score(genome) for genome in members) / len(members),
+                evaluated=fresh,
+                cache_hits=hits,
+                cut=cut,
+            )
+            history.append(summary)
+            if progress is not None:
+                progress(summary)
+            if generation == generations:
+                break
+            members = ranked[:elite]
+            while len(members) < population:
+                mother = _select(ranked, evaluator.score, rng)
+                father = _select(ranked, evaluator.score, rng)
+                child = space.crossover(mother, father, rng) if mother != father else mother
+                members.append(space.mutate(child, rng, rng.randint(1, swaps)))
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return OptimizeReport(
+        start=first,
+        start_score=start_score,
+        best=evaluator.best,
+        best_score=evaluator.best_score,
+        history=history,
+        evaluated=len(evaluator.cache),
+        cache_hits=evaluator.cache_hits,
+        cut=evaluator.cut,
+        games_played=evaluator.games_played,
+        games_saved=evaluator.games_saved,
+        elapsed=time.perf_counter() - started,
+    )
+
+
+__all__ = [
+    "DeckGenome",
+    "DeckSpace",
+    "Evaluation",
+    "GenerationSummary",
+    "OptimizeReport",
+    "Opponent",
+    "default_gauntlet",
+    "optimize_deck",
+    "parse_domains",
+    "parse_gauntlet",
+]
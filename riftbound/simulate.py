@@ -0,0 +1,355 @@
+"""Library entry points for running Riftbound games without the CLI.
+
+:func:`iter_games` is a lazy generator: games are played (in-process or on a
+worker pool) only as the caller consumes them, and nothing is retained once an
+outcome has been yielded, so arbitrarily long runs use constant memory and can
+be abandoned at any point.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Tuple
+
+from riftbound.ai.heuristics.simple_aggro import SimpleAggro
+from riftbound.ai.heuristics.simple_control import SimpleControl
+from riftbound.core.decklist import DeckTemplate, compile_decklist
+from riftbound.core.loop import GameLoop, Result
+from riftbound.core.player import Deck, Player, RuneDeck
+from riftbound.core.state import GameState
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from multiprocessing.pool import Pool
+
+
+AI_REGISTRY = {
+    "aggro": SimpleAggro,
+    "control": SimpleControl,
+    "ahri": SimpleControl,
+    "jynx": SimpleAggro,
+}
+
+# Agents imported on first use (``module:attribute``) and then added to
+# AI_REGISTRY; the search agent's modules are not needed for heuristic games.
+LAZY_AGENTS = {
+    "mcts": "riftbound.ai.search.mcts:MCTSAgent",
+}
+
+
+def resolve_agent(name: str):
+    key = name.strip().lower()
+    if key not in AI_REGISTRY and key in LAZY_AGENTS:
+        module, _, attribute = LAZY_AGENTS[key].partition(":")
+        AI_REGISTRY[key] = getattr(importlib.import_module(module), attribute)
+    if key not in AI_REGISTRY:
+        available = [*AI_REGISTRY, *(k for k in LAZY_AGENTS if k not in AI_REGISTRY)]
+        raise ValueError(f"Unknown AI '{name}'. Available: {', '.join(available)}")
+    return AI_REGISTRY[key]
+
+
+def make_agent(name: str, player: Player):
+    return resolve_agent(name)(player)
+
+
+STARTER_DECKLIST = """\
+Main:
+10 Stalwart Recruit
+10 Bolt
+Runes:
+6 Calm
+6 Fury
+"""
+
+
+@lru_cache(maxsize=None)
+def starter_deck() -> DeckTemplate:
+    """The default toy list (10 Units, 10 Spells, 6 Calm + 6 Fury runes), compiled once."""
+
+    return compile_decklist(STARTER_DECKLIST, name="starter")
+
+
+def make_simple_deck() -> Deck:
+    """Create a 20-card toy deck: 10 Units, 10 Spells."""
+
+    return starter_deck().deck()
+
+
+def make_basic_rune_deck(rng: Optional[random.Random] = None) -> RuneDeck:
+    """Create a basic rune deck with Calm and Fury runes."""
+
+    return starter_deck().rune_deck(rng)
+
+
+@dataclass(frozen=True)
+class MatchSettings:
+    """Everything besides the seed that determines how a game is played."""
+
+    ai_a: str
+    ai_b: str
+    victory_score: int = 8
+    starting_energy: int = 0
+    # Compiled decklists; ``None`` plays the starter deck.
+    deck_a: Optional[DeckTemplate] = None
+    deck_b: Optional[DeckTemplate] = None
+
+
+@dataclass
+class GameOutcome:
+    """Result of one game plus the final-state figures callers usually want."""
+
+    index: int
+    seed: int
+    result: Result
+    points_A: int
+    points_B: int
+    energy_A: int
+    energy_B: int
+    lanes: Tuple[Tuple[int, int, Optional[str]], ...]
+
+
+def build_game(game_seed: int, settings: MatchSettings) -> GameState:
+    """Set up the turn-1 :class:`GameState` that ``run_game`` plays from ``game_seed``."""
+
+    rng = random.Random(game_seed)
+    template_a = settings.deck_a or starter_deck()
+    template_b = settings.deck_b or starter_deck()
+
+    # Decks & shuffle
+    deckA = template_a.deck(rng)
+    deckB = template_b.deck(rng)
+
+    # Players
+    rune_rng_a = random.Random(rng.randrange(1 << 30))
+    rune_rng_b = random.Random(rng.randrange(1 << 30))
+
+    A = Player(
+        name="A",
+        hp=10,
+        deck=deckA,
+        energy=settings.starting_energy,
+        rune_deck=template_a.rune_deck(rune_rng_a),
+    )
+    B = Player(
+        name="B",
+        hp=10,
+        deck=deckB,
+        energy=settings.starting_energy,
+        rune_deck=template_b.rune_deck(rune_rng_b),
+    )
+
+    # Agents
+    A.agent = make_agent(settings.ai_a, A)
+    B.agent = make_agent(settings.ai_b, B)
+
+    return GameState(
+        rng=rng, A=A, B=B,
+        turn=1, max_turns=40,
+        victory_score=settings.victory_score,
+        legend_A=template_a.spawn_legend(),
+        legend_B=template_b.spawn_legend(),
+    )
+
+
+def run_game(
+    index: int,
+    game_seed: int,
+    settings: MatchSettings,
+    session=None,
+) -> GameOutcome:
+    """Play a single game from its seed, optionally logging it to ``session``."""
+
+    gs = build_game(game_seed, settings)
+    recorder = None
+    game_id = None
+    if session:
+        from riftbound.data.writer import GameRecorder, record_game
+
+        game_id = record_game(
+            session=session,
+            seed=game_seed,
+            winner="?",
+            turns=0,
+            total_units=0,
+            total_spells=0,
+        )
+        recorder = GameRecorder(session, game_id)
+        recorder.record_deck("A", gs.A.deck.cards, ai_name=settings.ai_a)
+        recorder.record_deck("B", gs.B.deck.cards, ai_name=settings.ai_b)
+
+    result = GameLoop(gs, recorder=recorder).start()
+
+    if session and game_id is not None:
+        record_game(
+            session=session,
+            seed=game_seed,
+            winner=result.winner,
+            turns=result.turns,
+            total_units=result.units_played,
+            total_spells=result.spells_cast,
+            game_id=game_id,
+        )
+
+    return GameOutcome(
+        index=index,
+        seed=game_seed,
+        result=result,
+        points_A=gs.points_A,
+        points_B=gs.points_B,
+        energy_A=gs.A.energy,
+        energy_B=gs.B.energy,
+        lanes=tuple(
+            (len(bf.units_A), len(bf.units_B), bf.controller()) for bf in gs.battlefields
+        ),
+    )
+
+
+def game_seeds(seed: int, start: int, stop: int) -> Iterator[Tuple[int, int]]:
+    """Yield ``(index, game_seed)`` for games ``start..stop-1`` of a run seeded with ``seed``.
+
+    Seeds for earlier games are still drawn (and discarded) so that any slice
+    sees exactly the seeds a complete run would assign to those indices.
+    """
+
+    base_rng = random.Random(seed)
+    for _ in range(start):
+        base_rng.randrange(1 << 30)
+    for i in range(start, stop):
+        # independent RNG per game
+        yield i, base_rng.randrange(1 << 30)
+
+
+def shard_range(games: int, k: int, n: int) -> Tuple[int, int]:
+    """Contiguous ``[start, stop)`` game-index slice owned by 1-based shard ``k`` of ``n``."""
+
+    if n < 1 or not 1 <= k <= n:
+        raise ValueError(f"Invalid shard {k}/{n}, need 1 <= k <= n")
+    return (k - 1) * games // n, k * games // n
+
+
+GameTask = Tuple[int, int, MatchSettings]
+
+
+def _init_worker() -> None:
+    # Load the registry and compile the starter deck once per worker, up front.
+    starter_deck()
+
+
+def _run_task(task: GameTask) -> GameOutcome:
+    index, game_seed, settings = task
+    return run_game(index, game_seed, settings)
+
+
+def worker_pool(workers: int) -> Pool:
+    """A process pool whose workers have the registry and starter deck loaded.
+
+    For callers that issue many task streams (see :func:`run_tasks`) and want
+    to pay the pool start-up once.
+    """
+
+    import multiprocessing
+
+    return multiprocessing.Pool(processes=workers, initializer=_init_worker)
+
+
+def run_tasks(
+    tasks: Iterable[GameTask],
+    *,
+    workers: int = 1,
+    chunk_size: int = 64,
+    pool: Optional[Pool] = None,
+) -> Iterator[GameOutcome]:
+    """Play ``(index, seed, settings)`` tasks, yielding outcomes in task order.
+
+    With ``workers > 1`` a single process pool serves the whole task stream, so
+    callers mixing several matchups keep every worker busy across them. Closing
+    the generator early terminates the pool. An existing ``pool`` (from
+    :func:`worker_pool`) is used instead, and left running, when given.
+    """
+
+    if pool is not None:
+        yield from pool.imap(_run_task, tasks, chunksize=chunk_size)
+        return
+    if workers <= 1:
+        for task in tasks:
+            yield _run_task(task)
+        return
+
+    with worker_pool(workers) as pool:
+        # imap keeps results in submission order, so seeds and winners line up
+        # with the sequential path game for game.
+        yield from pool.imap(_run_task, tasks, chunksize=chunk_size)
+
+
+def iter_games(
+    games: int,
+    *,
+    seed: int = 42,
+    settings: Optional[MatchSettings] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+    session=None,
+) -> Iterator[GameOutcome]:
+    """Lazily play games ``start..stop-1`` of a ``games``-game run.
+
+    Outcomes are yielded in game-index order with the same per-game seeds
+    whatever ``workers`` is. ``session`` enables database logging and is only
+    supported in-process.
+    """
+
+    if settings is None:
+        settings = MatchSettings(ai_a="aggro", ai_b="aggro")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if workers > 1 and session is not None:
+        raise ValueError("database logging requires workers=1")
+    for name in (settings.ai_a, settings.ai_b):
+        resolve_agent(name)
+    if stop is None:
+        stop = games
+    # Validation above runs eagerly; only the games themselves are lazy.
+    return _iter_games(seed, start, stop, settings, workers, chunk_size, session)
+
+
+def _iter_games(
+    seed: int,
+    start: int,
+    stop: int,
+    settings: MatchSettings,
+    workers: int,
+    chunk_size: Optional[int],
+    session,
+) -> Iterator[GameOutcome]:
+    seeds = game_seeds(seed, start, stop)
+    if workers <= 1:
+        for index, game_seed in seeds:
+            yield run_game(index, game_seed, settings, session=session)
+        return
+
+    if chunk_size is None:
+        chunk_size = max(1, min(512, (stop - start) // (workers * 16)))
+    tasks = ((index, game_seed, settings) for index, game_seed in seeds)
+    yield from run_tasks(tasks, workers=workers, chunk_size=chunk_size)
+
+
+__all__ = [
+    "AI_REGISTRY",
+    "LAZY_AGENTS",
+    "GameOutcome",
+    "MatchSettings",
+    "build_game",
+    "game_seeds",
+    "iter_games",
+    "make_agent",
+    "make_basic_rune_deck",
+    "make_simple_deck",
+    "resolve_agent",
+    "run_game",
+    "run_tasks",
+    "shard_range",
+    "worker_pool",
+]
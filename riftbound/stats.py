@@ -0,0 +1,196 @@
+"""Running match statistics and sequential stopping rules for simulation runs."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from riftbound.core.loop import Result
+
+
+@dataclass
+class MatchTally:
+    """Running counters for one A-vs-B matchup."""
+
+    games: int = 0
+    wins_A: int = 0
+    wins_B: int = 0
+    draws: int = 0
+    turns_total: int = 0
+
+    def add(self, result: Result) -> None:
+        self.games += 1
+        self.turns_total += result.turns
+        if result.winner == "A":
+            self.wins_A += 1
+        elif result.winner == "B":
+            self.wins_B += 1
+        else:
+            self.draws += 1
+
+    @property
+    def score_A(self) -> float:
+        """Player A's score with draws counted as half a win."""
+
+        return (self.wins_A + 0.5 * self.draws) / self.games if self.games else 0.0
+
+    @property
+    def avg_turns(self) -> float:
+        return self.turns_total / self.games if self.games else 0.0
+
+
+def z_score(confidence: float) -> float:
+    """Two-sided normal quantile for ``confidence`` (e.g. 0.95 -> 1.96)."""
+
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must be between 0 and 1")
+    from statistics import NormalDist  # pulls in decimal/fractions; only needed here
+
+    return NormalDist().inv_cdf(0.5 + confidence / 2.0)
+
+
+def wilson_interval(successes: float, n: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval for a proportion of ``successes`` out of ``n``."""
+
+    if n <= 0:
+        return 0.0, 1.0
+    p = successes / n
+    z2 = z * z
+    denom = 1.0 + z2 / n
+    centre = (p + z2 / (2 * n)) / denom
+    half = z * math.sqrt(max(0.0, p * (1.0 - p) / n + z2 / (4 * n * n))) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+@dataclass(frozen=True)
+class SPRT:
+    """Wald's sequential probability ratio test on A's win probability.
+
+    Tests H0: p = ``p0`` against H1: p = ``p1`` using decisive games only;
+    ``p0`` must be the lower of the two.
+    """
+
+    p0: float
+    p1: float
+    alpha: float = 0.05
+    beta: float = 0.05
+
+    def __post_init__(self) -> None:
+        if not (0.0 < self.p0 < 1.0 and 0.0 < self.p1 < 1.0):
+            raise ValueError("SPRT probabilities must be strictly between 0 and 1")
+        if self.p0 >= self.p1:
+            raise ValueError(f"SPRT needs p0 < p1, got p0={self.p0:g}, p1={self.p1:g}")
+        if not (0.0 < self.alpha < 1.0 and 0.0 < self.beta < 1.0):
+            raise ValueError("SPRT error rates must be strictly between 0 and 1")
+
+    @property
+    def lower_bound(self) -> float:
+        return math.log(self.beta / (1.0 - self.alpha))
+
+    @property
+    def upper_bound(self) -> float:
+        return math.log((1.0 - self.beta) / self.alpha)
+
+    def llr(self, wins: int, losses: int) -> float:
+        return wins * math.log(self.p1 / self.p0) + losses * math.log(
+            (1.0 - self.p1) / (1.0 - self.p0)
+        )
+
+    def decide(self, wins: int, losses: int) -> Optional[str]:
+        """Return ``"H1"``/``"H0"`` once a bound is crossed, else ``None``."""
+
+        llr = self.llr(wins, losses)
+        if llr >= self.upper_bound:
+            return "H1"
+        if llr <= self.lower_bound:
+            return "H0"
+        return None
+
+
+@dataclass(frozen=True)
+class StoppingRule:
+    """Stop a run once A's score interval is narrow enough or an SPRT decides."""
+
+    ci_width: Optional[float] = None
+    confidence: float = 0.95
+    sprt: Optional[SPRT] = None
+    min_games: int = 100
+
+    def check(self, tally: MatchTally) -> Optional[str]:
+        """Return a human-readable reason to stop, or ``None`` to keep going."""
+
+        if tally.games < self.min_games:
+            return None
+        if self.sprt is not None:
+            decision = self.sprt.decide(tally.wins_A, tally.wins_B)
+            if decision == "H1":
+                return f"SPRT accepted p(A) >= {self.sprt.p1:g}"
+            if decision == "H0":
+                return f"SPRT accepted p(A) <= {self.sprt.p0:g}"
+        if self.ci_width is not None:
+            low, high = wilson_interval(
+                tally.wins_A + 0.5 * tally.draws, tally.games, z_score(self.confidence)
+            )
+            if high - low <= self.ci_width:
+                return (
+                    f"{self.confidence:.0%} interval for A's score "
+                    f"[{low:.4f}, {high:.4f}] narrower than {self.ci_width:g}"
+                )
+        return None
+
+
+def elo_ratings(
+    players: Sequence[str],
+    results: Mapping[Tuple[str, str], Tuple[float, int]],
+    *,
+    prior_games: float = 1.0,
+    base: float = 1500.0,
+    iterations: int = 200,
+) -> Dict[str, float]:
+    """Fit Bradley-Terry strengths and express them on the Elo scale.
+
+    ``results[(a, b)]`` is ``(points scored by a against b, games played)``.
+    Every pair also gets ``prior_games`` virtual drawn games so that unbeaten
+    or winless players still get finite ratings. Ratings average to ``base``.
+    """
+
+    points: Dict[str, float] = {name: 0.0 for name in players}
+    games: Dict[Tuple[str, str], float] = {}
+    for i, a in enumerate(players):
+        for b in players[i + 1:]:
+            ab_points, ab_games = results.get((a, b), (0.0, 0))
+            ba_points, ba_games = results.get((b, a), (0.0, 0))
+            total = ab_games + ba_games + prior_games
+            games[(a, b)] = games[(b, a)] = total
+            points[a] += ab_points + (ba_games - ba_points) + prior_games / 2.0
+            points[b] += ba_points + (ab_games - ab_points) + prior_games / 2.0
+
+    strength = {name: 1.0 for name in players}
+    for _ in range(iterations):
+        updated = {}
+        for a in players:
+            denom = sum(
+                games[(a, b)] / (strength[a] + strength[b]) for b in players if b != a
+            )
+            updated[a] = points[a] / denom if denom else strength[a]
+        # Normalise by the geometric mean to keep the scale fixed.
+        log_mean = sum(math.log(v) for v in updated.values()) / len(updated)
+        updated = {name: v / math.exp(log_mean) for name, v in updated.items()}
+        converged = all(abs(updated[n] - strength[n]) < 1e-10 for n in players)
+        strength = updated
+        if converged:
+            break
+
+    return {name: base + 400.0 * math.log10(strength[name]) for name in players}
+
+
+__all__ = [
+    "MatchTally",
+    "SPRT",
+    "StoppingRule",
+    "elo_ratings",
+    "wilson_interval",
+    "z_score",
+]
@@ -0,0 +1,145 @@
+"""Round-robin tournaments between registered agents."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from riftbound.simulate import (
+    AI_REGISTRY,
+    GameTask,
+    MatchSettings,
+    game_seeds,
+    resolve_agent,
+    run_tasks,
+)
+from riftbound.stats import MatchTally, elo_ratings, wilson_interval, z_score
+
+
+def default_agents() -> List[str]:
+    """One registry name per distinct heuristic agent class, skipping aliases.
+
+    Search agents are left out because they cost a full search per decision;
+    pass them explicitly to include them.
+    """
+
+    seen = set()
+    names = []
+    for name, cls in AI_REGISTRY.items():
+        if cls not in seen and not getattr(cls, "search", False):
+            seen.add(cls)
+            names.append(name)
+    return names
+
+
+@dataclass
+class TournamentReport:
+    """Per-seating tallies plus derived head-to-head scores and ratings."""
+
+    agents: List[str]
+    # (agent seated as A, agent seated as B) -> tally from A's seat
+    pairings: Dict[Tuple[str, str], MatchTally] = field(default_factory=dict)
+
+    def head_to_head(self, agent: str, opponent: str) -> Tuple[float, int]:
+        """Points (draws count half) and games for ``agent`` over both seat orders."""
+
+        points = 0.0
+        games = 0
+        as_a = self.pairings.get((agent, opponent))
+        if as_a is not None:
+            points += as_a.wins_A + 0.5 * as_a.draws
+            games += as_a.games
+        as_b = self.pairings.get((opponent, agent))
+        if as_b is not None:
+            points += as_b.wins_B + 0.5 * as_b.draws
+            games += as_b.games
+        return points, games
+
+    def score(
+        self, agent: str, opponent: str, *, confidence: float = 0.95
+    ) -> Tuple[float, float, float]:
+        """``(score, low, high)`` for ``agent`` against ``opponent``."""
+
+        points, games = self.head_to_head(agent, opponent)
+        low, high = wilson_interval(points, games, z_score(confidence))
+        return (points / games if games else 0.0), low, high
+
+    def ratings(self) -> Dict[str, float]:
+        """Elo-scale ratings fitted to the head-to-head scores."""
+
+        results = {
+            (a, b): self.head_to_head(a, b)
+            for i, a in enumerate(self.agents)
+            for b in self.agents[i + 1:]
+        }
+        return elo_ratings(self.agents, results)
+
+
+def _pairing_tasks(
+    pairings: Sequence[Tuple[str, str]],
+    games: int,
+    seed: int,
+    victory_score: int,
+    starting_energy: int,
+) -> Iterator[GameTask]:
+    base_rng = random.Random(seed)
+    pairing_seeds = [base_rng.randrange(1 << 30) for _ in pairings]
+    for (ai_a, ai_b), pairing_seed in zip(pairings, pairing_seeds):
+        settings = MatchSettings(
+            ai_a=ai_a,
+            ai_b=ai_b,
+            victory_score=victory_score,
+            starting_energy=starting_energy,
+        )
+        for index, game_seed in game_seeds(pairing_seed, 0, games):
+            yield index, game_seed, settings
+
+
+def run_tournament(
+    agents: Optional[Sequence[str]] = None,
+    *,
+    games: int = 100,
+    seed: int = 42,
+    victory_score: int = 8,
+    starting_energy: int = 0,
+    workers: int = 1,
+    chunk_size: Optional[int] = None,
+) -> TournamentReport:
+    """Play ``games`` games for every ordered pair of distinct agents.
+
+    All pairings are streamed through one task queue, so a worker pool stays
+    busy across pairing boundaries instead of draining between matchups. Each
+    pairing draws its seeds from its own sub-seed of ``seed``, so results do
+    not depend on ``workers``.
+    """
+
+    names = list(agents) if agents else default_agents()
+    if games < 1:
+        raise ValueError("games must be at least 1")
+    if len(names) < 2:
+        raise ValueError("A tournament needs at least two agents")
+    if len(set(n.strip().lower() for n in names)) != len(names):
+        raise ValueError("Tournament agents must be distinct")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    for name in names:
+        resolve_agent(name)
+
+    pairings = [(a, b) for a in names for b in names if a != b]
+    report = TournamentReport(agents=names)
+    tallies = [MatchTally() for _ in pairings]
+
+    tasks = _pairing_tasks(pairings, games, seed, victory_score, starting_energy)
+    if chunk_size is None:
+        chunk_size = max(1, min(512, games * len(pairings) // (workers * 16)))
+    # Tasks are queued pairing by pairing, and results come back in order.
+    for position, outcome in enumerate(run_tasks(tasks, workers=workers, chunk_size=chunk_size)):
+        tallies[position // games].add(outcome.result)
+
+    for pairing, tally in zip(pairings, tallies):
+        report.pairings[pairing] = tally
+    return report
+
+
+__all__ = ["TournamentReport", "default_agents", "run_tournament"]
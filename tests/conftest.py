@@ -1,6 +1,12 @@
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
\ No newline at end of file
+    sys.path.insert(0, str(ROOT))
+
+# Keep the card cache (and subprocesses' caches) out of the user's ~/.cache.
+_CARD_CACHE = tempfile.TemporaryDirectory(prefix="rbsim-cards-")
+os.environ["RBSIM_CARD_CACHE"] = _CARD_CACHE.name
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from riftbound.core.card_index import CardIndex
+from riftbound.core.cards_registry import CARD_REGISTRY, CardSpec
+from riftbound.core.enums import CardType, Domain, Keyword
+
+
+def _pool(size: int, seed: int = 3) -> list:
+    rng = random.Random(seed)
+    domains = [d.name for d in Domain]
+    specs = []
+    for index in range(size):
+        category = rng.choice(["UNIT", "SPELL", "GEAR"])
+        data = {
+            "name": f"Card {index}",
+            "category": category,
+            "domain": rng.choice(domains),
+            "cost_energy": rng.randint(0, 7),
+            "keywords": rng.sample(["Guard", "Ganking", "Accelerate", "Tank"], rng.randint(0, 2)),
+        }
+        if category == "UNIT":
+            data["might"] = rng.randint(1, 6)
+        if rng.random() < 0.3:
+            data["effects"] = [{"effect": "deal_damage", "amount": 1}]
+        specs.append(CardSpec.from_dict(data))
+    return specs
+
+
+def test_queries_match_a_linear_scan():
+    specs = _pool(2000)
+    index = CardIndex(specs)
+
+    found = index.query(domain="FURY", category=CardType.UNIT, max_cost=2, keywords="guard")
+    expected = [
+        s
+        for s in specs
+        if s.domain is Domain.FURY
+        and s.category is CardType.UNIT
+        and s.cost_energy <= 2
+        and s.keyword_flags & Keyword.GUARD
+    ]
+    assert found == expected and found
+
+    burn = index.query(effects="deal_damage", min_cost=3, domain=[Domain.CALM, "R"])
+    assert burn == [
+        s
+        for s in specs
+        if any(e.effect == "deal_damage" for e in s.effects)
+        and s.cost_energy >= 3
+        and s.domain in (Domain.CALM, Domain.FURY)
+    ]
+    assert index.count(cost=4) == sum(1 for s in specs if s.cost_energy == 4)
+    assert index.query(effects="summon_dragon") == []
+
+
+def test_unknown_keyword_is_rejected():
+    with pytest.raises(ValueError, match="Flying"):
+        CardIndex(_pool(10)).query(keywords="Flying")
+
+
+def test_registry_exposes_a_shared_index():
+    index = CARD_REGISTRY.index
+
+    assert index is CARD_REGISTRY.index
+    assert "Bolt" in index.names(effects="deal_damage", category="SPELL")
+    assert "Stalwart Recruit" in index.names(category=CardType.UNIT)
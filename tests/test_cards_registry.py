@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import json
+import multiprocessing
 import random
+import uuid
+
+import pytest
 
 from riftbound.core.battlefield import Battlefield
 from riftbound.core.cards import UnitCard
-from riftbound.core.cards_registry import CARD_REGISTRY
+from riftbound.core.cards_registry import CARD_REGISTRY, CardSpec, load_cards_json
 from riftbound.core.combat import UnitInPlay
+from riftbound.core.enums import Keyword
 from riftbound.core.loop import GameLoop
 from riftbound.core.player import Deck, Player
 from riftbound.core.state import GameState
@@ -60,4 +66,155 @@ def test_iron_shield_grants_might_to_allies():
 
     loop._apply_action(player_a, ("GEAR", 0, 0, None))
 
-    assert unit.card.might == 2
\ No newline at end of file
+    assert unit.card.might == 2
+
+def test_instances_share_the_spec_prototype_with_distinct_ids():
+    spec = CARD_REGISTRY["Stalwart Recruit"]
+    first, second = spec.instantiate(), spec.instantiate()
+
+    assert isinstance(first, UnitCard)
+    assert first == second == spec.prototype
+    assert first.uid != second.uid != spec.prototype.uid
+    assert first.keywords is second.keywords is spec.prototype.keywords
+    assert first.uuid != second.uuid
+    assert uuid.UUID(first.uuid).int & (1 << 64) - 1 == first.uid
+
+
+def _report_card_ids(queue) -> None:
+    card = CARD_REGISTRY["Stalwart Recruit"].instantiate()
+    queue.put((card.uid, card.uuid))
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork workers"
+)
+def test_forked_workers_mint_distinct_uuids():
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    workers = [context.Process(target=_report_card_ids, args=(queue,)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    (uid_a, uuid_a), (uid_b, uuid_b) = queue.get(timeout=30), queue.get(timeout=30)
+    for worker in workers:
+        worker.join()
+
+    # Both children continue the parent's counter, but not its uuid prefix.
+    assert uid_a == uid_b
+    assert uuid_a != uuid_b
+
+
+def test_granted_might_keeps_the_instance_id_and_spares_the_prototype():
+    loop = make_game()
+    spec = CARD_REGISTRY["Stalwart Recruit"]
+    unit = UnitInPlay(spec.instantiate())
+    uid = unit.card.uid
+    loop.gs.battlefields[0].add_unit("A", unit)
+
+    gear_card = CARD_REGISTRY["Iron Shield"].instantiate()
+    loop.gs.A.hand.append(gear_card)
+    loop.gs.A.energy = 5
+    loop._apply_action(loop.gs.A, ("GEAR", 0, 0, None))
+
+    assert unit.card.uid == uid
+    assert unit.card.might == spec.prototype.might + 1
+
+
+def test_keywords_compile_to_bits_once():
+    spec = CardSpec.from_dict(
+        {"name": "Raider", "category": "UNIT", "might": 2, "keywords": ["Ganking", "guard"]}
+    )
+    card = spec.instantiate()
+
+    assert spec.keyword_flags == Keyword.GANKING | Keyword.GUARD
+    assert card.keyword_mask == spec.keyword_flags.value
+    assert card.has_keyword(Keyword.GUARD) and card.has_keyword("ganking")
+    assert not card.has_keyword(Keyword.ACCELERATE) and not card.has_keyword("Flying")
+
+
+def test_unknown_keyword_is_reported_at_load(tmp_path):
+    (tmp_path / "bad.json").write_text(
+        json.dumps([{"name": "Oddity", "category": "UNIT", "keywords": ["Flying"]}])
+    )
+
+    with pytest.raises(ValueError, match="Oddity.*Flying"):
+        load_cards_json(tmp_path)
+
+
+def test_effects_compile_once_and_are_shared_by_instances():
+    import pickle
+
+    spec = CARD_REGISTRY["Bolt"]
+    first, second = spec.instantiate(), spec.instantiate()
+
+    assert len(spec.handlers) == 1
+    assert first.handlers is second.handlers is spec.handlers
+    assert len(pickle.loads(pickle.dumps(first)).handlers) == 1
+
+
+@pytest.mark.parametrize(
+    "effect, message",
+    [
+        ({"effect": "deal_damage", "amount": "lots"}, "amount"),
+        ({"effect": "grant_might", "amount": 1, "target": "everyone"}, "everyone"),
+        ({"effect": "ready_units", "scope": "some"}, "some"),
+        ({"effect": "summon_dragon"}, "summon_dragon"),
+    ],
+)
+def test_bad_effect_params_are_rejected_at_load(effect, message):
+    with pytest.raises(ValueError, match=f"Oddity.*{message}"):
+        CardSpec.from_dict({"name": "Oddity", "category": "SPELL", "effects": [effect]})
+
+
+def _write_set(root, set_name, cards):
+    (root / set_name).mkdir(parents=True, exist_ok=True)
+    (root / set_name / "cards.json").write_text(json.dumps(cards))
+
+
+def test_registry_loads_lazily_per_set_and_reuses_the_disk_cache(tmp_path, monkeypatch):
+    from riftbound.core.cards_registry import CardRegistry
+
+    root, cache = tmp_path / "cards", tmp_path / "cache"
+    _write_set(root, "alpha", [{"name": "Ant", "category": "UNIT", "might": 1}])
+    _write_set(root, "beta", [{"name": "Bee", "category": "UNIT", "might": 2}])
+
+    cold = CardRegistry(root, cache_dir=cache)
+    assert cold.set_names() == ["alpha", "beta"]
+    assert list(cold.card_set("alpha")) == ["Ant"]
+    assert [p.name.split("-")[0] for p in cache.iterdir()] == ["alpha"]
+
+    def no_parsing(*args, **kwargs):
+        raise AssertionError("warm load parsed JSON")
+
+    warm = CardRegistry(root, cache_dir=cache)
+    monkeypatch.setattr(json, "load", no_parsing)
+    assert warm.card_set("alpha")["Ant"].might == 1
+    monkeypatch.undo()
+
+    assert warm["Bee"].might == 2 and len(warm) == 2
+
+
+def test_registry_cache_is_keyed_by_file_contents(tmp_path):
+    from riftbound.core.cards_registry import CardRegistry
+
+    root, cache = tmp_path / "cards", tmp_path / "cache"
+    _write_set(root, "alpha", [{"name": "Ant", "category": "UNIT", "might": 1}])
+    assert CardRegistry(root, cache_dir=cache)["Ant"].might == 1
+
+    _write_set(root, "alpha", [{"name": "Ant", "category": "UNIT", "might": 4}])
+    assert CardRegistry(root, cache_dir=cache)["Ant"].might == 4
+    assert CardRegistry(root, cache=False)["Ant"].might == 4
+    # The stale key is pruned when the new one is written.
+    assert [p.name.split("-")[0] for p in cache.glob("*.pickle")] == ["alpha"]
+
+
+def test_registry_cache_pruning_spares_other_sets(tmp_path):
+    from riftbound.core.cards_registry import CardRegistry
+
+    root, cache = tmp_path / "cards", tmp_path / "cache"
+    _write_set(root, "alpha", [{"name": "Ant", "category": "UNIT", "might": 1}])
+    _write_set(root, "alpha-extra", [{"name": "Asp", "category": "UNIT", "might": 1}])
+    assert len(CardRegistry(root, cache_dir=cache)) == 2
+
+    _write_set(root, "alpha", [{"name": "Ant", "category": "UNIT", "might": 3}])
+    assert CardRegistry(root, cache_dir=cache).card_set("alpha")["Ant"].might == 3
+    assert sorted(p.name.rsplit("-", 1)[0] for p in cache.glob("*.pickle")) == ["alpha", "alpha-extra"]
@@ -0,0 +1,92 @@
+import sqlite3
+
+import pytest
+
+from riftbound.checkpoint import Checkpoint, load_checkpoint, save_checkpoint
+from riftbound.simulate import MatchSettings, iter_games
+from riftbound.stats import MatchTally
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = tmp_path / "run.ckpt"
+    state = Checkpoint(
+        run={"seed": 1, "games": 10},
+        next_index=4,
+        tally=MatchTally(games=4, wins_A=3, wins_B=1, turns_total=60),
+        last_game_id=4,
+    )
+    save_checkpoint(str(path), state)
+
+    loaded = load_checkpoint(str(path))
+    assert loaded == state
+    assert loaded.mismatches({"seed": 1, "games": 10}) == {}
+    assert loaded.mismatches({"seed": 2, "games": 10}) == {"seed": (1, 2)}
+    assert not (tmp_path / "run.ckpt.tmp").exists()
+
+
+def test_discard_games_after(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from riftbound.core.cards import UnitCard
+    from riftbound.data.merge import discard_games_after, last_game_id
+    from riftbound.data.session import make_session
+    from riftbound.data.writer import record_game, record_play
+
+    db = str(tmp_path / "run.db")
+    session = make_session(db)
+    for seed in range(5):
+        game_id = record_game(session, seed=seed, winner="A", turns=3, total_units=1, total_spells=0)
+        record_play(session, game_id, "A", 1, UnitCard(name="Recruit"), action="UNIT")
+    session.commit()
+    session.close()
+
+    assert discard_games_after(db, 3) == 2
+    assert last_game_id(db) == 3
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT MAX(game_id) FROM plays").fetchone()[0] == 3
+    conn.close()
+
+
+def test_cli_resume_continues_with_identical_seeds(tmp_path):
+    pytest.importorskip("typer")
+    pytest.importorskip("sqlalchemy")
+    from typer.testing import CliRunner
+
+    from riftbound.cli.main import app
+
+    path = str(tmp_path / "run.ckpt")
+    args = ["simulate", "--games", "30", "--seed", "4", "--aiA", "control", "--no-verbose"]
+    runner = CliRunner()
+    full = runner.invoke(app, args + ["--checkpoint", path, "--checkpoint-every", "10"])
+    assert full.exit_code == 0, full.output
+
+    # Rewind the checkpoint as if the run had died right after game 10.
+    state = load_checkpoint(path)
+    assert state.next_index == 30
+    state.next_index = 10
+    state.tally = MatchTally()
+    for outcome in iter_games(30, seed=4, settings=MatchSettings("control", "aggro"), stop=10):
+        state.tally.add(outcome.result)
+    save_checkpoint(path, state)
+
+    resumed = runner.invoke(app, args + ["--checkpoint", path, "--resume"])
+    assert resumed.exit_code == 0, resumed.output
+    assert "Resuming at game 11" in resumed.output
+    summary = [line for line in full.output.splitlines() if "Summary" in line]
+    assert summary and summary[-1] in resumed.output
+
+
+def test_cli_resume_rejects_different_stopping_rule(tmp_path):
+    pytest.importorskip("typer")
+    from typer.testing import CliRunner
+
+    from riftbound.cli.main import app
+
+    path = str(tmp_path / "run.ckpt")
+    args = ["simulate", "--games", "10", "--seed", "4", "--no-verbose", "--checkpoint", path]
+    runner = CliRunner()
+    first = runner.invoke(app, args + ["--sprt", "0.5,0.6", "--check-every", "5"])
+    assert first.exit_code == 0, first.output
+
+    resumed = runner.invoke(app, args + ["--resume", "--sprt", "0.5,0.7", "--check-every", "5"])
+    assert resumed.exit_code != 0
+    assert "sprt_p1" in resumed.output
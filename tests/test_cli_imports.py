@@ -0,0 +1,57 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY = ("sqlalchemy", "pydantic", "rich", "numpy")
+
+
+def _modules_loaded_by(code: str) -> set:
+    probe = f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return {line.split(".")[0] for line in out.splitlines()}
+
+
+def test_cli_import_stays_light():
+    loaded = _modules_loaded_by("import riftbound.cli.main")
+
+    assert not loaded & set(HEAVY)
+    assert "riftbound" in loaded
+
+
+def test_simulate_without_db_skips_the_database_stack():
+    code = (
+        "from typer.testing import CliRunner\n"
+        "from riftbound.cli.main import app\n"
+        "result = CliRunner().invoke(app, ['simulate', '--games', '2', '--no-verbose'])\n"
+        "assert result.exit_code == 0, result.output"
+    )
+    loaded = _modules_loaded_by(code)
+
+    assert "sqlalchemy" not in loaded and "pydantic" not in loaded
+
+
+def test_import_benchmark_passes_its_default_budget():
+    proc = subprocess.run(
+        [sys.executable, "benchmarks/bench_import.py", "--runs", "3"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert "import riftbound.cli.main" in proc.stdout
+
+
+def test_simulate_module_defers_search_and_process_pools():
+    probe = (
+        "import sys, riftbound.simulate\n"
+        "print([m for m in ('multiprocessing', 'riftbound.ai.search.mcts') if m in sys.modules])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.strip() == "[]"
@@ -1,6 +1,7 @@
 from riftbound.core.battlefield import Battlefield
 from riftbound.core.cards import UnitCard
 from riftbound.core.combat import UnitInPlay
+from riftbound.core.journal import UndoJournal
 
 
 def test_might_combat_resolves_and_tracks_kills():
@@ -36,4 +37,78 @@ def test_guard_priority_absorbs_spell_damage_first():
     bf.apply_spell_damage("B", 3)
 
     assert bf.count("B") == 1
-    assert guard not in bf.units_B
\ No newline at end of file
+    assert guard not in bf.units_B
+
+def test_lane_totals_follow_adds_removals_and_buffs():
+    bf = Battlefield()
+    guard = UnitInPlay(UnitCard(name="Wall", might=3, keywords=["Guard"]))
+    bf.add_unit("A", UnitInPlay(UnitCard(name="Scout", might=1)))
+    bf.add_unit("A", guard)
+    bf.add_unit("B", UnitInPlay(UnitCard(name="Brute", might=4)))
+
+    assert bf.might == [4, 4]
+    assert bf.guards[0] == [guard]
+
+    bf.grant_might("A", 2)
+    assert bf.might[0] == 8
+
+    bf.remove_unit("A", guard)
+    assert bf.might[0] == 3
+    assert bf.guards[0] == []
+
+
+def test_combat_on_a_crowded_lane_only_touches_units_it_damages():
+    bf = Battlefield()
+    wall = UnitInPlay(UnitCard(name="Wall", might=2, keywords=["Guard"]))
+    bf.add_unit("A", UnitInPlay(UnitCard(name="Striker", might=5)))
+    for index in range(200):
+        bf.add_unit("B", UnitInPlay(UnitCard(name=f"Chaff{index}", might=1)))
+    bf.add_unit("B", wall)
+
+    stats = bf.resolve_combat_might()
+
+    # The guard dies first, then the three oldest chaff; the rest are untouched.
+    assert stats.damage_to_B == 5
+    assert wall not in bf.units_B
+    assert bf.count("B") == 197
+    assert bf.units_B[0].card.name == "Chaff3"
+    assert all(unit.damage == 0 for unit in bf.units_B)
+    assert bf.might == [0, 197]
+    assert bf.guards == ([], [])
+
+
+def test_undo_restores_lane_totals_after_combat():
+    from riftbound.core.journal import UndoJournal
+
+    bf = Battlefield()
+    bf.add_unit("A", UnitInPlay(UnitCard(name="Striker", might=3)))
+    bf.add_unit("B", UnitInPlay(UnitCard(name="Wall", might=2, keywords=["Guard"])))
+    bf.add_unit("B", UnitInPlay(UnitCard(name="Aux", might=2)))
+    bf.journal = UndoJournal()
+    before = (bf.might[:], [list(g) for g in bf.guards], list(bf.units_B))
+
+    bf.resolve_combat_might()
+    bf.grant_might("B", 1)
+    bf.journal.rollback()
+
+    assert (bf.might, [list(g) for g in bf.guards], bf.units_B) == before
+    assert all(unit.damage == 0 for unit in bf.units_B)
+
+
+def test_reassigning_a_side_keeps_the_lane_views_in_step():
+    bf = Battlefield()
+    bf.add_unit("B", UnitInPlay(UnitCard(name="Grunt", might=1)))
+    bf.journal = UndoJournal()
+
+    guard = UnitInPlay(UnitCard(name="Sentry", might=3, keywords=["Guard"]))
+    bf.units_A = [guard]
+    assert bf.units[0] is bf.units_A and bf.count("A") == 1
+    assert bf.might == [3, 1] and bf.guards[0] == [guard]
+    assert bf.contested and bf.showdown_pending
+
+    bf.units_B = []
+    assert bf.controller() == "A" and not bf.showdown_pending
+
+    bf.journal.rollback(0)
+    assert bf.units_A == [] and bf.count("B") == 1 and bf.controller() == "B"
+    assert bf.might == [0, 1]
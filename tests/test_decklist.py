@@ -0,0 +1,90 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from riftbound.core.cards_registry import CARD_REGISTRY
+from riftbound.core.decklist import compile_decklist, load_decklist, parse_decklist
+from riftbound.core.enums import Domain
+from riftbound.simulate import MatchSettings, build_game, run_game, starter_deck
+
+DECKS = Path(__file__).resolve().parents[1] / "riftbound" / "data" / "decks"
+
+
+def test_parse_sections_counts_and_comments():
+    legend, main, runes = parse_decklist(
+        "# burn\nLegend: Someone\n3x Bolt  # cheap\n2 Stalwart Recruit\n\nRunes:\n4 Calm\n2 R\n"
+    )
+
+    assert legend == "Someone"
+    assert main == [(3, "Bolt"), (2, "Stalwart Recruit")]
+    assert runes == [(4, "Calm"), (2, "R")]
+
+
+def test_template_holds_prototypes_and_deals_fresh_instances():
+    template = compile_decklist("2 Bolt\n1 Stalwart Recruit\nRunes:\n2 Fury\n1 R\n")
+
+    assert template.cards == (CARD_REGISTRY["Bolt"].prototype,) * 2 + (
+        CARD_REGISTRY["Stalwart Recruit"].prototype,
+    )
+    assert template.runes == ((Domain.FURY, 3),)
+
+    first, second = template.deck(random.Random(1)), template.deck(random.Random(1))
+    assert [c.name for c in first.cards] == [c.name for c in second.cards]
+    assert len({c.uid for c in first.cards + second.cards}) == 6
+    assert [r.domain for r in template.rune_deck().runes] == [Domain.FURY] * 3
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("", "empty"),
+        ("2 Moonblade", "Moonblade"),
+        ("two Bolt", "line 1"),
+        ("1 Bolt\nRunes:\n3 Void", "Void"),
+        ("Legend: Bolt\n1 Bolt", "legend"),
+    ],
+)
+def test_bad_decklists_are_rejected(text, message):
+    with pytest.raises(ValueError, match=message):
+        compile_decklist(text, name="broken")
+
+
+def test_starter_file_matches_the_default_deck():
+    starter_file = load_decklist(DECKS / "starter.txt")
+    assert load_decklist(DECKS / "starter.txt") is starter_file
+
+    default = MatchSettings(ai_a="control", ai_b="aggro")
+    from_file = MatchSettings(ai_a="control", ai_b="aggro", deck_a=starter_file, deck_b=starter_file)
+    for seed in (3, 4):
+        assert run_game(0, seed, default).result == run_game(0, seed, from_file).result
+
+    assert starter_file.cards == starter_deck().cards
+
+
+def test_custom_deck_reaches_the_game():
+    rush = load_decklist(DECKS / "recruit_rush.txt")
+    gs = build_game(7, MatchSettings(ai_a="aggro", ai_b="aggro", deck_a=rush))
+
+    assert {c.name for c in gs.A.deck.cards} == {"Stalwart Recruit"}
+    assert {r.domain for r in gs.A.rune_deck.runes} == {Domain.FURY}
+
+
+def test_digest_follows_contents_not_names():
+    renamed = compile_decklist((DECKS / "starter.txt").read_text(encoding="utf-8"), name="renamed")
+
+    assert renamed.digest == starter_deck().digest
+    assert compile_decklist("10 Bolt\n10 Stalwart Recruit\nRunes:\n6 Calm\n6 Fury\n").digest != starter_deck().digest
+    assert compile_decklist("10 Stalwart Recruit\n10 Bolt\nRunes:\n6 Calm\n5 Fury\n").digest != starter_deck().digest
+
+
+def test_cli_reports_unreadable_decklist(tmp_path):
+    pytest.importorskip("typer")
+    from typer.testing import CliRunner
+
+    from riftbound.cli.main import app
+
+    for path in (str(tmp_path), ""):
+        result = CliRunner().invoke(app, ["simulate", "--games", "1", "--deckA", path])
+        assert result.exit_code == 2, result.output
+        assert "--deckA" in result.output
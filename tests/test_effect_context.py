@@ -78,4 +78,24 @@ def test_add_rune_invalid_domain():
     except ValueError:
         pass
     else:
-        raise AssertionError("Expected ValueError for invalid domain")
\ No newline at end of file
+        raise AssertionError("Expected ValueError for invalid domain")
+
+def test_card_effects_reuse_one_context_per_loop():
+    from riftbound.core.cards import GearCard
+
+    loop = _make_loop()
+    battlefield = loop.gs.battlefields[0]
+    unit = UnitInPlay(UnitCard(name="Soldier", might=2))
+    battlefield.units_A.append(unit)
+    shield = GearCard(
+        name="Banner",
+        effects=[{"effect": "grant_might", "amount": 1, "target": "actor", "scope": "SINGLE"}],
+    )
+
+    loop._resolve_card_effects(shield, battlefield, loop.gs.A, loop.gs.B)
+    context = loop._effect_context
+    loop._resolve_card_effects(shield, loop.gs.battlefields[1], loop.gs.B, loop.gs.A)
+
+    assert loop._effect_context is context
+    assert context.actor is loop.gs.B and context.battlefield is loop.gs.battlefields[1]
+    assert unit.might == 3
@@ -1,5 +1,7 @@
 import random
 
+import pytest
+
 from riftbound.core.battlefield import Battlefield
 from riftbound.core.cards import UnitCard
 from riftbound.core.combat import UnitInPlay
@@ -44,4 +46,97 @@ def test_conquer_scoring_triggers_after_combat():
     loop._phase_combat_and_conquer("A")
 
     assert gs.points_A == 1
-    assert bf.controller() == "A"
\ No newline at end of file
+    assert bf.controller() == "A"
+
+def test_side_indexed_storage_backs_the_named_attributes():
+    gs = make_game()
+    bf = gs.battlefields[0]
+    bf.add_unit(1, UnitInPlay(UnitCard(name="Grunt", might=1)))
+    bf.mark_scored("B")
+    bf.last_controller = "B"
+    gs.active = "B"
+    gs.points_B = 3
+
+    assert bf.units[1] is bf.units_B and bf.count("B") == 1
+    assert bf.controller() == "B" and bf.control_side() == 1
+    assert bf.scored == [False, True] and bf.scored_this_turn_B
+    assert bf.last_side == 1
+    assert gs.side == 1 and gs.get_player(1) is gs.get_player("B") is gs.B
+    assert gs.points == [0, 3]
+
+    copy_ = gs.clone()
+    copy_.points[1] += 1
+    copy_.battlefields[0].scored[1] = False
+    assert gs.points_B == 3 and bf.scored_this_turn_B
+
+
+def test_lane_status_is_cached_and_follows_occupancy():
+    from riftbound.core.journal import UndoJournal
+
+    bf = Battlefield()
+    bf.journal = UndoJournal()
+    grunt = UnitInPlay(UnitCard(name="Grunt", might=1))
+    bf.add_unit("A", grunt)
+    bf.add_unit("A", UnitInPlay(UnitCard(name="Scout", might=1)))
+    assert bf.controller() == "A" and not bf.contested
+
+    bf.add_unit("B", UnitInPlay(UnitCard(name="Raider", might=1)))
+    assert bf.controller() is None and bf.contested
+    assert bf.contested_this_turn and bf.showdown_pending
+
+    bf.remove_unit("A", grunt)
+    assert bf.contested  # A still has a unit
+
+    bf.journal.rollback()
+    assert bf.occupancy == 0 and bf.controller() is None
+    assert not bf.contested_this_turn and not bf.showdown_pending
+
+
+def test_start_turn_resets_flags_and_remembers_holder():
+    bf = Battlefield()
+    unit = UnitInPlay(UnitCard(name="Sentinel", might=2))
+    bf.add_unit("B", unit)
+    bf.mark_scored("B")
+
+    bf.start_turn("B")
+
+    assert bf.last_side == 1 and bf.scored == [False, False]
+    assert not bf.contested_this_turn and unit.ready
+
+
+def test_state_accepts_side_names_and_tracks_reassigned_players():
+    gs = GameState(
+        rng=random.Random(0),
+        A=Player(name="A"),
+        B=Player(name="B"),
+        active="B",
+        points_A=2,
+        points_B=5,
+    )
+    assert (gs.side, gs.active, gs.points) == (1, "B", [2, 5])
+
+    replacement = Player(name="A", energy=3)
+    gs.A = replacement
+    assert gs.get_player("A") is replacement and gs.players[0] is replacement
+    assert gs.clone().A.energy == 3
+
+    with pytest.raises(ValueError, match="'C'"):
+        GameState(rng=random.Random(0), A=Player(name="A"), B=Player(name="B"), active="C")
+
+
+def test_seat_not_name_decides_the_side():
+    seat_a = Player(name="North", deck=Deck([]))
+    seat_b = Player(name="A", deck=Deck([]))
+    gs = GameState(rng=random.Random(0), A=seat_a, B=seat_b)
+    gs.battlefields = [Battlefield(), Battlefield()]
+    seat_a.hand.append(UnitCard(name="Sentinel", cost_energy=0, might=2))
+
+    loop = GameLoop(gs)
+    loop._apply_action(seat_a, ("UNIT", 0, 0))
+
+    assert (seat_a.side, seat_b.side) == (0, 1)
+    assert [u.card.name for u in gs.battlefields[0].units_A] == ["Sentinel"]
+    assert not gs.battlefields[0].units_B
+
+    gs.B, gs.A = seat_a, seat_b
+    assert (seat_a.side, seat_b.side) == (1, 0)
@@ -0,0 +1,141 @@
+import pytest
+
+from riftbound.core.cards import UnitCard
+from riftbound.core.combat import UnitInPlay
+from riftbound.core.loop import GameLoop, MAX_HAND_SLOTS, PASS_ACTION
+from riftbound.simulate import MatchSettings, build_game, run_game
+
+
+def _fingerprint(loop):
+    gs = loop.gs
+    return (
+        tuple(tuple(map(id, p.hand)) for p in (gs.A, gs.B)),
+        tuple(p.energy for p in (gs.A, gs.B)),
+        tuple(tuple((id(u), u.ready) for u in p.base_units) for p in (gs.A, gs.B)),
+        tuple(
+            (tuple(sorted(map(id, bf.units_A))), tuple(sorted(map(id, bf.units_B))))
+            for bf in gs.battlefields
+        ),
+    )
+
+
+def _every_action(loop):
+    lanes = len(loop.gs.battlefields)
+    hand = loop.gs.get_player(loop.gs.active).hand
+    actions = [PASS_ACTION]
+    for idx in range(len(hand)):
+        for lane in range(lanes):
+            actions += [("UNIT", idx, lane), ("SPELL", idx, lane), ("GEAR", idx, lane)]
+    for src in range(lanes + 1):
+        for dst in range(lanes + 1):
+            if src != dst:
+                actions.append(("MOVE", None, src, dst))
+    return actions
+
+
+def _decision_point(seed=4):
+    gs = build_game(seed, MatchSettings(ai_a="control", ai_b="aggro"))
+    loop = GameLoop(gs)
+    loop.setup()
+    loop.begin_turn()
+    gs.battlefields[0].add_unit(gs.active, UnitInPlay(UnitCard(name="Scout", might=1), ready=True))
+    return loop
+
+
+def test_legal_actions_are_exactly_the_actions_that_do_something():
+    loop = _decision_point()
+    gs = loop.gs
+    player = gs.get_player(gs.active)
+    loop.enable_journal()
+    legal = loop.legal_actions(player)
+
+    assert legal[0] == PASS_ACTION
+    assert any(a[0] == "MOVE" for a in legal)
+    before = _fingerprint(loop)
+    for action in _every_action(loop):
+        mark = loop.apply(action)
+        changed = _fingerprint(loop) != before
+        loop.undo(mark)
+        assert changed == (action in legal and action != PASS_ACTION), action
+
+
+def test_cache_is_reused_until_the_position_changes():
+    loop = _decision_point()
+    gs = loop.gs
+    player = gs.get_player(gs.active)
+    loop.enable_journal()
+
+    first = loop.legal_actions(player)
+    assert loop.legal_actions(player) is first
+
+    mark = loop.apply(next(a for a in first if a[0] == "MOVE"))
+    moved = loop.legal_actions(player)
+    assert moved is not first
+
+    loop.undo(mark)
+    again = loop.legal_actions(player)
+    assert again is not moved and again is not first
+    assert again == first
+
+    player.pay(player.energy)
+    assert all(a[0] in ("PASS", "MOVE") for a in loop.legal_actions(player))
+
+
+def test_mask_round_trips_through_action_indices():
+    loop = _decision_point()
+    gs = loop.gs
+    player = gs.get_player(gs.active)
+    legal = loop.legal_actions(player)
+    mask = loop.legal_mask(player)
+    lanes = len(gs.battlefields)
+
+    assert len(mask) == loop.action_space_size == 1 + MAX_HAND_SLOTS * lanes + (lanes + 1) * lanes
+    assert sum(mask) == len(legal)
+    for action in legal:
+        index = loop.action_index(action)
+        assert mask[index]
+        assert loop.action_from_index(index, player) == action
+    assert [i for i, ok in enumerate(mask) if ok] == sorted(map(loop.action_index, legal))
+
+
+def test_heuristics_play_the_same_games_through_the_generator():
+    settings = MatchSettings(ai_a="aggro", ai_b="control")
+    results = [run_game(i, 50 + i, settings).result for i in range(5)]
+
+    for i, expected in enumerate(results):
+        gs = build_game(50 + i, settings)
+        # Agents detached from the loop fall back to scanning the hand directly.
+        assert GameLoop(gs).start() == expected
+
+
+def test_base_moves_are_legal_and_bad_lanes_are_rejected():
+    loop = _decision_point()
+    gs = loop.gs
+    player = gs.get_player(gs.active)
+    player.add_base_unit(UnitInPlay(UnitCard(name="Reserve", might=1), ready=True))
+    loop.enable_journal()
+    base = len(gs.battlefields)
+    legal = loop.legal_actions(player)
+
+    assert {a for a in legal if a[0] == "MOVE" and a[2] == base} == {
+        ("MOVE", None, base, lane) for lane in range(base)
+    }
+    loop.apply(("MOVE", None, base, 1))
+    assert not player.base_units and gs.battlefields[1].count(gs.active) == 1
+
+    bad = [("UNIT", 0, base), ("SPELL", 0, -1), ("MOVE", None, base + 1, 0), ("MOVE", None, 0, base + 1)]
+    for action in bad:
+        with pytest.raises(ValueError, match="out of range"):
+            loop.apply(action)
+
+
+def test_mask_refuses_hands_wider_than_its_slots():
+    loop = _decision_point()
+    gs = loop.gs
+    player = gs.get_player(gs.active)
+    spares = MAX_HAND_SLOTS + 1 - len(player.hand)
+    player.hand.extend(UnitCard(name="Spare", might=1) for _ in range(spares))
+
+    assert ("UNIT", MAX_HAND_SLOTS, 0) in loop.legal_actions(player)
+    with pytest.raises(ValueError, match="action mask"):
+        loop.legal_mask(player)
@@ -0,0 +1,66 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from riftbound.core.cards_registry import CardSpec
+from riftbound.core.enums import CardType
+from riftbound.core.lockstep import LockstepUnsupported, iter_lockstep
+from riftbound.simulate import MatchSettings, iter_games
+from riftbound.stats import MatchTally
+
+
+def _lockstep_tally(games, **kwargs):
+    tally = MatchTally()
+    for batch in iter_lockstep(games, batch_size=1000, **kwargs):
+        batch.add_to(tally)
+    return tally
+
+
+def _loop_tally(games, settings):
+    tally = MatchTally()
+    for outcome in iter_games(games, seed=1, settings=settings):
+        tally.add(outcome.result)
+    return tally
+
+
+@pytest.mark.parametrize(
+    "ai_a, ai_b, victory_score, starting_energy",
+    [
+        ("aggro", "aggro", 8, 0),
+        ("aggro", "control", 8, 0),
+        ("control", "aggro", 5, 3),
+    ],
+)
+def test_lockstep_matches_game_loop_statistically(ai_a, ai_b, victory_score, starting_energy):
+    settings = MatchSettings(
+        ai_a=ai_a, ai_b=ai_b, victory_score=victory_score, starting_energy=starting_energy
+    )
+    reference = _loop_tally(300, settings)
+    fast = _lockstep_tally(
+        3000,
+        seed=7,
+        ai_a=ai_a,
+        ai_b=ai_b,
+        victory_score=victory_score,
+        starting_energy=starting_energy,
+    )
+
+    assert fast.games == 3000
+    assert abs(fast.score_A - reference.score_A) < 0.05
+    assert abs(fast.avg_turns - reference.avg_turns) < 0.1 * reference.avg_turns
+
+
+def test_lockstep_is_deterministic_per_seed():
+    first = _lockstep_tally(500, seed=3, ai_a="control", ai_b="aggro")
+    second = _lockstep_tally(500, seed=3, ai_a="control", ai_b="aggro")
+
+    assert first == second
+
+
+def test_lockstep_rejects_cards_outside_the_vanilla_subset():
+    guard = CardSpec(
+        name="Test Guard", category=CardType.UNIT, cost_energy=1, might=2, keywords=("GUARD",)
+    )
+
+    with pytest.raises(LockstepUnsupported):
+        iter_lockstep(10, deck_a=[guard] * 20)
@@ -0,0 +1,89 @@
+import random
+from collections import Counter
+
+from riftbound.ai.search.mcts import MCTSAgent, candidate_actions, determinize
+from riftbound.core.loop import GameLoop
+from riftbound.simulate import MatchSettings, build_game
+
+
+def _decision_point(seed=3):
+    gs = build_game(seed, MatchSettings(ai_a="aggro", ai_b="aggro"))
+    loop = GameLoop(gs)
+    loop.setup()
+    loop.begin_turn()
+    return loop
+
+
+def test_candidate_actions_are_distinct_and_affordable():
+    loop = _decision_point()
+    gs = loop.gs
+    gs.A.pay(gs.A.energy - 1)
+
+    keys = [key for key, _ in candidate_actions(loop)]
+
+    assert len(keys) == len(set(keys))
+    assert ("PASS", None, None, None) in keys
+    for kind, name, lane, _ in keys:
+        if kind in {"UNIT", "SPELL"}:
+            card = next(c for c in gs.A.hand if c.name == name)
+            assert card.cost_energy <= 1
+            assert lane in (0, 1)
+
+
+def test_determinize_only_redeals_hidden_cards():
+    gs = _decision_point().gs
+    hand_a = list(gs.A.hand)
+    hidden_b = Counter(c.name for c in gs.B.hand + gs.B.deck.cards)
+    sizes_b = (len(gs.B.hand), len(gs.B.deck.cards))
+
+    determinize(gs, "A", random.Random(1))
+
+    assert gs.A.hand == hand_a
+    assert Counter(c.name for c in gs.B.hand + gs.B.deck.cards) == hidden_b
+    assert (len(gs.B.hand), len(gs.B.deck.cards)) == sizes_b
+
+
+def test_mcts_respects_budget_and_reports_playouts():
+    loop = _decision_point()
+    gs = loop.gs
+    agent = MCTSAgent(gs.A, simulations=40, seed=7)
+    agent.loop = loop
+    before = (list(gs.A.hand), gs.A.energy, gs.points_A, gs.turn)
+
+    action = agent.decide_action(gs.B)
+
+    assert before == (list(gs.A.hand), gs.A.energy, gs.points_A, gs.turn)
+    assert action in [a for _, a in candidate_actions(loop)]
+    (stats,) = agent.stats
+    assert stats.playouts == 40
+    assert stats.playouts_per_sec > 0
+
+
+def test_mcts_time_budget():
+    loop = _decision_point()
+    agent = MCTSAgent(loop.gs.A, simulations=None, time_ms=30, seed=1)
+    agent.loop = loop
+
+    agent.decide_action(loop.gs.B)
+
+    (stats,) = agent.stats
+    assert stats.playouts > 0
+    assert stats.elapsed_ms < 500
+
+
+def test_mcts_beats_its_rollout_policy_from_the_second_seat():
+    # Aggro as B almost never beats aggro as A; searching over aggro rollouts should.
+    for seed in (0, 1):
+        gs = build_game(seed, MatchSettings(ai_a="aggro", ai_b="aggro"))
+        gs.B.agent = MCTSAgent(gs.B, simulations=60, seed=seed)
+        assert GameLoop(gs).start().winner == "B"
+
+
+def test_root_parallel_search_sums_worker_playouts():
+    loop = _decision_point()
+    agent = MCTSAgent(loop.gs.A, simulations=20, workers=2, seed=2)
+    agent.loop = loop
+
+    agent.decide_action(loop.gs.B)
+
+    assert agent.stats[0].playouts == 20
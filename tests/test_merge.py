@@ -0,0 +1,50 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from riftbound.core.cards import SpellCard, UnitCard
+from riftbound.data.merge import merge_databases
+from riftbound.data.session import make_session
+from riftbound.data.writer import record_deck, record_game, record_play
+
+
+def _make_shard(path, seeds):
+    session = make_session(str(path))
+    try:
+        for seed in seeds:
+            game_id = record_game(session, seed=seed, winner="A", turns=5, total_units=1, total_spells=1)
+            record_deck(session, game_id, "A", [UnitCard(name="Recruit")], ai_name="aggro")
+            record_play(session, game_id, "A", 1, SpellCard(name="Bolt"), action="SPELL", battlefield_index=0)
+        session.commit()
+    finally:
+        session.close()
+
+
+def test_merge_remaps_game_ids(tmp_path):
+    shard_one = tmp_path / "shard1.db"
+    shard_two = tmp_path / "shard2.db"
+    merged = tmp_path / "merged.db"
+    _make_shard(shard_one, [10, 11])
+    _make_shard(shard_two, [20, 21, 22])
+
+    assert merge_databases(str(merged), [str(shard_one), str(shard_two)]) == 5
+
+    conn = sqlite3.connect(merged)
+    try:
+        games = conn.execute("SELECT id, seed FROM games ORDER BY id").fetchall()
+        assert games == [(1, 10), (2, 11), (3, 20), (4, 21), (5, 22)]
+        plays = conn.execute(
+            "SELECT g.seed FROM plays p JOIN games g ON g.id = p.game_id ORDER BY p.id"
+        ).fetchall()
+        assert [row[0] for row in plays] == [10, 11, 20, 21, 22]
+        decks = conn.execute("SELECT COUNT(DISTINCT game_id) FROM decks").fetchone()[0]
+        assert decks == 5
+    finally:
+        conn.close()
+
+
+def test_merge_missing_shard(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        merge_databases(str(tmp_path / "merged.db"), [str(tmp_path / "absent.db")])
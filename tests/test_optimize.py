@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from riftbound.core.decklist import compile_decklist
+from riftbound.core.enums import Domain
+from riftbound.optimize import (
+    DeckGenome,
+    DeckSpace,
+    Opponent,
+    _Evaluator,
+    optimize_deck,
+    parse_gauntlet,
+)
+from riftbound.simulate import starter_deck
+
+
+def _genome(text):
+    return DeckGenome.from_template(compile_decklist(text))
+
+
+def test_genome_is_canonical_and_round_trips():
+    a = _genome("10 Bolt\n10 Stalwart Recruit\nRunes:\n6 Fury\n6 Calm\n")
+    b = _genome("5 Stalwart Recruit\n10 Bolt\n5 Stalwart Recruit\nRunes:\n6 Calm\n6 Fury\n")
+
+    assert a == b and hash(a) == hash(b)
+    assert a == DeckGenome.from_template(starter_deck())
+    assert _genome(a.decklist()) == a
+    assert a.template().name == a.digest
+
+
+def test_mutation_and_crossover_respect_constraints():
+    start = DeckGenome.from_template(starter_deck())
+    space = DeckSpace.around(start, max_copies=12)
+    rng = random.Random(0)
+
+    assert set(space.pool) == {"Bolt", "Iron Shield", "Stalwart Recruit"}
+    assert space.domains == (Domain.CALM, Domain.FURY, Domain.ORDER)
+    decks = [start]
+    for _ in range(200):
+        parent = rng.choice(decks)
+        child = space.mutate(space.crossover(parent, rng.choice(decks), rng), rng, swaps=3)
+        space.check(child)
+        assert sum(count for _, count in child.runes) == 12
+        decks.append(child)
+    assert len(set(decks)) > 20
+
+
+def test_domain_constraint_rejects_off_domain_start():
+    with pytest.raises(ValueError, match="Stalwart Recruit"):
+        DeckSpace.around(DeckGenome.from_template(starter_deck()), domains=[Domain.FURY, Domain.CALM])
+
+
+def test_weak_deck_is_cut_after_screening():
+    evaluator = _Evaluator(
+        [Opponent("aggro"), Opponent("control")], "aggro",
+        games=20, screen_games=4, z=1.0, victory_score=8, seed=1,
+        workers=1, chunk_size=None, pool=None,
+    )
+    strong = _genome("20 Stalwart Recruit\nRunes:\n6 Calm\n6 Fury\n")
+    weak = _genome("20 Iron Shield\nRunes:\n6 Calm\n6 Fury\n")
+
+    evaluator.evaluate([strong])
+    assert evaluator.best == strong and evaluator.cache[strong].games == 40
+
+    assert evaluator.evaluate([weak, strong, weak]) == (1, 2, 1)
+    assert evaluator.cache[weak].games == 8 and not evaluator.cache[weak].complete
+    assert evaluator.games_saved == 32
+    assert evaluator.ranked([weak, strong, weak]) == [strong]
+    assert evaluator.ranked([weak]) == [strong]
+
+
+def test_optimizer_is_deterministic_across_workers():
+    kwargs = dict(generations=2, population=4, games=4, seed=7)
+    sequential = optimize_deck(starter_deck(), **kwargs)
+    parallel = optimize_deck(starter_deck(), workers=2, chunk_size=3, **kwargs)
+
+    assert parallel.best == sequential.best
+    assert parallel.best_score == sequential.best_score
+    assert [(h.best_score, h.evaluated, h.cache_hits) for h in parallel.history] == [
+        (h.best_score, h.evaluated, h.cache_hits) for h in sequential.history
+    ]
+    assert sequential.best_score >= sequential.start_score
+    assert sequential.evaluated + sequential.cache_hits == 1 + 2 * 4
+
+
+def test_parse_gauntlet(tmp_path):
+    path = tmp_path / "rush.txt"
+    path.write_text("20 Stalwart Recruit\nRunes:\n12 Order\n", encoding="utf-8")
+
+    aggro, rush = parse_gauntlet(f"aggro, control@{path}")
+    assert aggro.deck is None and rush.agent == "control" and rush.label == "control@rush"
+    with pytest.raises(ValueError):
+        parse_gauntlet("nobody")
+    with pytest.raises(ValueError):
+        parse_gauntlet(f"aggro@{tmp_path / 'missing.txt'}")
+    with pytest.raises(ValueError, match="cannot read"):
+        parse_gauntlet(f"aggro@{tmp_path}")
+    with pytest.raises(ValueError, match="missing"):
+        parse_gauntlet("aggro@")
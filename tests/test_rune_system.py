@@ -1,5 +1,8 @@
+import pytest
+
 from riftbound.core.cards import UnitCard
 from riftbound.core.enums import Domain
+from riftbound.core.journal import UndoJournal
 from riftbound.core.player import Player, RuneDeck, Rune
 
 
@@ -51,4 +54,52 @@ def test_unlock_runes_caps_at_twelve():
     player.unlock_runes(20)
 
     assert player.total_runes_in_play() == 12
-    assert len(player.rune_deck.runes) == len(runes) - 12
\ No newline at end of file
+    assert len(player.rune_deck.runes) == len(runes) - 12
+
+def test_channel_spends_domains_in_name_order_and_pays_by_counter():
+    player = Player(name="E")
+    for domain in (Domain.FURY, Domain.FURY, Domain.CALM, Domain.BODY):
+        player.add_rune(domain, ready=False)
+
+    player.channel()
+
+    # BODY and CALM come before FURY; every rune was readied first.
+    assert player.power_pool == {Domain.BODY: 1, Domain.CALM: 1}
+    assert [r.ready for r in player.rune_pool[Domain.FURY]] == [True, True]
+    assert [r.ready for r in player.rune_pool[Domain.CALM]] == [False]
+
+    assert player.pay_cost(0, Domain.CALM)
+    assert Domain.CALM not in player.rune_pool
+    assert [r.domain for r in player.rune_deck.runes] == [Domain.CALM]
+    assert player.total_runes_in_play() == 3
+
+
+def test_unlock_and_recycle_undo_restore_the_rune_deck():
+    runes = [Rune(domain=Domain.CALM), Rune(domain=Domain.FURY), Rune(domain=Domain.CALM)]
+    player = Player(name="F", rune_deck=RuneDeck(list(runes)))
+    player.journal = UndoJournal()
+
+    player.unlock_runes(2)
+    player.channel()
+    player.pay_cost(1, Domain.FURY)
+    player.journal.rollback(0)
+
+    assert list(player.rune_deck.runes) == runes
+    assert all(a is b for a, b in zip(player.rune_deck.runes, runes))
+    assert player.total_runes_in_play() == 0 and player.energy == 0 and not player.power_pool
+
+
+def test_rune_and_power_pools_reject_writes():
+    player = Player(name="G")
+    player.add_rune(Domain.CALM)
+    player.channel()
+
+    with pytest.raises(AttributeError):
+        player.rune_pool.setdefault(Domain.FURY, []).append(Rune(Domain.FURY))
+    with pytest.raises(TypeError):
+        player.rune_pool[Domain.FURY] = (Rune(Domain.FURY),)
+    with pytest.raises(AttributeError):
+        player.rune_pool[Domain.CALM].append(Rune(Domain.CALM))
+    with pytest.raises(TypeError):
+        player.power_pool[Domain.CALM] = 5
+    assert player.total_runes_in_play() == 1 and dict(player.power_pool) == {Domain.CALM: 1}
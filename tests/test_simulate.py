@@ -0,0 +1,38 @@
+from riftbound.simulate import MatchSettings, game_seeds, iter_games, shard_range
+
+
+def _summaries(outcomes):
+    return [
+        (o.index, o.seed, o.result.winner, o.result.turns, o.points_A, o.points_B)
+        for o in outcomes
+    ]
+
+
+def test_worker_pool_matches_sequential_run():
+    settings = MatchSettings(ai_a="control", ai_b="aggro")
+
+    sequential = _summaries(iter_games(24, seed=11, settings=settings))
+    parallel = _summaries(iter_games(24, seed=11, settings=settings, workers=2, chunk_size=5))
+
+    assert parallel == sequential
+    assert [row[0] for row in parallel] == list(range(24))
+
+
+def test_shards_cover_the_full_run():
+    full = _summaries(iter_games(10, seed=5))
+    sharded = []
+    for k in (1, 2, 3):
+        start, stop = shard_range(10, k, 3)
+        sharded += _summaries(iter_games(10, seed=5, start=start, stop=stop))
+
+    assert sharded == full
+
+
+def test_iter_games_is_lazy():
+    outcomes = iter_games(10_000_000, seed=3)
+    first = next(outcomes)
+    outcomes.close()
+
+    assert first.index == 0
+    assert first.seed == next(game_seeds(3, 0, 1))[1]
+    assert first.result.winner in {"A", "B", "DRAW"}
@@ -0,0 +1,81 @@
+import pickle
+
+from riftbound.core.cards import UnitCard
+from riftbound.core.combat import UnitInPlay
+from riftbound.core.loop import EffectContext, GameLoop
+from riftbound.simulate import MatchSettings, build_game
+
+
+def _midgame(seed=4, turns=8):
+    gs = build_game(seed, MatchSettings(ai_a="control", ai_b="aggro"))
+    gs.max_turns = turns
+    GameLoop(gs).start()
+    gs.max_turns = 40
+    return gs
+
+
+def test_clone_continues_exactly_like_the_original():
+    gs = _midgame()
+    copy_ = gs.clone()
+
+    original = GameLoop(gs).start()
+    cloned = GameLoop(copy_).start()
+
+    assert cloned == original
+    assert (copy_.points_A, copy_.points_B) == (gs.points_A, gs.points_B)
+    assert copy_.rng.random() == gs.rng.random()
+
+
+def test_clone_is_independent_but_shares_cards():
+    gs = _midgame()
+    copy_ = gs.clone()
+
+    assert copy_.A.agent.player is copy_.A
+    assert copy_.A.battlefields is copy_.battlefields
+    assert copy_.A.hand == gs.A.hand
+    assert all(a is b for a, b in zip(copy_.A.hand, gs.A.hand))
+
+    copy_.A.hand.clear()
+    copy_.A.energy += 5
+    copy_.points_B += 3
+    copy_.battlefields[0].add_unit("A", UnitInPlay(UnitCard(name="Extra", might=1)))
+    # rune_pool is a read-only view, so exhaust through the counters themselves.
+    for slot, ready in enumerate(copy_.A.runes_ready):
+        copy_.A.runes_exhausted[slot] += ready
+        copy_.A.runes_ready[slot] = 0
+    copy_.A.power[0] += 1
+
+    fresh = _midgame()
+    assert len(gs.A.hand) == len(fresh.A.hand)
+    assert gs.A.energy == fresh.A.energy
+    assert gs.points_B == fresh.points_B
+    assert len(gs.battlefields[0].units_A) == len(fresh.battlefields[0].units_A)
+    assert any(gs.A.runes_ready)
+    assert gs.A.runes_ready == fresh.A.runes_ready
+    assert gs.A.runes_exhausted == fresh.A.runes_exhausted
+    assert gs.A.power == fresh.A.power
+
+
+def test_buffs_on_a_clone_do_not_leak_into_shared_cards():
+    gs = _midgame()
+    gs.battlefields[1].add_unit("A", UnitInPlay(UnitCard(name="Buffed", might=1)))
+    copy_ = gs.clone()
+    card = copy_.battlefields[1].units_A[-1].card
+    ctx = EffectContext(GameLoop(copy_), card, copy_.A, copy_.B, copy_.battlefields[1])
+
+    ctx.grant_might(2)
+
+    assert copy_.battlefields[1].units_A[-1].might == 3
+    assert gs.battlefields[1].units_A[-1].might == 1
+
+
+def test_runtime_objects_are_slotted_and_still_pickle():
+    gs = _midgame()
+    lane = next(bf for bf in gs.battlefields if bf.units_A or bf.units_B)
+    unit = (lane.units_A or lane.units_B)[0]
+    for obj in (gs, gs.A, gs.A.deck, gs.A.rune_deck, lane, unit):
+        assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    restored = pickle.loads(pickle.dumps(gs.clone()))
+
+    assert GameLoop(restored).start() == GameLoop(gs).start()
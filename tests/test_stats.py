@@ -0,0 +1,46 @@
+import pytest
+
+from riftbound.core.loop import Result
+from riftbound.stats import SPRT, MatchTally, StoppingRule, wilson_interval, z_score
+
+
+def test_tally_counts_winners_and_turns():
+    tally = MatchTally()
+    tally.add(Result("A", 10, 0, 0))
+    tally.add(Result("B", 12, 0, 0))
+    tally.add(Result("DRAW", 40, 0, 0))
+
+    assert (tally.games, tally.wins_A, tally.wins_B, tally.draws) == (3, 1, 1, 1)
+    assert tally.score_A == pytest.approx(0.5)
+    assert tally.avg_turns == pytest.approx(62 / 3)
+
+
+def test_wilson_interval_brackets_estimate():
+    low, high = wilson_interval(550, 1000, z_score(0.95))
+
+    assert low < 0.55 < high
+    assert high - low == pytest.approx(0.0616, abs=1e-3)
+
+
+def test_sprt_decides_in_both_directions():
+    test = SPRT(0.5, 0.55)
+
+    assert test.decide(10, 10) is None
+    assert test.decide(700, 300) == "H1"
+    assert test.decide(300, 700) == "H0"
+
+
+def test_sprt_rejects_degenerate_hypotheses():
+    with pytest.raises(ValueError):
+        SPRT(0.5, 0.5)
+    with pytest.raises(ValueError, match="p0 < p1"):
+        SPRT(0.55, 0.5)
+
+
+def test_stopping_rule_waits_for_min_games_and_width():
+    rule = StoppingRule(ci_width=0.1, min_games=50)
+    tally = MatchTally(games=40, wins_A=20, wins_B=20)
+    assert rule.check(tally) is None
+
+    tally = MatchTally(games=400, wins_A=200, wins_B=200)
+    assert rule.check(tally) is not None
@@ -0,0 +1,46 @@
+import pytest
+
+from riftbound.stats import elo_ratings
+from riftbound.tournament import default_agents, run_tournament
+
+
+def _tallies(report):
+    return {
+        pairing: (t.games, t.wins_A, t.wins_B, t.draws, t.turns_total)
+        for pairing, t in report.pairings.items()
+    }
+
+
+def test_default_agents_skip_aliases():
+    assert default_agents() == ["aggro", "control"]
+
+
+def test_tournament_covers_both_seat_orders():
+    report = run_tournament(["aggro", "control"], games=6, seed=3)
+
+    assert set(report.pairings) == {("aggro", "control"), ("control", "aggro")}
+    points, games = report.head_to_head("aggro", "control")
+    rival_points, rival_games = report.head_to_head("control", "aggro")
+    assert games == rival_games == 12
+    assert points + rival_points == pytest.approx(12)
+
+
+def test_tournament_pool_matches_sequential():
+    sequential = run_tournament(["aggro", "control", "jynx"], games=4, seed=9)
+    parallel = run_tournament(["aggro", "control", "jynx"], games=4, seed=9, workers=2, chunk_size=3)
+
+    assert _tallies(parallel) == _tallies(sequential)
+
+
+def test_elo_ratings_order_and_symmetry():
+    ratings = elo_ratings(["x", "y"], {("x", "y"): (75.0, 100)})
+
+    assert ratings["x"] > ratings["y"]
+    assert ratings["x"] + ratings["y"] == pytest.approx(3000.0)
+    # 75% expected score is roughly a 190-point Elo gap.
+    assert ratings["x"] - ratings["y"] == pytest.approx(190, abs=5)
+
+
+def test_tournament_rejects_duplicate_agents():
+    with pytest.raises(ValueError):
+        run_tournament(["aggro", "Aggro"], games=1)
@@ -0,0 +1,85 @@
+from riftbound.core.cards import UnitCard
+from riftbound.core.combat import UnitInPlay
+from riftbound.core.loop import GameLoop
+from riftbound.simulate import MatchSettings, build_game, run_game
+
+
+def _units(units):
+    return tuple((id(u), id(u.card), u.card.might, u.damage, u.ready) for u in units)
+
+
+def _fingerprint(loop):
+    gs = loop.gs
+    players = []
+    for p in (gs.A, gs.B):
+        players.append((
+            tuple(map(id, p.hand)),
+            tuple(map(id, p.deck.cards)),
+            p.energy,
+            tuple((id(r), r.domain, r.ready) for r in p.rune_deck.runes),
+            tuple(p.runes_ready),
+            tuple(p.runes_exhausted),
+            tuple(p.power),
+            _units(p.base_units),
+        ))
+    lanes = tuple(
+        (_units(bf.units_A), _units(bf.units_B), bf.contested_this_turn, bf.scored_this_turn_A,
+         bf.scored_this_turn_B, bf.last_controller, bf.showdown_pending,
+         bf.kills_A, bf.kills_B, bf.deaths_A, bf.deaths_B)
+        for bf in gs.battlefields
+    )
+    return (tuple(players), lanes, gs.points_A, gs.points_B, gs.active, gs.turn,
+            loop.units_played, loop.spells_cast)
+
+
+def _candidate_actions(loop):
+    hand = loop.gs.get_player(loop.gs.active).hand
+    lanes = range(len(loop.gs.battlefields))
+    actions = [("PASS", None, None)]
+    for idx in range(len(hand)):
+        for lane in lanes:
+            actions += [("UNIT", idx, lane), ("SPELL", idx, lane)]
+    for src in range(len(loop.gs.battlefields) + 1):
+        for dst in range(len(loop.gs.battlefields) + 1):
+            actions.append(("MOVE", None, src, dst))
+    return actions
+
+
+def test_every_action_and_turn_step_can_be_undone():
+    gs = build_game(9, MatchSettings(ai_a="control", ai_b="aggro"))
+    loop = GameLoop(gs)
+    journal = loop.enable_journal()
+    loop.setup()
+    gs.A.base_units.append(UnitInPlay(UnitCard(name="Reserve", might=1), ready=True))
+    journal.clear()
+
+    while gs.turn <= gs.max_turns:
+        if loop.begin_turn():
+            break
+        before = _fingerprint(loop)
+        for action in _candidate_actions(loop):
+            mark = loop.apply(action)
+            if not loop.end_turn():
+                loop.begin_turn()
+            loop.undo(mark)
+            assert _fingerprint(loop) == before, action
+
+        ap = gs.get_player(gs.active)
+        loop.apply(ap.agent.decide_action(gs.get_player(gs.other(gs.active))))
+        if loop.end_turn():
+            break
+
+    assert journal.mark() > 0
+    loop.undo(0)
+    assert gs.turn == 1 and gs.points_A == gs.points_B == 0
+
+
+def test_journaled_game_matches_plain_game():
+    settings = MatchSettings(ai_a="aggro", ai_b="control")
+    expected = run_game(0, 123, settings).result
+
+    gs = build_game(123, settings)
+    loop = GameLoop(gs)
+    loop.enable_journal()
+
+    assert loop.start() == expected
@@ -0,0 +1,111 @@
+import pytest
+
+from riftbound.core.enums import Domain
+from riftbound.core.loop import GameLoop
+from riftbound.core.player import Rune, RuneDeck
+from riftbound.core.zobrist import ZobristMismatch, compute_hash, feature_key
+from riftbound.simulate import MatchSettings, build_game
+
+
+def _loop(seed=5, settings=MatchSettings(ai_a="control", ai_b="aggro")):
+    return GameLoop(build_game(seed, settings))
+
+
+def _turn_actions(loop):
+    hand = loop.gs.get_player(loop.gs.active).hand
+    actions = [("PASS", None, None)]
+    for idx in range(len(hand)):
+        actions += [("UNIT", idx, 0), ("SPELL", idx, 1)]
+    return actions
+
+
+@pytest.mark.parametrize("seed", [1, 5, 17])
+def test_incremental_hash_tracks_a_full_game(seed):
+    loop = _loop(seed)
+    hasher = loop.enable_hashing(debug=True)
+    loop.setup()
+    gs = loop.gs
+    seen = {hasher.value}
+
+    while gs.turn <= gs.max_turns:
+        if loop.begin_turn():
+            break
+        hasher.verify()
+        ap = gs.get_player(gs.active)
+        loop._apply_action(ap, ap.agent.decide_action(gs.get_player(gs.other(gs.active))))
+        hasher.verify()
+        if loop.end_turn():
+            break
+        seen.add(hasher.value)
+
+    assert hasher.value == compute_hash(gs)
+    assert len(seen) > gs.turn // 2
+
+
+def test_hash_components_follow_seats_not_names():
+    loop = _loop()
+    loop.gs.A.name = loop.gs.B.name = "Mirror"
+    hasher = loop.enable_hashing(debug=True)
+    loop.setup()
+
+    assert ("hand", "A") in hasher.components and ("hand", "B") in hasher.components
+    loop.begin_turn()
+    hasher.verify()
+
+
+def test_undo_restores_the_hash():
+    loop = _loop()
+    loop.enable_journal()
+    hasher = loop.enable_hashing(debug=True)
+    loop.setup()
+    for _ in range(6):
+        loop.begin_turn()
+        before = hasher.value
+        for action in _turn_actions(loop):
+            mark = loop.apply(action)
+            loop.end_turn()
+            loop.undo(mark)
+            assert hasher.value == before
+        loop.apply(("UNIT", 0, 0))
+        loop.end_turn()
+
+
+def test_equal_positions_hash_equal():
+    loop = _loop()
+    loop.setup()
+    copy_loop = GameLoop(loop.gs.clone())
+
+    assert loop.enable_hashing().value == copy_loop.enable_hashing().value
+
+    loop.begin_turn()
+    assert loop.zobrist.value != copy_loop.zobrist.value
+    copy_loop.begin_turn()
+    assert loop.zobrist.value == copy_loop.zobrist.value
+
+
+def test_debug_mode_detects_untracked_changes():
+    loop = _loop()
+    hasher = loop.enable_hashing(debug=True)
+    loop.setup()
+    loop.gs.B.energy += 3
+
+    with pytest.raises(ZobristMismatch, match="energy"):
+        hasher.value
+
+
+def test_rune_deck_hash_is_incremental_and_order_sensitive():
+    loop = _loop()
+    player = loop.gs.A
+    player.rune_deck = RuneDeck([Rune(Domain.CALM), Rune(Domain.FURY), Rune(Domain.CALM)])
+    hasher = loop.enable_hashing(debug=True)
+
+    player.unlock_runes(2)
+    hasher.verify()
+    assert player.recycle_rune(Domain.FURY) and player.recycle_rune(Domain.CALM)
+    hasher.verify()
+    assert [r.domain for r in player.rune_deck.runes] == [Domain.CALM, Domain.FURY, Domain.CALM]
+
+    before = hasher.value
+    player.rune_deck.runes.rotate(1)
+    assert compute_hash(loop.gs) != before
+    assert feature_key.cache_info().maxsize is not None